@@ -1,5 +1,7 @@
 from .bubble_sort import fnBubbleSort as bubble_sort
+from .bubble_sort import fnBubbleSortStream as bubble_sort_stream
 from .selection_sort import fnSelectionSort as selection_sort
+from .selection_sort import fnSelectionSortStream as selection_sort_stream
 from .linear_search import fnLinearSearch as linear_search
 from .knapsack_problem import fnKnapsackBruteForce as knapsack_problem
 from .travelling_salesman import fnTSPBruteForce as travelling_salesman
@@ -1,53 +1,99 @@
+from ..step_trace import SortTrace, fnTraceSort, fnStreamSort, fnDirectionalPasses
+
+
 #fn_bubble_sort is a function that takes a list as a parameter
-def fnBubbleSort(arrInput: list, boolAscending: bool = True) -> tuple[list, list]:
+def fnBubbleSort(arrInput: list, boolAscending: bool = True, fnKey=None, boolCaseFold: bool = False,
+                 boolLocale: bool = False) -> tuple[list, SortTrace]:
     """
     Description:
-        The simplest sorting algorithm that works by repeatedly 
+        The simplest sorting algorithm that works by repeatedly
         swapping the adjacent elements if they are in the wrong order.
 
     Parameters:
         arrInput (list): The array to be sorted, can contain numbers or strings
         boolAscending (bool): Sort in ascending order if True, descending if False
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively
+        boolLocale (bool): Compare strings using the current locale's collation rules
 
-    Returns: 
+    Returns:
         tuple: A tuple containing:
             - list: The sorted array
-            - list: List of steps showing the array state after each iteration
+            - SortTrace: Sequence of steps showing the array state after each iteration
 
     References:
         https://www.geeksforgeeks.org/bubble-sort-algorithm/
     """
-    
-    intSize: int = len(arrInput)
-    arrSteps: list = []
-    arrResult: list = arrInput.copy()
-
-    if boolAscending:
-        for i in range(intSize):
-            boolSwapped: bool = False
-            for j in range(0, intSize - i - 1):
-                if arrResult[j] > arrResult[j + 1]:
-                    arrResult[j], arrResult[j + 1] = arrResult[j + 1], arrResult[j]
-                    boolSwapped = True
-            
-            if boolSwapped:
-                arrSteps.append(arrResult.copy())
-            
-            if not boolSwapped:
-                break
-    else:
-        for i in range(intSize):
-            boolSwapped: bool = False
-            for j in range(0, intSize - i - 1):
-                if arrResult[j] < arrResult[j + 1]:
-                    arrResult[j], arrResult[j + 1] = arrResult[j + 1], arrResult[j]
-                    boolSwapped = True
-            
-            if boolSwapped:
-                arrSteps.append(arrResult.copy())
-            
-            if not boolSwapped:
-                break
-
-    return arrResult, arrSteps
+    return fnTraceSort(_fnBubbleSortPasses, arrInput.copy(), boolAscending, fnKey, boolCaseFold, boolLocale)
+
+
+def fnBubbleSortStream(arrInput: list, boolAscending: bool = True, intMaxSteps: int = None, fnKey=None,
+                       boolCaseFold: bool = False, boolLocale: bool = False):
+    """
+    Description:
+        Streaming variant of fnBubbleSort that yields the array state after
+        each pass as soon as it happens instead of building the whole trace.
+
+    Parameters:
+        arrInput (list): The array to be sorted, can contain numbers or strings
+        boolAscending (bool): Sort in ascending order if True, descending if False
+        intMaxSteps (int, optional): Maximum number of steps to yield. Defaults to no limit.
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively
+        boolLocale (bool): Compare strings using the current locale's collation rules
+
+    Returns:
+        generator: Yields each step as a list and returns the sorted array
+    """
+    return fnStreamSort(_fnBubbleSortPasses, arrInput.copy(), boolAscending, intMaxSteps, fnKey, boolCaseFold, boolLocale)
+
+
+def _fnBubbleSortAscending(arrResult: list, fnSwap):
+    """
+    Description:
+        Ascending bubble sort kernel. Sorts arrResult in place, reports every
+        swap through fnSwap and yields at the end of every pass that swapped
+        something.
+    """
+    intSize: int = len(arrResult)
+
+    for i in range(intSize):
+        boolSwapped: bool = False
+        for j in range(0, intSize - i - 1):
+            if arrResult[j] > arrResult[j + 1]:
+                arrResult[j], arrResult[j + 1] = arrResult[j + 1], arrResult[j]
+                fnSwap(j, j + 1)
+                boolSwapped = True
+
+        if boolSwapped:
+            yield
+
+        if not boolSwapped:
+            break
+
+
+def _fnBubbleSortDescending(arrResult: list, fnSwap):
+    """
+    Description:
+        Descending bubble sort kernel. Sorts arrResult in place, reports every
+        swap through fnSwap and yields at the end of every pass that swapped
+        something.
+    """
+    intSize: int = len(arrResult)
+
+    for i in range(intSize):
+        boolSwapped: bool = False
+        for j in range(0, intSize - i - 1):
+            if arrResult[j] < arrResult[j + 1]:
+                arrResult[j], arrResult[j + 1] = arrResult[j + 1], arrResult[j]
+                fnSwap(j, j + 1)
+                boolSwapped = True
+
+        if boolSwapped:
+            yield
+
+        if not boolSwapped:
+            break
+
 
+_fnBubbleSortPasses = fnDirectionalPasses(_fnBubbleSortAscending, _fnBubbleSortDescending)
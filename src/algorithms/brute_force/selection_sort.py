@@ -1,38 +1,92 @@
-def fnSelectionSort(arrInput: list, boolAscending: bool = True) -> tuple[list, list]:
+from ..step_trace import SortTrace, fnTraceSort, fnStreamSort, fnDirectionalPasses
+
+
+def fnSelectionSort(arrInput: list, boolAscending: bool = True, fnKey=None, boolCaseFold: bool = True,
+                    boolLocale: bool = False) -> tuple[list, SortTrace]:
     """
     Description:
-        Selection Sort algorithm that finds the minimum/maximum element 
+        Selection Sort algorithm that finds the minimum/maximum element
         in the unsorted portion and places it at the beginning.
 
     Parameters:
         arrInput (list): The array to be sorted, can contain numbers or strings
         boolAscending (bool): Sort in ascending order if True, descending if False
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively (the default for selection sort)
+        boolLocale (bool): Compare strings using the current locale's collation rules
 
     Returns:
         tuple: A tuple containing:
             - list: The sorted array
-            - list: List of steps showing the array state after each iteration
+            - SortTrace: Sequence of steps showing the array state after each iteration
 
     References:
         https://www.geeksforgeeks.org/selection-sort/
     """
-    intSize: int = len(arrInput)
-    arrResult: list = arrInput.copy()
-    arrSteps: list = []
+    return fnTraceSort(_fnSelectionSortPasses, arrInput.copy(), boolAscending, fnKey, boolCaseFold, boolLocale)
+
+
+def fnSelectionSortStream(arrInput: list, boolAscending: bool = True, intMaxSteps: int = None, fnKey=None,
+                          boolCaseFold: bool = True, boolLocale: bool = False):
+    """
+    Description:
+        Streaming variant of fnSelectionSort that yields the array state after
+        each placement as soon as it happens instead of building the whole trace.
+
+    Parameters:
+        arrInput (list): The array to be sorted, can contain numbers or strings
+        boolAscending (bool): Sort in ascending order if True, descending if False
+        intMaxSteps (int, optional): Maximum number of steps to yield. Defaults to no limit.
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively (the default for selection sort)
+        boolLocale (bool): Compare strings using the current locale's collation rules
+
+    Returns:
+        generator: Yields each step as a list and returns the sorted array
+    """
+    return fnStreamSort(_fnSelectionSortPasses, arrInput.copy(), boolAscending, intMaxSteps, fnKey, boolCaseFold, boolLocale)
+
+
+def _fnSelectionSortAscending(arrResult: list, fnSwap):
+    """
+    Description:
+        Ascending selection sort kernel. Sorts arrResult (the precomputed keys)
+        in place, reports every swap through fnSwap and yields after every
+        placement that moved an element.
+    """
+    intSize: int = len(arrResult)
 
     for i in range(intSize):
         intMinIndex: int = i
         for j in range(i + 1, intSize):
-            varCurrent = arrResult[j].lower() if isinstance(arrResult[j], str) else arrResult[j]
-            varMin = arrResult[intMinIndex].lower() if isinstance(arrResult[intMinIndex], str) else arrResult[intMinIndex]
-
-            if (varCurrent < varMin and boolAscending) or (varCurrent > varMin and not boolAscending):
+            if arrResult[j] < arrResult[intMinIndex]:
                 intMinIndex = j
 
         if intMinIndex != i:
             arrResult[i], arrResult[intMinIndex] = arrResult[intMinIndex], arrResult[i]
-            arrSteps.append(arrResult.copy())
+            fnSwap(i, intMinIndex)
+            yield
+
+
+def _fnSelectionSortDescending(arrResult: list, fnSwap):
+    """
+    Description:
+        Descending selection sort kernel. Sorts arrResult (the precomputed keys)
+        in place, reports every swap through fnSwap and yields after every
+        placement that moved an element.
+    """
+    intSize: int = len(arrResult)
 
-    return arrResult, arrSteps
+    for i in range(intSize):
+        intMinIndex: int = i
+        for j in range(i + 1, intSize):
+            if arrResult[j] > arrResult[intMinIndex]:
+                intMinIndex = j
+
+        if intMinIndex != i:
+            arrResult[i], arrResult[intMinIndex] = arrResult[intMinIndex], arrResult[i]
+            fnSwap(i, intMinIndex)
+            yield
 
 
+_fnSelectionSortPasses = fnDirectionalPasses(_fnSelectionSortAscending, _fnSelectionSortDescending)
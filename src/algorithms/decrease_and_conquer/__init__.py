@@ -0,0 +1,4 @@
+from .binary_search import fnBinarySearch, fnLowerBound
+from .exponential_search import fnExponentialSearch
+from .interpolation_search import fnInterpolationSearch
+from .quickselect import fnQuickSelect, fnMedianOfMedians
@@ -0,0 +1,49 @@
+def fnBinarySearch(arrInput: list, varTarget: any) -> int:
+    """
+    Description:
+        Searches a sorted array by repeatedly halving the range that can still
+        contain the target, comparing the target with the middle element.
+        Needs O(log n) comparisons instead of the O(n) of a sequential search.
+        Returns the first occurrence when the target appears more than once.
+
+    Parameters:
+        arrInput (list): The array to search in, sorted in ascending order
+        varTarget (any): The target element to search for
+
+    Returns:
+        int: Index of the first occurrence of varTarget if found, -1 otherwise
+
+    References:
+        https://www.geeksforgeeks.org/binary-search/
+    """
+    intIndex: int = fnLowerBound(arrInput, varTarget)
+    if intIndex < len(arrInput) and arrInput[intIndex] == varTarget:
+        return intIndex
+    return -1
+
+
+def fnLowerBound(arrInput: list, varTarget: any, intLow: int = 0, intHigh: int = None) -> int:
+    """
+    Description:
+        Finds the first position in arrInput[intLow:intHigh] whose element is
+        not smaller than varTarget, by binary search.
+
+    Parameters:
+        arrInput (list): The array to search in, sorted in ascending order
+        varTarget (any): The value to locate
+        intLow (int): First index of the range to search
+        intHigh (int, optional): End of the range to search (exclusive). Defaults to len(arrInput).
+
+    Returns:
+        int: The first index i in the range with arrInput[i] >= varTarget, or intHigh if there is none
+    """
+    if intHigh is None:
+        intHigh = len(arrInput)
+
+    while intLow < intHigh:
+        intMid: int = (intLow + intHigh) // 2
+        if arrInput[intMid] < varTarget:
+            intLow = intMid + 1
+        else:
+            intHigh = intMid
+    return intLow
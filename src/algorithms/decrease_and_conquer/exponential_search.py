@@ -0,0 +1,34 @@
+from .binary_search import fnLowerBound
+
+
+def fnExponentialSearch(arrInput: list, varTarget: any) -> int:
+    """
+    Description:
+        Exponential (galloping) search over a sorted array. The probe position
+        doubles (1, 2, 4, 8, ...) until it passes the target, then a binary
+        search runs inside the last doubling step. Takes O(log i) comparisons
+        for a target at index i, so targets near the front are found faster
+        than with a plain binary search.
+
+    Parameters:
+        arrInput (list): The array to search in, sorted in ascending order
+        varTarget (any): The target element to search for
+
+    Returns:
+        int: Index of the first occurrence of varTarget if found, -1 otherwise
+
+    References:
+        https://www.geeksforgeeks.org/exponential-search/
+    """
+    intSize: int = len(arrInput)
+    if intSize == 0:
+        return -1
+
+    intBound: int = 1
+    while intBound < intSize and arrInput[intBound] < varTarget:
+        intBound *= 2
+
+    intIndex: int = fnLowerBound(arrInput, varTarget, intBound // 2, min(intBound + 1, intSize))
+    if intIndex < intSize and arrInput[intIndex] == varTarget:
+        return intIndex
+    return -1
@@ -0,0 +1,55 @@
+from .binary_search import fnLowerBound
+
+
+def fnInterpolationSearch(arrInput: list, varTarget: any) -> int:
+    """
+    Description:
+        Interpolation search over a sorted array. Instead of probing the
+        middle, it estimates where the target should be from its value
+        relative to the ends of the remaining range, which takes
+        O(log log n) probes on evenly distributed numbers. Strings and other
+        values that cannot be interpolated are probed at the middle, like a
+        binary search.
+
+    Parameters:
+        arrInput (list): The array to search in, sorted in ascending order
+        varTarget (any): The target element to search for
+
+    Returns:
+        int: Index of the first occurrence of varTarget if found, -1 otherwise
+
+    References:
+        https://www.geeksforgeeks.org/interpolation-search/
+    """
+    intLow: int = 0
+    intHigh: int = len(arrInput) - 1
+    boolNumeric: bool = _fnIsNumber(varTarget)
+
+    while intLow <= intHigh and arrInput[intLow] <= varTarget <= arrInput[intHigh]:
+        varLowValue = arrInput[intLow]
+        varHighValue = arrInput[intHigh]
+
+        if varLowValue == varHighValue:
+            intProbe: int = intLow
+        elif boolNumeric and _fnIsNumber(varLowValue) and _fnIsNumber(varHighValue):
+            intProbe = intLow + int((varTarget - varLowValue) * (intHigh - intLow) / (varHighValue - varLowValue))
+        else:
+            intProbe = (intLow + intHigh) // 2
+
+        if arrInput[intProbe] < varTarget:
+            intLow = intProbe + 1
+        elif varTarget < arrInput[intProbe]:
+            intHigh = intProbe - 1
+        else:
+            # Everything before intLow is smaller, so the first occurrence is in [intLow, intProbe]
+            return fnLowerBound(arrInput, varTarget, intLow, intProbe)
+
+    return -1
+
+
+def _fnIsNumber(varValue: any) -> bool:
+    """
+    Description:
+        Checks whether a value supports the arithmetic needed to interpolate.
+    """
+    return isinstance(varValue, (int, float)) and not isinstance(varValue, bool)
@@ -0,0 +1,94 @@
+INT_GROUP_SIZE: int = 5
+
+
+def fnQuickSelect(arrInput: list, intK: int) -> int:
+    """
+    Description:
+        Finds the k-th smallest element without sorting the whole array.
+        Quickselect partitions the elements around a median-of-three pivot
+        into smaller, equal and larger groups, and keeps only the group that
+        contains the k-th element, so it takes O(n) time on average. The input
+        is not modified.
+
+    Parameters:
+        arrInput (list): The array to select from, can contain any comparable type
+        intK (int): Rank of the element to find, 1 for the smallest
+
+    Returns:
+        int: Index of the first occurrence of the k-th smallest element, -1 if intK is out of range
+
+    References:
+        https://www.geeksforgeeks.org/quickselect-algorithm/
+    """
+    if not 1 <= intK <= len(arrInput):
+        return -1
+    return arrInput.index(_fnSelect(list(arrInput), intK - 1, _fnMedianOfThree))
+
+
+def fnMedianOfMedians(arrInput: list, intK: int) -> int:
+    """
+    Description:
+        Finds the k-th smallest element in guaranteed O(n) time. Works like
+        fnQuickSelect, but the pivot is the median of the medians of groups of
+        five elements, which always discards at least 30% of the remaining
+        elements per round. The input is not modified.
+
+    Parameters:
+        arrInput (list): The array to select from, can contain any comparable type
+        intK (int): Rank of the element to find, 1 for the smallest
+
+    Returns:
+        int: Index of the first occurrence of the k-th smallest element, -1 if intK is out of range
+
+    References:
+        https://en.wikipedia.org/wiki/Median_of_medians
+    """
+    if not 1 <= intK <= len(arrInput):
+        return -1
+    return arrInput.index(_fnSelect(list(arrInput), intK - 1, _fnPivotOfMedians))
+
+
+def _fnSelect(arrValues: list, intRank: int, fnPivot) -> any:
+    """
+    Description:
+        Returns the element of rank intRank (0-based) of arrValues, using a
+        three-way partition around the pivot chosen by fnPivot so runs of
+        equal elements are settled in a single round.
+    """
+    while True:
+        if len(arrValues) <= INT_GROUP_SIZE:
+            return sorted(arrValues)[intRank]
+
+        varPivot = fnPivot(arrValues)
+        arrSmaller: list = [varValue for varValue in arrValues if varValue < varPivot]
+        if intRank < len(arrSmaller):
+            arrValues = arrSmaller
+            continue
+
+        intEqual: int = sum(1 for varValue in arrValues if varValue == varPivot)
+        if intRank < len(arrSmaller) + intEqual:
+            return varPivot
+
+        intRank -= len(arrSmaller) + intEqual
+        arrValues = [varValue for varValue in arrValues if varPivot < varValue]
+
+
+def _fnMedianOfThree(arrValues: list) -> any:
+    """
+    Description:
+        Median of the first, middle and last elements.
+    """
+    return sorted((arrValues[0], arrValues[len(arrValues) // 2], arrValues[-1]))[1]
+
+
+def _fnPivotOfMedians(arrValues: list) -> any:
+    """
+    Description:
+        Median of the medians of consecutive groups of INT_GROUP_SIZE elements,
+        found recursively with _fnSelect.
+    """
+    arrMedians: list = []
+    for intStart in range(0, len(arrValues), INT_GROUP_SIZE):
+        arrGroup: list = sorted(arrValues[intStart:intStart + INT_GROUP_SIZE])
+        arrMedians.append(arrGroup[len(arrGroup) // 2])
+    return _fnSelect(arrMedians, len(arrMedians) // 2, _fnPivotOfMedians)
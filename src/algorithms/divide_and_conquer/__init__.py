@@ -0,0 +1,2 @@
+from .merge_sort import fnMergeSort, fnMergeSortStream
+from .introsort import fnIntrosort, fnIntrosortStream
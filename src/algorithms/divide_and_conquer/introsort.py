@@ -0,0 +1,291 @@
+from ..step_trace import SortTrace, fnTraceSort, fnStreamSort
+
+# Slices up to this size are finished with insertion sort
+INT_INSERTION_THRESHOLD: int = 16
+
+
+def fnIntrosort(arrInput: list, boolAscending: bool = True, fnKey=None, boolCaseFold: bool = False,
+                boolLocale: bool = False) -> tuple[list, SortTrace]:
+    """
+    Description:
+        Introspective Sort. Quicksort with a median-of-three pivot does most
+        of the work, small slices are finished with insertion sort, and any
+        slice that is still being partitioned after 2·log2(n) levels is
+        handed to heapsort instead, so the O(n²) worst case of quicksort is
+        never reached and the sort always runs in O(n log n). Pending slices
+        are kept on an explicit stack, smaller slice on top, so the stack
+        stays O(log n) deep.
+
+    Parameters:
+        arrInput (list): The array to be sorted, can contain numbers or strings
+        boolAscending (bool): Sort in ascending order if True, descending if False
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively
+        boolLocale (bool): Compare strings using the current locale's collation rules
+
+    Returns:
+        tuple: A tuple containing:
+            - list: The sorted array
+            - SortTrace: Sequence of steps showing the array state after each partition,
+                         insertion sort and heap extraction
+
+    References:
+        https://en.wikipedia.org/wiki/Introsort
+    """
+    return fnTraceSort(_fnIntrosortPasses, arrInput.copy(), boolAscending, fnKey, boolCaseFold, boolLocale)
+
+
+def fnIntrosortStream(arrInput: list, boolAscending: bool = True, intMaxSteps: int = None, fnKey=None,
+                      boolCaseFold: bool = False, boolLocale: bool = False):
+    """
+    Description:
+        Streaming variant of fnIntrosort that yields the array state after
+        each step as soon as it happens instead of building the whole trace.
+
+    Parameters:
+        arrInput (list): The array to be sorted, can contain numbers or strings
+        boolAscending (bool): Sort in ascending order if True, descending if False
+        intMaxSteps (int, optional): Maximum number of steps to yield. Defaults to no limit.
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively
+        boolLocale (bool): Compare strings using the current locale's collation rules
+
+    Returns:
+        generator: Yields each step as a list and returns the sorted array
+    """
+    return fnStreamSort(_fnIntrosortPasses, arrInput.copy(), boolAscending, intMaxSteps, fnKey, boolCaseFold, boolLocale)
+
+
+def _fnIntrosortPasses(arrKeys: list, boolAscending: bool, fnSwap):
+    """
+    Description:
+        Introsort core. Picks the direction-specialized partition, insertion
+        sort and heapsort kernels once, then sorts arrKeys in place, reports
+        every swap through fnSwap and yields after every step.
+    """
+    if boolAscending:
+        fnPartition, fnInsertionSort, fnHeapSort = _fnPartitionAscending, _fnInsertionSortAscending, _fnHeapSortAscending
+    else:
+        fnPartition, fnInsertionSort, fnHeapSort = _fnPartitionDescending, _fnInsertionSortDescending, _fnHeapSortDescending
+
+    intSize: int = len(arrKeys)
+    if intSize < 2:
+        return
+
+    arrStack: list = [(0, intSize - 1, 2 * (intSize.bit_length() - 1))]
+    while arrStack:
+        intLow, intHigh, intDepth = arrStack.pop()
+
+        if intHigh - intLow + 1 <= INT_INSERTION_THRESHOLD:
+            if fnInsertionSort(arrKeys, intLow, intHigh, fnSwap):
+                yield
+            continue
+
+        if intDepth == 0:
+            yield from fnHeapSort(arrKeys, intLow, intHigh, fnSwap)
+            continue
+
+        intPivot: int = fnPartition(arrKeys, intLow, intHigh, fnSwap)
+        yield
+
+        # Push the larger side first so the smaller one is sorted next
+        if intPivot - intLow < intHigh - intPivot:
+            arrStack.append((intPivot + 1, intHigh, intDepth - 1))
+            arrStack.append((intLow, intPivot - 1, intDepth - 1))
+        else:
+            arrStack.append((intLow, intPivot - 1, intDepth - 1))
+            arrStack.append((intPivot + 1, intHigh, intDepth - 1))
+
+
+def _fnPartitionAscending(arrKeys: list, intLow: int, intHigh: int, fnSwap) -> int:
+    """
+    Description:
+        Orders arrKeys[intLow], the middle element and arrKeys[intHigh], uses
+        their median as the pivot and partitions arrKeys[intLow:intHigh + 1]
+        around it. The outer two elements act as sentinels for the scans.
+        Returns the final position of the pivot.
+    """
+    intMid: int = (intLow + intHigh) // 2
+    if arrKeys[intMid] < arrKeys[intLow]:
+        arrKeys[intLow], arrKeys[intMid] = arrKeys[intMid], arrKeys[intLow]
+        fnSwap(intLow, intMid)
+    if arrKeys[intHigh] < arrKeys[intLow]:
+        arrKeys[intLow], arrKeys[intHigh] = arrKeys[intHigh], arrKeys[intLow]
+        fnSwap(intLow, intHigh)
+    if arrKeys[intHigh] < arrKeys[intMid]:
+        arrKeys[intMid], arrKeys[intHigh] = arrKeys[intHigh], arrKeys[intMid]
+        fnSwap(intMid, intHigh)
+
+    # Park the pivot next to the upper sentinel
+    intLast: int = intHigh - 1
+    arrKeys[intMid], arrKeys[intLast] = arrKeys[intLast], arrKeys[intMid]
+    fnSwap(intMid, intLast)
+    varPivot = arrKeys[intLast]
+
+    i: int = intLow
+    j: int = intLast
+    while True:
+        i += 1
+        while arrKeys[i] < varPivot:
+            i += 1
+        j -= 1
+        while varPivot < arrKeys[j]:
+            j -= 1
+        if i >= j:
+            break
+        arrKeys[i], arrKeys[j] = arrKeys[j], arrKeys[i]
+        fnSwap(i, j)
+
+    arrKeys[i], arrKeys[intLast] = arrKeys[intLast], arrKeys[i]
+    fnSwap(i, intLast)
+    return i
+
+
+def _fnPartitionDescending(arrKeys: list, intLow: int, intHigh: int, fnSwap) -> int:
+    """
+    Description:
+        Descending counterpart of _fnPartitionAscending.
+    """
+    intMid: int = (intLow + intHigh) // 2
+    if arrKeys[intMid] > arrKeys[intLow]:
+        arrKeys[intLow], arrKeys[intMid] = arrKeys[intMid], arrKeys[intLow]
+        fnSwap(intLow, intMid)
+    if arrKeys[intHigh] > arrKeys[intLow]:
+        arrKeys[intLow], arrKeys[intHigh] = arrKeys[intHigh], arrKeys[intLow]
+        fnSwap(intLow, intHigh)
+    if arrKeys[intHigh] > arrKeys[intMid]:
+        arrKeys[intMid], arrKeys[intHigh] = arrKeys[intHigh], arrKeys[intMid]
+        fnSwap(intMid, intHigh)
+
+    # Park the pivot next to the upper sentinel
+    intLast: int = intHigh - 1
+    arrKeys[intMid], arrKeys[intLast] = arrKeys[intLast], arrKeys[intMid]
+    fnSwap(intMid, intLast)
+    varPivot = arrKeys[intLast]
+
+    i: int = intLow
+    j: int = intLast
+    while True:
+        i += 1
+        while arrKeys[i] > varPivot:
+            i += 1
+        j -= 1
+        while varPivot > arrKeys[j]:
+            j -= 1
+        if i >= j:
+            break
+        arrKeys[i], arrKeys[j] = arrKeys[j], arrKeys[i]
+        fnSwap(i, j)
+
+    arrKeys[i], arrKeys[intLast] = arrKeys[intLast], arrKeys[i]
+    fnSwap(i, intLast)
+    return i
+
+
+def _fnInsertionSortAscending(arrKeys: list, intLow: int, intHigh: int, fnSwap) -> bool:
+    """
+    Description:
+        Insertion sort of arrKeys[intLow:intHigh + 1] by adjacent swaps.
+        Returns whether anything moved.
+    """
+    boolSwapped: bool = False
+    for i in range(intLow + 1, intHigh + 1):
+        j: int = i
+        while j > intLow and arrKeys[j] < arrKeys[j - 1]:
+            arrKeys[j], arrKeys[j - 1] = arrKeys[j - 1], arrKeys[j]
+            fnSwap(j, j - 1)
+            boolSwapped = True
+            j -= 1
+    return boolSwapped
+
+
+def _fnInsertionSortDescending(arrKeys: list, intLow: int, intHigh: int, fnSwap) -> bool:
+    """
+    Description:
+        Descending counterpart of _fnInsertionSortAscending.
+    """
+    boolSwapped: bool = False
+    for i in range(intLow + 1, intHigh + 1):
+        j: int = i
+        while j > intLow and arrKeys[j] > arrKeys[j - 1]:
+            arrKeys[j], arrKeys[j - 1] = arrKeys[j - 1], arrKeys[j]
+            fnSwap(j, j - 1)
+            boolSwapped = True
+            j -= 1
+    return boolSwapped
+
+
+def _fnHeapSortAscending(arrKeys: list, intLow: int, intHigh: int, fnSwap):
+    """
+    Description:
+        Heapsort of arrKeys[intLow:intHigh + 1] with a max-heap rooted at
+        intLow. Yields after every element moved from the heap into place.
+    """
+    intSize: int = intHigh - intLow + 1
+
+    for intStart in range(intSize // 2 - 1, -1, -1):
+        _fnSiftDownAscending(arrKeys, intLow, intStart, intSize, fnSwap)
+
+    for intEnd in range(intSize - 1, 0, -1):
+        arrKeys[intLow], arrKeys[intLow + intEnd] = arrKeys[intLow + intEnd], arrKeys[intLow]
+        fnSwap(intLow, intLow + intEnd)
+        _fnSiftDownAscending(arrKeys, intLow, 0, intEnd, fnSwap)
+        yield
+
+
+def _fnSiftDownAscending(arrKeys: list, intOffset: int, intRoot: int, intSize: int, fnSwap) -> None:
+    """
+    Description:
+        Moves the heap node intRoot down until both children are not larger.
+        Heap positions are relative to intOffset.
+    """
+    while True:
+        intChild: int = 2 * intRoot + 1
+        if intChild >= intSize:
+            return
+        if intChild + 1 < intSize and arrKeys[intOffset + intChild] < arrKeys[intOffset + intChild + 1]:
+            intChild += 1
+        if not arrKeys[intOffset + intRoot] < arrKeys[intOffset + intChild]:
+            return
+        i: int = intOffset + intRoot
+        j: int = intOffset + intChild
+        arrKeys[i], arrKeys[j] = arrKeys[j], arrKeys[i]
+        fnSwap(i, j)
+        intRoot = intChild
+
+
+def _fnHeapSortDescending(arrKeys: list, intLow: int, intHigh: int, fnSwap):
+    """
+    Description:
+        Descending counterpart of _fnHeapSortAscending, using a min-heap.
+    """
+    intSize: int = intHigh - intLow + 1
+
+    for intStart in range(intSize // 2 - 1, -1, -1):
+        _fnSiftDownDescending(arrKeys, intLow, intStart, intSize, fnSwap)
+
+    for intEnd in range(intSize - 1, 0, -1):
+        arrKeys[intLow], arrKeys[intLow + intEnd] = arrKeys[intLow + intEnd], arrKeys[intLow]
+        fnSwap(intLow, intLow + intEnd)
+        _fnSiftDownDescending(arrKeys, intLow, 0, intEnd, fnSwap)
+        yield
+
+
+def _fnSiftDownDescending(arrKeys: list, intOffset: int, intRoot: int, intSize: int, fnSwap) -> None:
+    """
+    Description:
+        Descending counterpart of _fnSiftDownAscending.
+    """
+    while True:
+        intChild: int = 2 * intRoot + 1
+        if intChild >= intSize:
+            return
+        if intChild + 1 < intSize and arrKeys[intOffset + intChild] > arrKeys[intOffset + intChild + 1]:
+            intChild += 1
+        if not arrKeys[intOffset + intRoot] > arrKeys[intOffset + intChild]:
+            return
+        i: int = intOffset + intRoot
+        j: int = intOffset + intChild
+        arrKeys[i], arrKeys[j] = arrKeys[j], arrKeys[i]
+        fnSwap(i, j)
+        intRoot = intChild
@@ -0,0 +1,196 @@
+from ..step_trace import ReplayTrace, fnBuildSortKeys
+
+
+def fnMergeSort(arrInput: list, boolAscending: bool = True, fnKey=None, boolCaseFold: bool = False,
+                boolLocale: bool = False) -> tuple[list, ReplayTrace]:
+    """
+    Description:
+        Bottom-up Merge Sort. The array is treated as n sorted runs of length
+        one, and every pass merges neighbouring runs pairwise, doubling the run
+        length, until a single run is left. Each pass moves the elements from
+        one buffer into a second scratch buffer allocated once up front, and
+        the two buffers swap roles after every pass, so no pass allocates a new
+        output list. Neighbouring runs that are already in order, and the tail
+        left over when one run of a merge is exhausted, are block-copied with
+        slice assignment, which builds a short-lived slice of the source but
+        is much faster than moving the elements one by one in Python.
+        The sort is stable in both directions and takes O(n log n) time.
+
+    Parameters:
+        arrInput (list): The array to be sorted, can contain numbers or strings
+        boolAscending (bool): Sort in ascending order if True, descending if False
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively
+        boolLocale (bool): Compare strings using the current locale's collation rules
+
+    Returns:
+        tuple: A tuple containing:
+            - list: The sorted array
+            - ReplayTrace: Sequence of steps showing the array state after each merge pass
+
+    References:
+        https://en.wikipedia.org/wiki/Merge_sort#Bottom-up_implementation
+    """
+    arrInitial: list = arrInput.copy()
+    arrKeys: list = fnBuildSortKeys(arrInitial, fnKey, boolCaseFold, boolLocale)
+
+    genPasses = _fnMergePasses(arrInitial, arrKeys, boolAscending)
+    intSteps: int = 0
+    while True:
+        try:
+            next(genPasses)
+        except StopIteration as objStop:
+            arrResult: list = objStop.value
+            break
+        intSteps += 1
+
+    def fnReplay():
+        for arrState in _fnMergePasses(arrInitial, arrKeys, boolAscending):
+            yield _fnSnapshot(arrState, boolAscending)
+
+    return arrResult, ReplayTrace(fnReplay, intSteps)
+
+
+def fnMergeSortStream(arrInput: list, boolAscending: bool = True, intMaxSteps: int = None, fnKey=None,
+                      boolCaseFold: bool = False, boolLocale: bool = False):
+    """
+    Description:
+        Streaming variant of fnMergeSort that yields the array state after each
+        merge pass as soon as it happens instead of building the whole trace.
+
+    Parameters:
+        arrInput (list): The array to be sorted, can contain numbers or strings
+        boolAscending (bool): Sort in ascending order if True, descending if False
+        intMaxSteps (int, optional): Maximum number of steps to yield. Defaults to no limit.
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively
+        boolLocale (bool): Compare strings using the current locale's collation rules
+
+    Returns:
+        generator: Yields each step as a list and returns the sorted array
+    """
+    arrKeys: list = fnBuildSortKeys(arrInput, fnKey, boolCaseFold, boolLocale)
+    genPasses = _fnMergePasses(arrInput, arrKeys, boolAscending)
+
+    intYielded: int = 0
+    while True:
+        try:
+            arrState: list = next(genPasses)
+        except StopIteration as objStop:
+            return objStop.value
+        if intMaxSteps is None or intYielded < intMaxSteps:
+            intYielded += 1
+            yield _fnSnapshot(arrState, boolAscending)
+
+
+def _fnSnapshot(arrState: list, boolAscending: bool) -> list:
+    """
+    Description:
+        Copies a working buffer of _fnMergePasses into display order.
+    """
+    return arrState.copy() if boolAscending else arrState[::-1]
+
+
+def _fnMergePasses(arrValues: list, arrKeys: list, boolAscending: bool):
+    """
+    Description:
+        Generator running the merge passes on copies of arrValues (and of the
+        parallel arrKeys, when given). A stable descending sort is a stable
+        ascending sort of the reversed array, reversed back at the end, so
+        only ascending merges are needed. Yields the working value buffer
+        after every pass (in reversed order when descending) and returns the
+        sorted array.
+    """
+    arrSource: list = arrValues.copy() if boolAscending else arrValues[::-1]
+    arrSourceKeys: list = None
+    if arrKeys is not None:
+        arrSourceKeys = arrKeys.copy() if boolAscending else arrKeys[::-1]
+
+    intSize: int = len(arrSource)
+    # Scratch buffers, allocated once and swapped with the source after every pass
+    arrTarget: list = [None] * intSize
+    arrTargetKeys: list = [None] * intSize if arrKeys is not None else None
+
+    intWidth: int = 1
+    while intWidth < intSize:
+        for intLow in range(0, intSize, 2 * intWidth):
+            intMid: int = min(intLow + intWidth, intSize)
+            intHigh: int = min(intLow + 2 * intWidth, intSize)
+            if arrKeys is None:
+                _fnMergeRuns(arrSource, arrTarget, intLow, intMid, intHigh)
+            else:
+                _fnMergeKeyedRuns(arrSourceKeys, arrTargetKeys, arrSource, arrTarget, intLow, intMid, intHigh)
+
+        arrSource, arrTarget = arrTarget, arrSource
+        arrSourceKeys, arrTargetKeys = arrTargetKeys, arrSourceKeys
+        intWidth *= 2
+        yield arrSource
+
+    if not boolAscending:
+        arrSource.reverse()
+    return arrSource
+
+
+def _fnMergeRuns(arrSource: list, arrTarget: list, intLow: int, intMid: int, intHigh: int) -> None:
+    """
+    Description:
+        Merges the sorted runs arrSource[intLow:intMid] and
+        arrSource[intMid:intHigh] into arrTarget[intLow:intHigh], taking from
+        the left run on ties so the merge is stable. Runs already in order and
+        the leftover tail are block-copied through a temporary slice.
+    """
+    if intMid >= intHigh or not arrSource[intMid] < arrSource[intMid - 1]:
+        arrTarget[intLow:intHigh] = arrSource[intLow:intHigh]
+        return
+
+    i: int = intLow
+    j: int = intMid
+    k: int = intLow
+    while i < intMid and j < intHigh:
+        if arrSource[j] < arrSource[i]:
+            arrTarget[k] = arrSource[j]
+            j += 1
+        else:
+            arrTarget[k] = arrSource[i]
+            i += 1
+        k += 1
+
+    # One run is exhausted, the rest of the other one is already in order
+    if i < intMid:
+        arrTarget[k:intHigh] = arrSource[i:intMid]
+    else:
+        arrTarget[k:intHigh] = arrSource[j:intHigh]
+
+
+def _fnMergeKeyedRuns(arrSourceKeys: list, arrTargetKeys: list, arrSource: list, arrTarget: list,
+                      intLow: int, intMid: int, intHigh: int) -> None:
+    """
+    Description:
+        Same as _fnMergeRuns, but compares the precomputed keys and moves each
+        value together with its key.
+    """
+    if intMid >= intHigh or not arrSourceKeys[intMid] < arrSourceKeys[intMid - 1]:
+        arrTargetKeys[intLow:intHigh] = arrSourceKeys[intLow:intHigh]
+        arrTarget[intLow:intHigh] = arrSource[intLow:intHigh]
+        return
+
+    i: int = intLow
+    j: int = intMid
+    k: int = intLow
+    while i < intMid and j < intHigh:
+        if arrSourceKeys[j] < arrSourceKeys[i]:
+            arrTargetKeys[k] = arrSourceKeys[j]
+            arrTarget[k] = arrSource[j]
+            j += 1
+        else:
+            arrTargetKeys[k] = arrSourceKeys[i]
+            arrTarget[k] = arrSource[i]
+            i += 1
+        k += 1
+
+    if i < intMid:
+        arrTargetKeys[k:intHigh] = arrSourceKeys[i:intMid]
+        arrTarget[k:intHigh] = arrSource[i:intMid]
+    else:
+        arrTargetKeys[k:intHigh] = arrSourceKeys[j:intHigh]
+        arrTarget[k:intHigh] = arrSource[j:intHigh]
@@ -0,0 +1,2 @@
+from .greedy_knapsack import fnFractionalKnapsack, fnGreedyKnapsack
+from .greedy_tsp import fnNearestNeighborTSP, fnCheapestInsertionTSP, fnTourLength
@@ -0,0 +1,108 @@
+def fnFractionalKnapsack(arrItems: list, intMaxCapacity: int) -> tuple[list, float, list]:
+    """
+    Description:
+        Solves the fractional Knapsack problem greedily. Items are taken in
+        order of value density (value per unit of weight) and the first item
+        that no longer fits is split, so the knapsack is filled exactly. This
+        is optimal when items can be split, runs in O(n log n), and its value
+        is an upper bound for the 0/1 problem on the same items.
+
+    Parameters:
+        arrItems (list): List of tuples (name: str, weight: int, value: int)
+        intMaxCapacity (int): Maximum weight capacity of knapsack
+
+    Returns:
+        tuple: A tuple containing:
+            - list: Names of items taken, the split item suffixed with the share taken, e.g. "Item 3 (40%)"
+            - float: Total value of the items taken
+            - list: The knapsack after each item was added as (items, weight, value), starting empty
+
+    References:
+        https://www.geeksforgeeks.org/fractional-knapsack-problem/
+    """
+    arrTaken: list = []
+    fltWeight: float = 0
+    fltValue: float = 0
+    arrSteps: list = [([], 0, 0)]
+
+    for strItemName, intItemWeight, intItemValue in _fnByDensity(arrItems):
+        intRemaining: float = intMaxCapacity - fltWeight
+        if intRemaining <= 0:
+            break
+
+        if intItemWeight <= intRemaining:
+            arrTaken.append(strItemName)
+            fltWeight += intItemWeight
+            fltValue += intItemValue
+        else:
+            fltFraction: float = intRemaining / intItemWeight
+            arrTaken.append(f"{strItemName} ({fltFraction:.0%})")
+            fltWeight += intRemaining
+            fltValue += intItemValue * fltFraction
+        arrSteps.append((arrTaken.copy(), fltWeight, fltValue))
+
+    return arrTaken, fltValue, arrSteps
+
+
+def fnGreedyKnapsack(arrItems: list, intMaxCapacity: int) -> tuple[list, int, list]:
+    """
+    Description:
+        Approximates the 0/1 Knapsack problem greedily. Items are taken in
+        order of value density whenever they still fit. Density alone can be
+        arbitrarily bad (a small dense item can block one large valuable item),
+        so the result is compared with the most valuable single item that fits
+        and the better of the two is returned, which is guaranteed to be worth
+        at least half of the optimum. Runs in O(n log n).
+
+    Parameters:
+        arrItems (list): List of tuples (name: str, weight: int, value: int)
+        intMaxCapacity (int): Maximum weight capacity of knapsack
+
+    Returns:
+        tuple: A tuple containing:
+            - list: Names of items in the chosen combination
+            - int: Total value of the chosen combination
+            - list: The combinations considered as (items, weight, value): the empty
+                    knapsack, the greedy knapsack after each item was added and the
+                    best single item
+
+    References:
+        https://en.wikipedia.org/wiki/Knapsack_problem#Greedy_approximation_algorithm
+    """
+    arrTaken: list = []
+    intWeight: int = 0
+    intValue: int = 0
+    arrSteps: list = [([], 0, 0)]
+
+    for strItemName, intItemWeight, intItemValue in _fnByDensity(arrItems):
+        if intWeight + intItemWeight <= intMaxCapacity:
+            arrTaken.append(strItemName)
+            intWeight += intItemWeight
+            intValue += intItemValue
+            arrSteps.append((arrTaken.copy(), intWeight, intValue))
+
+    # Fix-up: a single valuable item may beat the whole greedy selection
+    tupBestSingle: tuple = None
+    for strItemName, intItemWeight, intItemValue in arrItems:
+        if intItemWeight <= intMaxCapacity and (tupBestSingle is None or intItemValue > tupBestSingle[2]):
+            tupBestSingle = ([strItemName], intItemWeight, intItemValue)
+
+    if tupBestSingle is not None and tupBestSingle[0] != arrTaken:
+        arrSteps.append(tupBestSingle)
+        if tupBestSingle[2] > intValue:
+            return tupBestSingle[0], tupBestSingle[2], arrSteps
+
+    return arrTaken, intValue, arrSteps
+
+
+def _fnByDensity(arrItems: list) -> list:
+    """
+    Description:
+        Returns the items sorted by value per unit of weight, highest first.
+        Weightless items come first, and ties go to the more valuable item.
+    """
+    return sorted(
+        arrItems,
+        key=lambda tupItem: (tupItem[2] / tupItem[1] if tupItem[1] > 0 else float("inf"), tupItem[2]),
+        reverse=True
+    )
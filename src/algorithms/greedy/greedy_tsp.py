@@ -0,0 +1,185 @@
+def fnNearestNeighborTSP(arrDistanceMatrix: list, intStartCity: int = 0) -> tuple[list, int, list]:
+    """
+    Description:
+        Builds a Travelling Salesman tour greedily by always travelling to the
+        closest city not visited yet, then returning to the start. Runs in
+        O(n²), so it answers large instances instantly, but the tour is not
+        guaranteed to be optimal. Its length is an upper bound that exact
+        solvers can use to prune their search.
+
+    Parameters:
+        arrDistanceMatrix (list): Square matrix where element [i][j] represents
+                                 the distance from city i to city j
+        intStartCity (int, optional): Index of the starting city (0-indexed). Defaults to 0.
+
+    Returns:
+        tuple: A tuple containing:
+            - list: The tour as city indices (starting and ending with intStartCity)
+            - int: Total distance of the tour
+            - list: List of tuples (path, distance) with the tour that was built
+
+    References:
+        https://en.wikipedia.org/wiki/Nearest_neighbour_algorithm
+    """
+    intCityCount: int = _fnValidateDistanceMatrix(arrDistanceMatrix, intStartCity)
+
+    arrVisited: list = [False] * intCityCount
+    arrVisited[intStartCity] = True
+    arrPath: list = [intStartCity]
+    intCurrentCity: int = intStartCity
+
+    for _ in range(intCityCount - 1):
+        arrRow: list = arrDistanceMatrix[intCurrentCity]
+        intNextCity: int = -1
+        for intCity in range(intCityCount):
+            if not arrVisited[intCity] and (intNextCity == -1 or arrRow[intCity] < arrRow[intNextCity]):
+                intNextCity = intCity
+        arrVisited[intNextCity] = True
+        arrPath.append(intNextCity)
+        intCurrentCity = intNextCity
+
+    arrPath.append(intStartCity)
+    intDistance = fnTourLength(arrPath, arrDistanceMatrix)
+    return arrPath, intDistance, [(arrPath, intDistance)]
+
+
+def fnCheapestInsertionTSP(arrDistanceMatrix: list, intStartCity: int = 0) -> tuple[list, int, list]:
+    """
+    Description:
+        Builds a Travelling Salesman tour by cheapest insertion. The tour
+        starts as a round trip between the start city and its nearest city,
+        and the city that lengthens the tour the least is repeatedly inserted
+        between the two neighbouring tour cities where it fits best. Every
+        unvisited city remembers its best insertion, which only has to be
+        searched again when the tour edge it pointed at is replaced, so the
+        tour is usually built in about O(n²) time. The tour is not guaranteed
+        to be optimal but is usually shorter than a nearest neighbour tour.
+
+    Parameters:
+        arrDistanceMatrix (list): Square matrix where element [i][j] represents
+                                 the distance from city i to city j
+        intStartCity (int, optional): Index of the starting city (0-indexed). Defaults to 0.
+
+    Returns:
+        tuple: A tuple containing:
+            - list: The tour as city indices (starting and ending with intStartCity)
+            - int: Total distance of the tour
+            - list: List of tuples (path, distance) with the tour after each insertion
+
+    References:
+        https://en.wikipedia.org/wiki/Travelling_salesman_problem#Heuristic_and_approximation_algorithms
+    """
+    intCityCount: int = _fnValidateDistanceMatrix(arrDistanceMatrix, intStartCity)
+    if intCityCount == 1:
+        return [intStartCity, intStartCity], 0, [([intStartCity, intStartCity], 0)]
+
+    arrStartRow: list = arrDistanceMatrix[intStartCity]
+    intNearest: int = min((intCity for intCity in range(intCityCount) if intCity != intStartCity),
+                          key=lambda intCity: arrStartRow[intCity])
+
+    # The tour as a successor list: arrNext[i] is the city visited after city i
+    arrNext: list = [-1] * intCityCount
+    arrNext[intStartCity] = intNearest
+    arrNext[intNearest] = intStartCity
+    arrTourCities: list = [intStartCity, intNearest]
+
+    arrPath: list = _fnTourFromSuccessors(arrNext, intStartCity)
+    arrSteps: list = [(arrPath, fnTourLength(arrPath, arrDistanceMatrix))]
+
+    # Best insertion of every unvisited city as {city: (added distance, tour edge start)}
+    dictBest: dict = {}
+    for intCity in range(intCityCount):
+        if arrNext[intCity] == -1:
+            dictBest[intCity] = _fnBestInsertion(intCity, arrTourCities, arrNext, arrDistanceMatrix)
+
+    while dictBest:
+        intCity: int = min(dictBest, key=lambda intCandidate: dictBest[intCandidate][0])
+        _, intFrom = dictBest.pop(intCity)
+        intTo: int = arrNext[intFrom]
+        arrNext[intFrom] = intCity
+        arrNext[intCity] = intTo
+        arrTourCities.append(intCity)
+
+        # Only the replaced edge disappeared; the two new edges may be better for the others
+        for intOther, (fltCost, intOtherFrom) in dictBest.items():
+            if intOtherFrom == intFrom:
+                dictBest[intOther] = _fnBestInsertion(intOther, arrTourCities, arrNext, arrDistanceMatrix)
+                continue
+            for intEdgeFrom in (intFrom, intCity):
+                intEdgeTo: int = arrNext[intEdgeFrom]
+                fltAdded = (arrDistanceMatrix[intEdgeFrom][intOther] + arrDistanceMatrix[intOther][intEdgeTo]
+                            - arrDistanceMatrix[intEdgeFrom][intEdgeTo])
+                if fltAdded < fltCost:
+                    fltCost, intOtherFrom = fltAdded, intEdgeFrom
+            dictBest[intOther] = (fltCost, intOtherFrom)
+
+        arrPath = _fnTourFromSuccessors(arrNext, intStartCity)
+        arrSteps.append((arrPath, fnTourLength(arrPath, arrDistanceMatrix)))
+
+    return arrPath, arrSteps[-1][1], arrSteps
+
+
+def fnTourLength(arrPath: list, arrDistanceMatrix: list):
+    """
+    Description:
+        Adds up the distances along a path of city indices.
+
+    Parameters:
+        arrPath (list): City indices in visiting order
+        arrDistanceMatrix (list): Square matrix of distances between cities
+
+    Returns:
+        int: Total distance of the path
+    """
+    return sum(arrDistanceMatrix[arrPath[i]][arrPath[i + 1]] for i in range(len(arrPath) - 1))
+
+
+def _fnBestInsertion(intCity: int, arrTourCities: list, arrNext: list, arrDistanceMatrix: list) -> tuple:
+    """
+    Description:
+        Scans every tour edge for the cheapest place to insert intCity.
+        Returns (added distance, start city of the edge).
+    """
+    arrCityRow: list = arrDistanceMatrix[intCity]
+    tupBest: tuple = None
+    for intFrom in arrTourCities:
+        arrFromRow: list = arrDistanceMatrix[intFrom]
+        intTo: int = arrNext[intFrom]
+        fltAdded = arrFromRow[intCity] + arrCityRow[intTo] - arrFromRow[intTo]
+        if tupBest is None or fltAdded < tupBest[0]:
+            tupBest = (fltAdded, intFrom)
+    return tupBest
+
+
+def _fnTourFromSuccessors(arrNext: list, intStartCity: int) -> list:
+    """
+    Description:
+        Walks a successor list from the start city back to itself.
+    """
+    arrPath: list = [intStartCity]
+    intCity: int = arrNext[intStartCity]
+    while intCity != intStartCity:
+        arrPath.append(intCity)
+        intCity = arrNext[intCity]
+    arrPath.append(intStartCity)
+    return arrPath
+
+
+def _fnValidateDistanceMatrix(arrDistanceMatrix: list, intStartCity: int) -> int:
+    """
+    Description:
+        Checks that the distance matrix is square and the start city is one of
+        its cities, the same way fnTSPBruteForce does. Returns the city count.
+    """
+    if not arrDistanceMatrix or not isinstance(arrDistanceMatrix, list):
+        raise ValueError("arrDistanceMatrix must be a non-empty 2D list")
+
+    intCityCount: int = len(arrDistanceMatrix)
+    for arrRow in arrDistanceMatrix:
+        if not isinstance(arrRow, list) or len(arrRow) != intCityCount:
+            raise ValueError("arrDistanceMatrix must be a square matrix")
+
+    if not isinstance(intStartCity, int) or intStartCity < 0 or intStartCity >= intCityCount:
+        raise ValueError("intStartCity must be a valid index within the distance matrix")
+
+    return intCityCount
@@ -1,11 +1,25 @@
-from .bidirectional_enhanced_selection_sort import bidirectional_enhanced_selection_sort
-from .comb_sort import comb_sort
-from .branch_and_bound_tsp import branch_and_bound_tsp
+from .adaptive_sort import fnMeasureDisorder, fnChooseSort, fnAdaptiveSort, fnAdaptiveSortStream, fnExplainAdaptiveSort
+from .bidirectional_enhanced_selection_sort import bidirectional_enhanced_selection_sort, bidirectional_enhanced_selection_sort_stream
+from .comb_sort import comb_sort, comb_sort_stream
+from .counting_sort import fnCountingSort
+from .external_sort import fnExternalSort
+from .branch_and_bound_tsp import branch_and_bound_tsp, branch_and_bound_tsp_with_incumbent
 from .dynamic_programming_knapsack import dynamic_programming_knapsack
 from .optimized_knapsack_problem import knapsack_optimize
 from .optimized_travelling_salesman import fnTSPOptimized
-from .optimized_linear_search import fnSentinelLinearSearch
-from .optimized_selection_sort import fnSelectionSortOptimized
-from .optimized_bubble_sort import fnBubbleSortOptimized
-from .self_organizing_list import fnSelfOrganizingSearch
+from .optimized_linear_search import fnSentinelLinearSearch, SentinelSearchBuffer
+from .optimized_selection_sort import fnSelectionSortOptimized, fnSelectionSortOptimizedStream
+from .optimized_bubble_sort import fnBubbleSortOptimized, fnBubbleSortOptimizedStream
+from .tournament_selection_sort import fnTournamentSelectionSort, fnTournamentSelectionSortStream
+from .parallel_sort import fnParallelSort
+from .sorting_network import fnSortingNetwork, fnBatchSort
+from .self_organizing_list import SelfOrganizingList, IndexedSelfOrganizingList
 
+from .partial_selection_sort import fnPartialSelectionSort, fnPartialSelectionSortStream
+from .sorted_collection import SortedCollection, fnAbsorbSorted
+from .indexed_search import IndexedSearch
+from .batch_search import fnBatchLinearSearch
+from .vectorized_search import VectorizedSearch, PythonSearch, fnCreateSearchEngine
+from .bloom_filter import BloomFilter, BloomFilteredSearch
+from .mapped_search import MappedColumnSearch, fnWriteRandomColumn
+from .string_index import StringIndex
@@ -0,0 +1,221 @@
+from ..step_trace import fnBuildSortKeys
+from .comb_sort import comb_sort, comb_sort_stream
+from .counting_sort import fnCountingSort, fnDetectKeyDomain
+from .optimized_bubble_sort import fnBubbleSortOptimized, fnBubbleSortOptimizedStream
+
+# At most this many inversions per element counts as nearly sorted
+FLT_NEARLY_SORTED_INVERSIONS: float = 0.5
+# A key range up to this many times the input size is cheap enough for a count table
+INT_COUNTING_RANGE_FACTOR: int = 2
+# Share of repeated keys above which a bucket sort beats any comparison sort
+FLT_DUPLICATE_RATIO_THRESHOLD: float = 0.5
+
+
+def fnMeasureDisorder(arrInput: list, boolAscending: bool = True, fnKey=None, boolCaseFold: bool = False,
+                      boolLocale: bool = False) -> dict:
+    """
+    Description:
+        Measures how far an array is from being sorted in the requested
+        direction. Natural runs and repeated keys are counted in a single pass,
+        and inversions (pairs of elements in the wrong order) are counted in
+        O(n log n) with a bottom-up merge that adds the number of elements still
+        waiting in the left half whenever an element of the right half goes first.
+
+    Parameters:
+        arrInput (list): The array to inspect, can contain numbers or strings
+        boolAscending (bool): Measure against ascending order if True, descending if False
+        fnKey (callable, optional): Function computing each element's sort key
+        boolCaseFold (bool): Compare strings case-insensitively
+        boolLocale (bool): Compare strings using the current locale's collation rules
+
+    Returns:
+        dict: Measurements with keys "size", "runs" (maximal already-ordered stretches),
+              "inversions", "max_inversions", "duplicate_ratio" (share of elements that
+              repeat an earlier key) and "domain" (the result of fnDetectKeyDomain on the
+              raw values, or None when a key option is set)
+    """
+    arrKeys: list = fnBuildSortKeys(arrInput, fnKey, boolCaseFold, boolLocale)
+    boolRawKeys: bool = arrKeys is None
+    if boolRawKeys:
+        arrKeys = arrInput
+
+    intSize: int = len(arrKeys)
+    # A descending inversion is an ascending inversion of the reversed array
+    arrOrdered: list = list(arrKeys) if boolAscending else arrKeys[::-1]
+
+    intRuns: int = 1 if intSize else 0
+    for i in range(1, intSize):
+        if arrOrdered[i] < arrOrdered[i - 1]:
+            intRuns += 1
+
+    return {
+        "size": intSize,
+        "runs": intRuns,
+        "inversions": _fnCountInversions(arrOrdered),
+        "max_inversions": intSize * (intSize - 1) // 2,
+        "duplicate_ratio": 1 - len(set(arrKeys)) / intSize if intSize else 0.0,
+        "domain": fnDetectKeyDomain(arrInput) if boolRawKeys else None
+    }
+
+
+def _fnCountInversions(arrKeys: list) -> int:
+    """
+    Description:
+        Counts the pairs i < j with arrKeys[i] > arrKeys[j] by merge sorting
+        arrKeys in place with doubling run widths.
+    """
+    intSize: int = len(arrKeys)
+    arrBuffer: list = [None] * intSize
+    intInversions: int = 0
+    intWidth: int = 1
+
+    while intWidth < intSize:
+        for intLow in range(0, intSize - intWidth, 2 * intWidth):
+            intMid: int = intLow + intWidth
+            intHigh: int = min(intMid + intWidth, intSize)
+            i, j, k = intLow, intMid, intLow
+            while i < intMid and j < intHigh:
+                if arrKeys[j] < arrKeys[i]:
+                    arrBuffer[k] = arrKeys[j]
+                    intInversions += intMid - i
+                    j += 1
+                else:
+                    arrBuffer[k] = arrKeys[i]
+                    i += 1
+                k += 1
+            arrBuffer[k:k + intMid - i] = arrKeys[i:intMid]
+            k += intMid - i
+            arrBuffer[k:k + intHigh - j] = arrKeys[j:intHigh]
+            arrKeys[intLow:intHigh] = arrBuffer[intLow:intHigh]
+        intWidth *= 2
+
+    return intInversions
+
+
+def fnChooseSort(dictDisorder: dict) -> tuple[str, str]:
+    """
+    Description:
+        Picks the project sort that suits the measured input best:
+            - Cocktail shaker sort when the array is nearly sorted, because
+              only a few passes are needed and it stops as soon as a pass is clean
+            - Counting sort when every key is an integer or a single character
+              and the key range is small or most keys repeat, because it runs
+              in O(n + k) without comparing elements
+            - Comb sort otherwise, because its shrinking gap moves far-away
+              elements quickly on random data
+
+    Parameters:
+        dictDisorder (dict): Measurements returned by fnMeasureDisorder
+
+    Returns:
+        tuple: A tuple containing:
+            - str: Name of the chosen sort, a key of DICT_ADAPTIVE_SORTS
+            - str: Human readable reason for the choice
+    """
+    intSize: int = dictDisorder["size"]
+    intInversions: int = dictDisorder["inversions"]
+
+    if intInversions <= FLT_NEARLY_SORTED_INVERSIONS * intSize:
+        return "Cocktail Shaker Sort", (
+            f"The list is nearly sorted: {intInversions} inversion(s) and {dictDisorder['runs']} run(s) "
+            f"for {intSize} element(s), so a few bidirectional passes finish the job."
+        )
+
+    tupDomain: tuple = dictDisorder["domain"]
+    if tupDomain is not None:
+        strKind, intLow, intHigh = tupDomain
+        intRange: int = intHigh - intLow + 1
+        fltDuplicates: float = dictDisorder["duplicate_ratio"]
+        strKeys: str = "integers" if strKind == "int" else "characters"
+
+        if intRange <= INT_COUNTING_RANGE_FACTOR * intSize:
+            return "Counting Sort", (
+                f"All values are {strKeys} spanning only {intRange} key(s) for {intSize} element(s), "
+                f"so counting them is cheaper than comparing them."
+            )
+        if fltDuplicates >= FLT_DUPLICATE_RATIO_THRESHOLD:
+            return "Counting Sort", (
+                f"All values are {strKeys} and {fltDuplicates:.0%} of them are repeats, "
+                f"so bucketing them is cheaper than comparing them."
+            )
+
+    return "Comb Sort", (
+        f"The list looks random: {intInversions} of {dictDisorder['max_inversions']} possible pairs are out of order "
+        f"across {dictDisorder['runs']} run(s), so comb sort's shrinking gap moves elements into place fastest."
+    )
+
+
+def fnExplainAdaptiveSort(arrInput: list, boolAscending: bool = True) -> tuple[str, str]:
+    """
+    Description:
+        Reports which sort fnAdaptiveSort runs for arrInput and why.
+
+    Parameters:
+        arrInput (list): The array to be sorted
+        boolAscending (bool): Sort in ascending order if True, descending if False
+
+    Returns:
+        tuple: The name of the chosen sort and the reason for the choice
+    """
+    return fnChooseSort(fnMeasureDisorder(arrInput, boolAscending))
+
+
+def fnAdaptiveSort(arrInput: list, boolAscending: bool = True, strChoice: str = None) -> tuple[list, list]:
+    """
+    Description:
+        Measures the disorder of the input and dispatches it to the project
+        sort chosen by fnChooseSort. The input list is left unchanged.
+
+    Parameters:
+        arrInput (list): The array to be sorted, can contain numbers or strings
+        boolAscending (bool): Sort in ascending order if True, descending if False
+        strChoice (str, optional): Sort already chosen by fnExplainAdaptiveSort for this input,
+                                   so the disorder is not measured a second time
+
+    Returns:
+        tuple: A tuple containing:
+            - list: The sorted array
+            - list: Steps recorded by the chosen sort
+    """
+    strName: str = strChoice or fnExplainAdaptiveSort(arrInput, boolAscending)[0]
+    fnSort, _ = DICT_ADAPTIVE_SORTS[strName]
+    return fnSort(arrInput.copy(), boolAscending)
+
+
+def fnAdaptiveSortStream(arrInput: list, boolAscending: bool = True, intMaxSteps: int = None, strChoice: str = None):
+    """
+    Description:
+        Streaming variant of fnAdaptiveSort that yields the steps of the chosen
+        sort as they happen.
+
+    Parameters:
+        arrInput (list): The array to be sorted, can contain numbers or strings
+        boolAscending (bool): Sort in ascending order if True, descending if False
+        intMaxSteps (int, optional): Maximum number of steps to yield. Defaults to no limit.
+        strChoice (str, optional): Sort already chosen by fnExplainAdaptiveSort for this input
+
+    Returns:
+        generator: Yields each step as a list and returns the sorted array
+    """
+    strName: str = strChoice or fnExplainAdaptiveSort(arrInput, boolAscending)[0]
+    _, fnStream = DICT_ADAPTIVE_SORTS[strName]
+    return fnStream(arrInput.copy(), boolAscending, intMaxSteps)
+
+
+def _fnCountingSortStream(arrInput: list, boolAscending: bool, intMaxSteps: int = None):
+    """
+    Description:
+        Streams the bucket passes of fnCountingSort, which only takes a
+        handful of steps, so they are computed up front.
+    """
+    arrResult, arrSteps = fnCountingSort(arrInput, boolAscending)
+    yield from arrSteps[:intMaxSteps]
+    return arrResult
+
+
+# Sorts the dispatcher can choose from, as (sort, streaming sort) pairs
+DICT_ADAPTIVE_SORTS: dict = {
+    "Cocktail Shaker Sort": (fnBubbleSortOptimized, fnBubbleSortOptimizedStream),
+    "Comb Sort": (comb_sort, comb_sort_stream),
+    "Counting Sort": (fnCountingSort, _fnCountingSortStream)
+}
@@ -0,0 +1,85 @@
+import numpy as np
+
+
+def fnBatchLinearSearch(arrInput: list, arrTargets: list, boolAllOccurrences: bool = False) -> dict:
+    """
+    Description:
+        Searches for many targets in a single pass over the array instead of
+        one sequential search per target, which costs O(n·m) for m targets.
+        The targets go into a set, so checking an element against all of them
+        takes O(1), and the whole batch takes O(n + m). When only first
+        occurrences are wanted the pass stops as soon as every target has
+        been seen. NumPy arrays are matched with np.isin over their typed
+        buffer instead of the Python loop. Lists are not converted, since
+        copying them into a typed array costs more than the set-based pass.
+
+    Parameters:
+        arrInput (list | np.ndarray): The array to search in, can contain any hashable type
+        arrTargets (list): The target elements to search for
+        boolAllOccurrences (bool): Return every index of each target instead of the first one
+
+    Returns:
+        dict: Maps every target to the index of its first occurrence (-1 if not
+              found), or to the ascending list of all its indices when
+              boolAllOccurrences is True
+
+    References:
+        https://numpy.org/doc/stable/reference/generated/numpy.isin.html
+    """
+    setTargets: set = set(arrTargets)
+    if isinstance(arrInput, np.ndarray):
+        return _fnBatchSearchVectorized(arrInput, setTargets, boolAllOccurrences)
+
+    if boolAllOccurrences:
+        dictFound: dict = {varTarget: [] for varTarget in setTargets}
+        for intIndex, varValue in enumerate(arrInput):
+            if varValue in setTargets:
+                dictFound[varValue].append(intIndex)
+        return dictFound
+
+    dictFirst: dict = {}
+    for intIndex, varValue in enumerate(arrInput):
+        if varValue in setTargets and varValue not in dictFirst:
+            dictFirst[varValue] = intIndex
+            if len(dictFirst) == len(setTargets):
+                break
+    return {varTarget: dictFirst.get(varTarget, -1) for varTarget in setTargets}
+
+
+def _fnBatchSearchVectorized(arrData: np.ndarray, setTargets: set, boolAllOccurrences: bool) -> dict:
+    """
+    Description:
+        np.isin variant of fnBatchLinearSearch for NumPy arrays. The matching
+        indices come out in ascending order, so a stable sort of their values
+        groups every target's occurrences with the first one in front.
+    """
+    # Only targets the array's dtype holds exactly can match; building one array of mixed
+    # targets would coerce them all to a common dtype, such as numbers to strings
+    arrCompatible: list = [varTarget for varTarget in setTargets if _fnFitsDtype(varTarget, arrData.dtype)]
+    arrTargetData: np.ndarray = np.array(arrCompatible, dtype=arrData.dtype)
+    arrMatches: np.ndarray = np.flatnonzero(np.isin(arrData, arrTargetData))
+    arrOrder: np.ndarray = np.argsort(arrData[arrMatches], kind="stable")
+    arrMatches = arrMatches[arrOrder]
+    arrValues, arrStarts = np.unique(arrData[arrMatches], return_index=True)
+
+    if boolAllOccurrences:
+        dictFound: dict = {varTarget: [] for varTarget in setTargets}
+        for varValue, arrIndices in zip(arrValues.tolist(), np.split(arrMatches, arrStarts[1:])):
+            dictFound[varValue] = arrIndices.tolist()
+        return dictFound
+
+    dictFirst: dict = dict(zip(arrValues.tolist(), arrMatches[arrStarts].tolist()))
+    return {varTarget: dictFirst.get(varTarget, -1) for varTarget in setTargets}
+
+
+def _fnFitsDtype(varTarget, objDtype: np.dtype) -> bool:
+    """
+    Description:
+        Checks that varTarget converts to objDtype without changing its value,
+        so 2.5, "x" or 2**70 are rejected for an int64 array.
+    """
+    try:
+        varConverted = objDtype.type(varTarget)
+    except (TypeError, ValueError, OverflowError):
+        return False
+    return bool(varConverted == varTarget)
@@ -1,4 +1,7 @@
-def bidirectional_enhanced_selection_sort(intArray, ascending):
+from ..step_trace import fnTraceSort, fnStreamSort, fnDirectionalPasses
+
+
+def bidirectional_enhanced_selection_sort(intArray, ascending, fnKey=None, boolCaseFold=False, boolLocale=False):
     """
         This function use the advantage of applying the selection sort algorithm bidirectionally (from left to right & right to left in one iteration), swapping the previous maximum/minimum to the location before the new maximum/minimum, storing the new location of previous maximum/minimum to the stack, and once there's no new maximum/minimum, then the current maximum/minimum will be place to its correct position. To continue, the previous maximum/minimum in the stack will be use as the starting point for the next iteration and will repeat the process. And Finally, the sorting will stop when there is an empty stack or the stack pop of both are equal, or the front search is greater than the end search and the end search is less than the front search.
     
@@ -8,15 +11,43 @@ def bidirectional_enhanced_selection_sort(intArray, ascending):
     Arguments:
         intArray (list): The list of integers to be sorted
         ascending (boolean): The list is ascending if True
+        fnKey (function): Computes each element's sort key once before sorting, optional
+        boolCaseFold (boolean): Strings are compared case-insensitively if True
+        boolLocale (boolean): Strings are compared with the current locale's collation rules if True
 
     Return:
         list: The sorted list in ascending order
-        list of lists: The order of array in each step
+        SortTrace: The order of array in each step
 
     Example:
         >>>bidirectional_enhanced_selection_sort([64, 34, 25, 12, 22, 11, 90])
         [11, 12, 22, 25, 34, 64, 90]
     """
+    return fnTraceSort(_bidirectional_enhanced_selection_passes, intArray, ascending, fnKey, boolCaseFold, boolLocale)
+
+
+def bidirectional_enhanced_selection_sort_stream(intArray, ascending, intMaxSteps=None, fnKey=None, boolCaseFold=False, boolLocale=False):
+    """
+        Streaming variant of bidirectional_enhanced_selection_sort that yields the order of the array after each iteration as soon as it happens instead of building the whole trace.
+
+    Arguments:
+        intArray (list): The list of integers to be sorted
+        ascending (boolean): The list is ascending if True
+        intMaxSteps (int): Maximum number of steps to yield, no limit if None
+        fnKey (function): Computes each element's sort key once before sorting, optional
+        boolCaseFold (boolean): Strings are compared case-insensitively if True
+        boolLocale (boolean): Strings are compared with the current locale's collation rules if True
+
+    Return:
+        generator: Yields each step as a list and returns the sorted list
+    """
+    return fnStreamSort(_bidirectional_enhanced_selection_passes, intArray, ascending, intMaxSteps, fnKey, boolCaseFold, boolLocale)
+
+
+def _bidirectional_enhanced_selection_ascending(intArray, fnSwap):
+    """
+        Ascending bidirectional enhanced selection sort kernel. Sorts intArray in place, reports every swap through fnSwap and yields after every iteration.
+    """
 
     #variables
     stackMaxLocation = []
@@ -26,69 +57,119 @@ def bidirectional_enhanced_selection_sort(intArray, ascending):
     intMaxBegin = 0
     intCurrentMax = 0
     intCurrentMin = intEnd - 2
-    steps = []
 
     #loop through the array
     while intFront<intEnd and intEnd>intFront:
 
         #loop from left to right (sort the large value)
         for i in range(intCurrentMax, intEnd):
+            if(intArray[intCurrentMax] < intArray[i]):
+                intTemporaryContainer = intArray[intCurrentMax]
+                intArray[intCurrentMax] = intArray[i - 1]
+                intArray[i - 1] = intTemporaryContainer
+                fnSwap(intCurrentMax, i - 1)
 
-            if(ascending):
-                if(intArray[intCurrentMax] < intArray[i]):
-                    intTemporaryContainer = intArray[intCurrentMax]
-                    intArray[intCurrentMax] = intArray[i - 1]
-                    intArray[i - 1] = intTemporaryContainer
-
-                    stackMaxLocation.append(i - 1)
+                stackMaxLocation.append(i - 1)
 
-                    intCurrentMax = i
-            else:
-                if(intArray[intCurrentMax] > intArray[i]):
-                    intTemporaryContainer = intArray[intCurrentMax]
-                    intArray[intCurrentMax] = intArray[i - 1]
-                    intArray[i - 1] = intTemporaryContainer
+                intCurrentMax = i
 
-                    stackMaxLocation.append(i - 1)
-
-                    intCurrentMax = i
-
-        
         intTemporaryContainer = intArray[intCurrentMax]
         intArray[intCurrentMax] = intArray[intEnd - 1]
         intArray[intEnd - 1] = intTemporaryContainer
+        fnSwap(intCurrentMax, intEnd - 1)
 
         intEnd -= 1
 
         #loop from right to left (sort the small value)
         for j in range(intCurrentMin, intFront - 1, -1):
-            if(ascending):
-                if(intArray[intCurrentMin] > intArray[j]):
-                    intTemporaryContainer = intArray[intCurrentMin]
-                    intArray[intCurrentMin] = intArray[j + 1]
-                    intArray[j + 1] = intTemporaryContainer
+            if(intArray[intCurrentMin] > intArray[j]):
+                intTemporaryContainer = intArray[intCurrentMin]
+                intArray[intCurrentMin] = intArray[j + 1]
+                intArray[j + 1] = intTemporaryContainer
+                fnSwap(intCurrentMin, j + 1)
+
+                stackMinLocation.append(j + 1)
+
+                intCurrentMin = j
+
+        intTemporaryContainer = intArray[intCurrentMin]
+        intArray[intCurrentMin] = intArray[intFront]
+        intArray[intFront] = intTemporaryContainer
+        fnSwap(intCurrentMin, intFront)
+
+        intFront += 1
+
+        yield
+
+        try:
+            intCurrentMax = stackMaxLocation.pop()
+            intCurrentMin = stackMinLocation.pop()
+
+            if(intCurrentMax == intCurrentMin):
+                break
+
+        except IndexError:
+            intCurrentMax = intFront
+            intCurrentMin = intEnd
+            continue
+
+
+def _bidirectional_enhanced_selection_descending(intArray, fnSwap):
+    """
+        Descending bidirectional enhanced selection sort kernel. Sorts intArray in place, reports every swap through fnSwap and yields after every iteration.
+    """
+
+    #variables
+    stackMaxLocation = []
+    stackMinLocation = []
+    intEnd = len(intArray)
+    intFront = 0
+    intMaxBegin = 0
+    intCurrentMax = 0
+    intCurrentMin = intEnd - 2
+
+    #loop through the array
+    while intFront<intEnd and intEnd>intFront:
+
+        #loop from left to right (sort the large value)
+        for i in range(intCurrentMax, intEnd):
+            if(intArray[intCurrentMax] > intArray[i]):
+                intTemporaryContainer = intArray[intCurrentMax]
+                intArray[intCurrentMax] = intArray[i - 1]
+                intArray[i - 1] = intTemporaryContainer
+                fnSwap(intCurrentMax, i - 1)
 
-                    stackMinLocation.append(j + 1)
+                stackMaxLocation.append(i - 1)
 
-                    intCurrentMin = j
-            else:
-                if(intArray[intCurrentMin] < intArray[j]):
-                    intTemporaryContainer = intArray[intCurrentMin]
-                    intArray[intCurrentMin] = intArray[j + 1]
-                    intArray[j + 1] = intTemporaryContainer
+                intCurrentMax = i
 
-                    stackMinLocation.append(j + 1)
+        intTemporaryContainer = intArray[intCurrentMax]
+        intArray[intCurrentMax] = intArray[intEnd - 1]
+        intArray[intEnd - 1] = intTemporaryContainer
+        fnSwap(intCurrentMax, intEnd - 1)
+
+        intEnd -= 1
+
+        #loop from right to left (sort the small value)
+        for j in range(intCurrentMin, intFront - 1, -1):
+            if(intArray[intCurrentMin] < intArray[j]):
+                intTemporaryContainer = intArray[intCurrentMin]
+                intArray[intCurrentMin] = intArray[j + 1]
+                intArray[j + 1] = intTemporaryContainer
+                fnSwap(intCurrentMin, j + 1)
 
-                    intCurrentMin = j
+                stackMinLocation.append(j + 1)
 
+                intCurrentMin = j
 
         intTemporaryContainer = intArray[intCurrentMin]
         intArray[intCurrentMin] = intArray[intFront]
         intArray[intFront] = intTemporaryContainer
+        fnSwap(intCurrentMin, intFront)
 
         intFront += 1
 
-        steps.append(intArray[:])
+        yield
 
         try:
             intCurrentMax = stackMaxLocation.pop()
@@ -102,5 +183,7 @@ def bidirectional_enhanced_selection_sort(intArray, ascending):
             intCurrentMin = intEnd
             continue
 
-    return intArray, steps
 
+#the sort direction is resolved once per sort instead of once per comparison
+_bidirectional_enhanced_selection_passes = fnDirectionalPasses(_bidirectional_enhanced_selection_ascending,
+                                                               _bidirectional_enhanced_selection_descending)
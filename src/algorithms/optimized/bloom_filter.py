@@ -0,0 +1,220 @@
+import math
+
+# Target false-positive rate of a filter when none is given
+FLT_DEFAULT_FALSE_POSITIVE_RATE: float = 0.01
+INT_MASK_64: int = (1 << 64) - 1
+
+
+class BloomFilter:
+    """
+    Description:
+        Array-backed Bloom filter: a set membership test that can answer
+        "definitely not present" in O(k) without looking at the values. Each
+        value sets k bits of a bytearray bit array, chosen by double hashing
+        of the value's hash, and a value can only be present if all k of its
+        bits are set. A value that was added is always reported, while a value
+        that was not added is wrongly reported with about the target
+        false-positive rate, as long as no more than intCapacity values are
+        added. The bit count m and probe count k are the sizes that reach the
+        target rate with the fewest bits:
+
+            m = -n·ln(p) / ln(2)²        k = (m / n)·ln(2)
+
+        Values that compare equal (such as 1 and 1.0) share a hash and
+        therefore their bits, like in a set.
+
+    Parameters:
+        intCapacity (int): Number of values the filter is sized for
+        fltFalsePositiveRate (float): Target false-positive rate, between 0 and 1
+
+    Raises:
+        ValueError: If fltFalsePositiveRate is not between 0 and 1
+
+    Example:
+        >>> objFilter = BloomFilter(100)
+        >>> objFilter.add("apple")
+        >>> "apple" in objFilter
+        True
+
+    References:
+        https://en.wikipedia.org/wiki/Bloom_filter
+    """
+    def __init__(self, intCapacity: int, fltFalsePositiveRate: float = FLT_DEFAULT_FALSE_POSITIVE_RATE):
+        if not 0 < fltFalsePositiveRate < 1:
+            raise ValueError("fltFalsePositiveRate must be between 0 and 1")
+
+        intCapacity = max(intCapacity, 1)
+        self.intBits: int = max(8, math.ceil(-intCapacity * math.log(fltFalsePositiveRate) / math.log(2) ** 2))
+        self.intHashes: int = max(1, round(self.intBits / intCapacity * math.log(2)))
+        self.arrBits: bytearray = bytearray((self.intBits + 7) // 8)
+        self.intCapacity: int = intCapacity
+        self.fltTargetRate: float = fltFalsePositiveRate
+        self.intCount: int = 0
+
+    def add(self, varValue) -> None:
+        """
+        Description:
+            Sets the k bits of a value.
+
+        Parameters:
+            varValue: The value to add, of any hashable type
+        """
+        arrBits: bytearray = self.arrBits
+        for intBit in self._fnProbes(varValue):
+            arrBits[intBit >> 3] |= 1 << (intBit & 7)
+        self.intCount += 1
+
+    def expected_false_positive_rate(self) -> float:
+        """
+        Description:
+            Estimates the current false-positive rate from the number of
+            values added, (1 - e^(-k·n/m))^k. It rises above the target once
+            more than intCapacity values have been added.
+
+        Returns:
+            float: The expected false-positive rate
+        """
+        return (1 - math.exp(-self.intHashes * self.intCount / self.intBits)) ** self.intHashes
+
+    def __contains__(self, varValue) -> bool:
+        arrBits: bytearray = self.arrBits
+        for intBit in self._fnProbes(varValue):
+            if not arrBits[intBit >> 3] & (1 << (intBit & 7)):
+                return False
+        return True
+
+    def __repr__(self) -> str:
+        return f"BloomFilter(bits={self.intBits}, hashes={self.intHashes}, count={self.intCount})"
+
+    def _fnProbes(self, varValue):
+        """
+        Description:
+            Yields the k bit positions of a value. The built-in hash is mixed
+            into 64 bits first (small ints hash to themselves), then split into
+            the two halves used for double hashing.
+        """
+        intHash: int = (hash(varValue) * 0x9E3779B97F4A7C15) & INT_MASK_64
+        intHash ^= intHash >> 31
+        intHash = (intHash * 0xBF58476D1CE4E5B9) & INT_MASK_64
+        intHash ^= intHash >> 29
+        intFirst: int = intHash & 0xFFFFFFFF
+        intStep: int = (intHash >> 32) | 1
+
+        intBits: int = self.intBits
+        for i in range(self.intHashes):
+            yield (intFirst + i * intStep) % intBits
+
+
+class BloomFilteredSearch:
+    """
+    Description:
+        Sequential search with a Bloom filter in front of it. The filter is
+        built alongside the list, and a lookup for a value the filter rules
+        out returns -1 after k hash probes instead of scanning all n elements.
+        Values that pass the filter are searched sequentially, so answers are
+        always exact. Appended values are added to the filter as well.
+
+        Hits, misses skipped by the filter and false positives (values that
+        passed the filter but were not found) are counted for stats.
+
+    Parameters:
+        arrValues (list): The values to search, of any hashable type
+        fltFalsePositiveRate (float): Target false-positive rate of the filter
+    """
+    def __init__(self, arrValues: list, fltFalsePositiveRate: float = FLT_DEFAULT_FALSE_POSITIVE_RATE):
+        self.arrValues: list = list(arrValues)
+        self.objFilter: BloomFilter = BloomFilter(len(self.arrValues), fltFalsePositiveRate)
+        for varValue in self.arrValues:
+            self.objFilter.add(varValue)
+
+        self.intHits: int = 0
+        self.intDefiniteMisses: int = 0
+        self.intFalsePositives: int = 0
+
+    def search(self, varTarget) -> int:
+        """
+        Description:
+            Finds the first occurrence of a value, skipping the scan when the
+            filter rules the value out.
+
+        Parameters:
+            varTarget: The target element to search for
+
+        Returns:
+            int: Index of the first occurrence of varTarget if found, -1 otherwise
+        """
+        if varTarget not in self.objFilter:
+            self.intDefiniteMisses += 1
+            return -1
+
+        for intIndex, varValue in enumerate(self.arrValues):
+            if varValue == varTarget:
+                self.intHits += 1
+                return intIndex
+        self.intFalsePositives += 1
+        return -1
+
+    def search_all(self, varTarget) -> list:
+        """
+        Description:
+            Finds every occurrence of a value, skipping the scan when the
+            filter rules the value out. Not counted in the statistics.
+
+        Parameters:
+            varTarget: The target element to search for
+
+        Returns:
+            list: Ascending indices of every occurrence, empty if not found
+        """
+        if varTarget not in self.objFilter:
+            return []
+        return [intIndex for intIndex, varValue in enumerate(self.arrValues) if varValue == varTarget]
+
+    def append(self, varValue) -> None:
+        """
+        Description:
+            Adds a value at the end of the list and to the filter.
+
+        Parameters:
+            varValue: The value to add
+        """
+        self.arrValues.append(varValue)
+        self.objFilter.add(varValue)
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: "hits", "definite_misses" (scans skipped), "false_positives",
+                  "observed_false_positive_rate" (share of absent values that passed
+                  the filter), "expected_false_positive_rate", "target_false_positive_rate",
+                  "filter_bytes" and "hashes"
+        """
+        intAbsent: int = self.intDefiniteMisses + self.intFalsePositives
+        return {
+            "hits": self.intHits,
+            "definite_misses": self.intDefiniteMisses,
+            "false_positives": self.intFalsePositives,
+            "observed_false_positive_rate": self.intFalsePositives / intAbsent if intAbsent else 0.0,
+            "expected_false_positive_rate": self.objFilter.expected_false_positive_rate(),
+            "target_false_positive_rate": self.objFilter.fltTargetRate,
+            "filter_bytes": len(self.objFilter.arrBits),
+            "hashes": self.objFilter.intHashes
+        }
+
+    def describe(self) -> str:
+        """
+        Returns:
+            str: Summary of stats() as one caption for the search form
+        """
+        dictStats: dict = self.stats()
+        return (f"Bloom filter of {dictStats['filter_bytes']} bytes with {dictStats['hashes']} hash probes: "
+                f"{dictStats['hits']} hits, {dictStats['definite_misses']} misses answered without a scan, "
+                f"{dictStats['false_positives']} false positives (observed rate "
+                f"{dictStats['observed_false_positive_rate']:.2%}, expected "
+                f"{dictStats['expected_false_positive_rate']:.2%}, target {dictStats['target_false_positive_rate']:.2%}).")
+
+    def __len__(self) -> int:
+        return len(self.arrValues)
+
+    def __repr__(self) -> str:
+        return f"BloomFilteredSearch(size={len(self.arrValues)}, filter={self.objFilter!r})"
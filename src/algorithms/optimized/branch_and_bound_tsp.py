@@ -1,3 +1,6 @@
+from ..greedy import fnNearestNeighborTSP
+
+
 class Node:
     """
     This represents a node in the search tree for the branch and bound TSP algorithm. It stores the current path, reduced cost matrix, total cost, current vertex, and level in the tree.
@@ -90,13 +93,14 @@ def calculate_path_cost(path, cost_matrix):
         total += cost_matrix[path[i]][path[i + 1]]
     return total
 
-def branch_and_bound_tsp(cost_matrix, start_vertex=0):
+def branch_and_bound_tsp(cost_matrix, start_vertex=0, incumbent=None):
     """
     This is the main function that solves the Traveling Salesman Problem using the branch and bound method and returns the minimum cost and the best path found.
     
     Args:
         cost_matrix (list of list of float): The cost matrix representing the graph.
         start_vertex (int): The starting vertex for the path.
+        incumbent (tuple, optional): A known tour as (path, cost), e.g. from fnNearestNeighborTSP. Nodes whose lower bound is already above its cost are pruned instead of expanded.
         
     Returns:
         tuple: (shortest_path, min_cost, all_paths)
@@ -112,19 +116,27 @@ def branch_and_bound_tsp(cost_matrix, start_vertex=0):
     initial_path = [start_vertex]
     initial_matrix = copy_matrix(cost_matrix)
     cost = reduce_matrix(initial_matrix)
-    root = Node(path = initial_path, reduced_matrix = initial_matrix, cost = cost, vertex = 0, level = 0)
+    root = Node(path = initial_path, reduced_matrix = initial_matrix, cost = cost, vertex = start_vertex, level = 0)
     priority.append(root)
     min_cost = INFINITE
     best_path = []
 
+    # Start from the known tour so worse branches can be cut right away
+    if incumbent is not None:
+        best_path, min_cost = list(incumbent[0]), incumbent[1]
+
     while priority:
         # Extract the node with the minimum cost
         min_node = priority.pop(0)
 
+        # The bound of this node already exceeds the incumbent
+        if incumbent is not None and min_node.cost > min_cost:
+            continue
+
         # If all vertices are visited, calculate the cost
         if min_node.level == length - 1:
             final_path = min_node.path + [start_vertex]
-            final_cost = min_node.cost + cost_matrix[min_node.vertex][start_vertex]
+            final_cost = calculate_path_cost(final_path, cost_matrix)
             if final_cost < INFINITE:
                 all_paths.append((final_path, final_cost))
             if final_cost < min_cost:
@@ -157,3 +169,17 @@ def branch_and_bound_tsp(cost_matrix, start_vertex=0):
         all_paths = [(best_path, min_cost)]
 
     return best_path, min_cost, all_paths
+
+def branch_and_bound_tsp_with_incumbent(cost_matrix, start_vertex=0):
+    """
+    This solves the Traveling Salesman Problem with branch and bound, starting from the nearest neighbour tour as the incumbent. Every node whose lower bound is above that tour's cost is pruned without being expanded, so the search visits fewer nodes and the list of complete paths it reports is shorter than without an incumbent.
+
+    Args:
+        cost_matrix (list of list of float): The cost matrix representing the graph.
+        start_vertex (int): The starting vertex for the path.
+
+    Returns:
+        tuple: (shortest_path, min_cost, all_paths), as returned by branch_and_bound_tsp
+    """
+    greedy_path, greedy_cost, _ = fnNearestNeighborTSP(cost_matrix, start_vertex)
+    return branch_and_bound_tsp(cost_matrix, start_vertex, incumbent=(greedy_path, greedy_cost))
@@ -1,6 +1,9 @@
-def comb_sort(intArr, ascending):
+from ..step_trace import fnTraceSort, fnStreamSort, fnDirectionalPasses
+
+
+def comb_sort(intArr, ascending, fnKey=None, boolCaseFold=False, boolLocale=False):
     """
-        This algorithm use the known bubble sort algorithm, but instead of comparing the adjacent pairs it repeatedly sort pairs of element that are a certain gap apart. This gap starts as the length of the list and is continuously reduced by diving it to 1.3 at each cycle. 
+        This algorithm use the known bubble sort algorithm, but instead of comparing the adjacent pairs it repeatedly sort pairs of element that are a certain gap apart. This gap starts as the length of the list and is continuously reduced by diving it to 1.3 at each cycle, and once it reaches 1 the passes repeat until no more swaps happen. 
 
     Reference:
         https://www.tutorchase.com/answers/a-level/computer-science/how-does-the-comb-sort-algorithm-work
@@ -9,37 +12,94 @@ def comb_sort(intArr, ascending):
     Arguments:
         intArray (list): The list of integers to be sorted
         ascending (boolean): The list is ascending if True
+        fnKey (function): Computes each element's sort key once before sorting, optional
+        boolCaseFold (boolean): Strings are compared case-insensitively if True
+        boolLocale (boolean): Strings are compared with the current locale's collation rules if True
 
     Return:
         list: The sorted list in ascending order
-        list of lists: The order of array in each step
+        SortTrace: The order of array in each step
 
     Example:
         >>>bidirectional_enhanced_selection_sort([64, 34, 25, 12, 22, 11, 90])
         [11, 12, 22, 25, 34, 64, 90]
     """
+    return fnTraceSort(_comb_sort_passes, intArr, ascending, fnKey, boolCaseFold, boolLocale)
+
+
+def comb_sort_stream(intArr, ascending, intMaxSteps=None, fnKey=None, boolCaseFold=False, boolLocale=False):
+    """
+        Streaming variant of comb_sort that yields the order of the array after each gap pass as soon as it happens instead of building the whole trace.
+
+    Arguments:
+        intArr (list): The list of integers to be sorted
+        ascending (boolean): The list is ascending if True
+        intMaxSteps (int): Maximum number of steps to yield, no limit if None
+        fnKey (function): Computes each element's sort key once before sorting, optional
+        boolCaseFold (boolean): Strings are compared case-insensitively if True
+        boolLocale (boolean): Strings are compared with the current locale's collation rules if True
+
+    Return:
+        generator: Yields each step as a list and returns the sorted list
+    """
+    return fnStreamSort(_comb_sort_passes, intArr, ascending, intMaxSteps, fnKey, boolCaseFold, boolLocale)
+
+
+def _comb_sort_ascending(intArr, fnSwap):
+    """
+        Ascending comb sort kernel. Sorts intArr in place, reports every swap through fnSwap and yields after every gap pass.
+    """
+
+    #variables
+    intLength = len(intArr)
+    intGap = int(len(intArr) / 1.3)
+
+    #loop through array, keep doing gap 1 passes until nothing moves
+    while intGap > 0:
+        boolSwapped = False
+        for i in range(intLength - intGap):
+            if(intArr[i] > intArr[i + intGap]):
+                intTemporaryContainer = intArr[i]
+                intArr[i] = intArr[i + intGap]
+                intArr[i + intGap] = intTemporaryContainer
+                fnSwap(i, i + intGap)
+                boolSwapped = True
+
+        yield
+
+        if intGap > 1:
+            intGap = int(intGap/1.3)
+        elif not boolSwapped:
+            break
+
+
+def _comb_sort_descending(intArr, fnSwap):
+    """
+        Descending comb sort kernel. Sorts intArr in place, reports every swap through fnSwap and yields after every gap pass.
+    """
 
     #variables
     intLength = len(intArr)
     intGap = int(len(intArr) / 1.3)
-    steps = []
 
-    #loop through array
+    #loop through array, keep doing gap 1 passes until nothing moves
     while intGap > 0:
+        boolSwapped = False
         for i in range(intLength - intGap):
-            if(ascending):
-                if(intArr[i] > intArr[i + intGap]):
-                    intTemporaryContainer = intArr[i]
-                    intArr[i] = intArr[i + intGap]
-                    intArr[i + intGap] = intTemporaryContainer
-            else:
-                if(intArr[i] < intArr[i + intGap]):
-                    intTemporaryContainer = intArr[i]
-                    intArr[i] = intArr[i + intGap]
-                    intArr[i + intGap] = intTemporaryContainer
-
-        intGap = int(intGap/1.3)
-        steps.append(intArr[:])
-
-
-    return intArr, steps
+            if(intArr[i] < intArr[i + intGap]):
+                intTemporaryContainer = intArr[i]
+                intArr[i] = intArr[i + intGap]
+                intArr[i + intGap] = intTemporaryContainer
+                fnSwap(i, i + intGap)
+                boolSwapped = True
+
+        yield
+
+        if intGap > 1:
+            intGap = int(intGap/1.3)
+        elif not boolSwapped:
+            break
+
+
+#the sort direction is resolved once per sort instead of once per comparison
+_comb_sort_passes = fnDirectionalPasses(_comb_sort_ascending, _comb_sort_descending)
@@ -0,0 +1,127 @@
+INT_MAX_COUNTING_RANGE: int = 1 << 16
+INT_RADIX_BITS: int = 8
+
+
+def fnDetectKeyDomain(arrInput: list) -> tuple:
+    """
+    Description:
+        Checks whether every element is an integer or every element is a
+        single character, and reports the bounds of that domain in one pass.
+
+    Parameters:
+        arrInput (list): The array to inspect
+
+    Returns:
+        tuple: (str, int, int) with the domain kind ("int" or "char") and the smallest
+               and largest key, or None if the elements do not share such a domain
+    """
+    if not arrInput:
+        return None
+
+    if all(type(varValue) is int for varValue in arrInput):
+        return "int", min(arrInput), max(arrInput)
+
+    if all(isinstance(varValue, str) and len(varValue) == 1 for varValue in arrInput):
+        arrCodes: list = [ord(strChar) for strChar in arrInput]
+        return "char", min(arrCodes), max(arrCodes)
+
+    return None
+
+
+def fnCountingSort(arrInput: list, boolAscending: bool = True) -> tuple[list, list]:
+    """
+    Description:
+        Sorts integers or single characters in O(n + k) time by counting how
+        many times each key occurs, where k is the size of the key range. When
+        the range is too wide for a count table (more than twice the input size
+        and more than INT_MAX_COUNTING_RANGE keys) it falls back to an LSD radix
+        sort that distributes the keys into 2^INT_RADIX_BITS buckets per pass.
+        Descending order is produced directly by reading the buckets backwards.
+
+    Parameters:
+        arrInput (list): The array to be sorted, all integers or all single characters
+        boolAscending (bool): Sort in ascending order if True, descending if False
+
+    Returns:
+        tuple: A tuple containing:
+            - list: The sorted array
+            - list: List of steps showing the array state after each bucket pass
+
+    Raises:
+        TypeError: If the elements are not all integers or all single characters
+
+    References:
+        https://www.geeksforgeeks.org/counting-sort/
+        https://www.geeksforgeeks.org/radix-sort/
+    """
+    if not arrInput:
+        return [], []
+
+    tupDomain: tuple = fnDetectKeyDomain(arrInput)
+    if tupDomain is None:
+        raise TypeError("fnCountingSort only sorts lists of integers or single characters")
+
+    strKind, intLow, intHigh = tupDomain
+    boolChars: bool = strKind == "char"
+    arrKeys: list = [ord(strChar) for strChar in arrInput] if boolChars else arrInput
+    intRange: int = intHigh - intLow + 1
+
+    if intRange <= max(2 * len(arrInput), INT_MAX_COUNTING_RANGE):
+        arrSorted, arrSteps = _fnCountingPass(arrKeys, intLow, intRange, boolAscending)
+    else:
+        arrSorted, arrSteps = _fnRadixPasses(arrKeys, intLow, intRange, boolAscending)
+
+    if boolChars:
+        arrSorted = [chr(intCode) for intCode in arrSorted]
+        arrSteps = [[chr(intCode) for intCode in arrStep] for arrStep in arrSteps]
+
+    return arrSorted, arrSteps
+
+
+def _fnCountingPass(arrKeys: list, intLow: int, intRange: int, boolAscending: bool) -> tuple[list, list]:
+    """
+    Description:
+        Counts every key in one pass and rebuilds the array from the counts.
+    """
+    arrCounts: list = [0] * intRange
+    for intKey in arrKeys:
+        arrCounts[intKey - intLow] += 1
+
+    arrOrder = range(intRange) if boolAscending else range(intRange - 1, -1, -1)
+    arrResult: list = []
+    for intOffset in arrOrder:
+        intCount: int = arrCounts[intOffset]
+        if intCount:
+            arrResult.extend([intOffset + intLow] * intCount)
+
+    return arrResult, [arrResult.copy()]
+
+
+def _fnRadixPasses(arrKeys: list, intLow: int, intRange: int, boolAscending: bool) -> tuple[list, list]:
+    """
+    Description:
+        Stable LSD radix sort of the keys shifted to start at zero, one bucket
+        pass per INT_RADIX_BITS-wide digit.
+    """
+    intBuckets: int = 1 << INT_RADIX_BITS
+    intMask: int = intBuckets - 1
+    arrResult: list = [intKey - intLow for intKey in arrKeys]
+    arrSteps: list = []
+
+    intShift: int = 0
+    while (intRange - 1) >> intShift:
+        arrBuckets: list = [[] for _ in range(intBuckets)]
+        for intKey in arrResult:
+            arrBuckets[(intKey >> intShift) & intMask].append(intKey)
+
+        if not boolAscending:
+            arrBuckets.reverse()
+
+        arrResult = []
+        for arrBucket in arrBuckets:
+            arrResult.extend(arrBucket)
+
+        arrSteps.append([intKey + intLow for intKey in arrResult])
+        intShift += INT_RADIX_BITS
+
+    return [intKey + intLow for intKey in arrResult], arrSteps
@@ -1,89 +1,111 @@
-def dynamic_programming_knapsack(arrItems: list, intMaxCapacity: int) -> tuple[list, int, list]:
+# Valid subsets are only listed for up to this many items, since there are 2^n of them
+INT_ENUMERATE_MAX_ITEMS: int = 20
+
+
+def dynamic_programming_knapsack(arrItems: list, intMaxCapacity: int, boolEnumerate: bool = None) -> tuple[list, int, list]:
     """
     Description:
-        This function solves the Knapsack Problem using a dynamic programming approach. 
-        It creates a 2d table where each cell represents the best value achievable 
-        using a subset of items within a given capacity.
+        This function solves the Knapsack Problem using dynamic programming in
+        O(n·W) time for n items and capacity W. A single row best[w] holds the
+        best value achievable within capacity w using the items seen so far.
+        Each item updates the row from the largest capacity down, so every
+        cell still reads the value from before the item was considered, and
+        the capacities where taking the item improved the value are recorded
+        in one bytearray per item. Walking these decisions back from
+        capacity W reconstructs the chosen items, so memory is O(W) for the
+        values plus n·W bytes for the decisions.
+
+        The capacity is clamped to the total weight of the items, since no
+        subset can use more. When 2^n < n·W, checking every subset is
+        cheaper than the table, so the best subset is taken from the
+        enumeration instead.
+
+        Listing every valid subset takes O(2^n) and is optional. By default
+        it is only done for up to INT_ENUMERATE_MAX_ITEMS items; otherwise
+        the list only contains the optimal subset.
 
     Parameters:
         arrItems (list): List of tuples (name: str, weight: int, value: int)
         intMaxCapacity (int): Maximum weight capacity of knapsack
+        boolEnumerate (bool, optional): List all valid subsets if True, only the optimal one
+                                        if False. Defaults to n <= INT_ENUMERATE_MAX_ITEMS.
 
     Returns:
         tuple: A tuple containing:
             - list: Names of items in the best combination
             - int: Total value of the best combination
-            - list: All valid combinations with their weights and values as (items, weight, value)
+            - list: Valid combinations with their weights and values as (items, weight, value),
+                    sorted by size, then value (descending) and weight (ascending)
 
     References:
         https://www.geeksforgeeks.org/0-1-knapsack-problem-dp-10/
     """
-    # Extract item properties
     length = len(arrItems)
-    weights = [item[1] for item in arrItems]  # weight is second element
-    values = [item[2] for item in arrItems]   # value is third element
-    all_valid_subsets = []
+    capacity = min(max(intMaxCapacity, 0), sum(weight for _, weight, _ in arrItems))
+    if boolEnumerate is None:
+        boolEnumerate = length <= INT_ENUMERATE_MAX_ITEMS
+
+    # Few items and a large capacity: the 2^n subsets are fewer than the n·W table cells
+    if (1 << length) < length * capacity:
+        all_valid_subsets = _enumerate_valid_subsets(arrItems, capacity)
+        best_subset, best_weight, best_value = max(all_valid_subsets, key=lambda subset: (subset[2], -subset[1]))
+        if not boolEnumerate:
+            return best_subset, best_value, [(best_subset, best_weight, best_value)]
+        return best_subset, best_value, all_valid_subsets
+
+    # best[w]: best value within capacity w; taken[i][w]: item i was taken at capacity w
+    best = [0] * (capacity + 1)
+    taken = []
+    for _, weight, value in arrItems:
+        decisions = bytearray(capacity + 1)
+        # Descending capacities read best[w - weight] before this item could update it
+        for w in range(capacity, weight - 1, -1):
+            candidate = best[w - weight] + value
+            if candidate > best[w]:
+                best[w] = candidate
+                decisions[w] = 1
+        taken.append(decisions)
+
+    # Reconstruct the best combination from the last item back
+    best_subset = []
+    best_weight = 0
+    w = capacity
+    for item_index in range(length - 1, -1, -1):
+        if taken[item_index][w]:
+            name, weight, _ = arrItems[item_index]
+            best_subset.append(name)
+            best_weight += weight
+            w -= weight
+    best_subset.reverse()
+    best_value = best[capacity]
 
-    # Add empty subset first
-    all_valid_subsets.append(([], 0, 0))
+    if not boolEnumerate:
+        return best_subset, best_value, [(best_subset, best_weight, best_value)]
+    return best_subset, best_value, _enumerate_valid_subsets(arrItems, capacity)
 
-    # Generate all possible subsets using bit manipulation
-    max_subsets = 1 << length
-    subset_index = 1  # Start from 1 since we already added empty subset
 
-    while subset_index < max_subsets:
+def _enumerate_valid_subsets(arrItems: list, intMaxCapacity: int) -> list:
+    """
+    Description:
+        Lists every subset of the items that fits in the capacity, with the
+        empty subset first, using bit masks over the item indices.
+    """
+    length = len(arrItems)
+    all_valid_subsets = []
+
+    for subset_index in range(1 << length):
         current_subset = []
         current_weight = 0
         current_value = 0
-        item_index = 0
-
-        # Check each bit position
-        while item_index < length:
+        for item_index in range(length):
             if subset_index & (1 << item_index):
-                current_subset.append(arrItems[item_index][0])  # Add item name
-                current_weight += weights[item_index]
-                current_value += values[item_index]
-            item_index += 1
+                name, weight, value = arrItems[item_index]
+                current_subset.append(name)
+                current_weight += weight
+                current_value += value
 
-        # Add valid subsets to the list
         if current_weight <= intMaxCapacity:
             all_valid_subsets.append((current_subset, current_weight, current_value))
 
-        subset_index += 1
-
-    # Sort valid subsets by length first, then by value (descending) and weight (ascending)
-    outer_index = 1  # Start from 1 to keep empty subset at the beginning
-    while outer_index < len(all_valid_subsets):
-        inner_index = 1
-        while inner_index < len(all_valid_subsets) - outer_index:
-            current = all_valid_subsets[inner_index]
-            next_subset = all_valid_subsets[inner_index + 1]
-            
-            # Compare by length first
-            if len(current[0]) > len(next_subset[0]) or (
-                len(current[0]) == len(next_subset[0]) and (
-                    # Then by value (descending)
-                    current[2] < next_subset[2] or (
-                        current[2] == next_subset[2] and 
-                        # Then by weight (ascending)
-                        current[1] > next_subset[1]
-                    )
-                )
-            ):
-                all_valid_subsets[inner_index], all_valid_subsets[inner_index + 1] = (
-                    all_valid_subsets[inner_index + 1], all_valid_subsets[inner_index]
-                )
-            inner_index += 1
-        outer_index += 1
-
-    # Get the optimal solution (highest value subset)
-    best_subset = []
-    best_value = 0
-    
-    # Find the best non-empty subset
-    for subset, weight, value in all_valid_subsets:
-        if len(subset) > 0 and value > best_value:
-            best_subset = subset
-            best_value = value
-
-    return best_subset, best_value, all_valid_subsets
+    # By length first, then by value (descending) and weight (ascending); the empty subset stays first
+    return sorted(all_valid_subsets, key=lambda subset: (len(subset[0]), -subset[2], subset[1]))
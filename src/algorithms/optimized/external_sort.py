@@ -0,0 +1,191 @@
+from array import array
+import heapq
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+
+from .comb_sort import comb_sort_stream
+from .parallel_sort import fnBuildMergeKey
+
+INT_DEFAULT_MEMORY_BUDGET: int = 64 * 1024 * 1024
+# Bytes of a list slot that points at each record
+INT_LIST_SLOT_BYTES: int = 8
+
+DICT_RECORD_PARSERS: dict = {
+    "int": int,
+    "float": float,
+    "str": str
+}
+# array typecodes of the fixed-width run formats for numeric records
+DICT_RUN_TYPECODES: dict = {
+    "int": "q",
+    "float": "d"
+}
+STRUCT_LENGTH_PREFIX = struct.Struct("<I")
+
+
+def fnExternalSort(strInputPath: str, strOutputPath: str, strRecordType: str = "int",
+                   intMemoryBudget: int = INT_DEFAULT_MEMORY_BUDGET, boolAscending: bool = True,
+                   fnStreamFunction=comb_sort_stream, boolCaseFold: bool = False, strTempDir: str = None) -> dict:
+    """
+    Description:
+        Sorts a text file with one record per line that may be larger than
+        RAM. The file is read in chunks that fit in the memory budget, every
+        chunk is sorted in place with a project streaming sort, run without
+        recording any steps, and spilled to a temporary binary
+        run file, and the runs are then merged with a heap-based k-way merge
+        that reads them through memory maps and streams the result straight
+        into the output file. Only one chunk and one record per run are held
+        in Python objects at any time.
+
+    Parameters:
+        strInputPath (str): Path of the text file to sort, one record per line
+        strOutputPath (str): Path of the text file to write the sorted records to
+        strRecordType (str): "int" (64-bit signed), "float" or "str"
+        intMemoryBudget (int): Approximate number of bytes the in-memory chunk may use.
+                               Half of it is reserved for the chunk sort's own working memory.
+        boolAscending (bool): Sort in ascending order if True, descending if False
+        fnStreamFunction (callable): Project streaming sort taking (list, bool, intMaxSteps, boolCaseFold=...),
+                                     such as comb_sort_stream. It is run with intMaxSteps=0, so no step is kept.
+        boolCaseFold (bool): Fold the case of strings. The same value is given to fnStreamFunction
+                             and to the merge, so both order the records alike.
+        strTempDir (str, optional): Directory for the temporary run files. Defaults to the system temp dir.
+
+    Returns:
+        dict: Statistics with keys "records", "runs", "run_bytes", "sort_seconds",
+              "merge_seconds" and "total_seconds"
+
+    Raises:
+        ValueError: If strRecordType is not supported or the budget is not positive
+
+    References:
+        https://en.wikipedia.org/wiki/External_sorting
+    """
+    if strRecordType not in DICT_RECORD_PARSERS:
+        raise ValueError(f"strRecordType must be one of {', '.join(DICT_RECORD_PARSERS)}")
+    if intMemoryBudget <= 0:
+        raise ValueError("intMemoryBudget must be a positive number of bytes")
+
+    fltStart: float = time.perf_counter()
+    fnParse = DICT_RECORD_PARSERS[strRecordType]
+    intChunkBudget: int = max(intMemoryBudget // 2, 1)
+    # Case folding is always passed, since the project sorts disagree on its default
+    dictSortOptions: dict = {"boolCaseFold": boolCaseFold}
+    intRecords: int = 0
+    intRunBytes: int = 0
+
+    with tempfile.TemporaryDirectory(dir=strTempDir) as strRunDir:
+        arrRunPaths: list = []
+        arrChunk: list = []
+        intChunkBytes: int = 0
+
+        # Run generation phase
+        with open(strInputPath, "r", encoding="utf-8") as objInput:
+            for strLine in objInput:
+                strLine = strLine.rstrip("\r\n")
+                if not strLine and strRecordType != "str":
+                    continue
+                varRecord = fnParse(strLine)
+                arrChunk.append(varRecord)
+                intChunkBytes += sys.getsizeof(varRecord) + INT_LIST_SLOT_BYTES
+
+                if intChunkBytes >= intChunkBudget:
+                    intRunBytes += _fnSpillRun(arrChunk, strRecordType, boolAscending, fnStreamFunction,
+                                               dictSortOptions, strRunDir, arrRunPaths)
+                    intRecords += len(arrChunk)
+                    arrChunk = []
+                    intChunkBytes = 0
+
+        if arrChunk:
+            intRunBytes += _fnSpillRun(arrChunk, strRecordType, boolAscending, fnStreamFunction,
+                                       dictSortOptions, strRunDir, arrRunPaths)
+            intRecords += len(arrChunk)
+            arrChunk = []
+        fltRunsDone: float = time.perf_counter()
+
+        # Merge phase
+        fnMergeKey = fnBuildMergeKey(None, boolCaseFold)
+        arrReaders: list = [_fnReadRun(strRunPath, strRecordType) for strRunPath in arrRunPaths]
+        try:
+            with open(strOutputPath, "w", encoding="utf-8") as objOutput:
+                for varRecord in heapq.merge(*arrReaders, key=fnMergeKey, reverse=not boolAscending):
+                    objOutput.write(f"{varRecord}\n")
+        finally:
+            for genReader in arrReaders:
+                genReader.close()
+        fltMergeDone: float = time.perf_counter()
+
+    return {
+        "records": intRecords,
+        "runs": len(arrRunPaths),
+        "run_bytes": intRunBytes,
+        "sort_seconds": fltRunsDone - fltStart,
+        "merge_seconds": fltMergeDone - fltRunsDone,
+        "total_seconds": fltMergeDone - fltStart
+    }
+
+
+def _fnSpillRun(arrChunk: list, strRecordType: str, boolAscending: bool, fnStreamFunction,
+                dictSortOptions: dict, strRunDir: str, arrRunPaths: list) -> int:
+    """
+    Description:
+        Sorts one chunk with the project sort and writes it to a new binary run
+        file. Numbers are stored as fixed-width machine values, strings as a
+        4-byte length prefix followed by their UTF-8 bytes. Returns the number
+        of bytes written.
+    """
+    # No step is yielded, so the sort keeps no trace or snapshots beyond the chunk itself
+    genSort = fnStreamFunction(arrChunk, boolAscending, 0, **dictSortOptions)
+    while True:
+        try:
+            next(genSort)
+        except StopIteration as objStop:
+            arrSorted: list = objStop.value
+            break
+    strRunPath: str = os.path.join(strRunDir, f"run_{len(arrRunPaths):06d}.bin")
+
+    with open(strRunPath, "wb") as objRun:
+        if strRecordType in DICT_RUN_TYPECODES:
+            array(DICT_RUN_TYPECODES[strRecordType], arrSorted).tofile(objRun)
+        else:
+            for strRecord in arrSorted:
+                bytesRecord: bytes = strRecord.encode("utf-8")
+                objRun.write(STRUCT_LENGTH_PREFIX.pack(len(bytesRecord)))
+                objRun.write(bytesRecord)
+
+    arrRunPaths.append(strRunPath)
+    return os.path.getsize(strRunPath)
+
+
+def _fnReadRun(strRunPath: str, strRecordType: str):
+    """
+    Description:
+        Generator that streams the records of one run file through a read-only
+        memory map, so the operating system pages the run in on demand.
+    """
+    if os.path.getsize(strRunPath) == 0:
+        return
+
+    with open(strRunPath, "rb") as objRun:
+        objMap = mmap.mmap(objRun.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        if strRecordType in DICT_RUN_TYPECODES:
+            objView = memoryview(objMap).cast(DICT_RUN_TYPECODES[strRecordType])
+            try:
+                yield from objView
+            finally:
+                objView.release()
+        else:
+            intOffset: int = 0
+            intSize: int = len(objMap)
+            while intOffset < intSize:
+                (intLength,) = STRUCT_LENGTH_PREFIX.unpack_from(objMap, intOffset)
+                intOffset += STRUCT_LENGTH_PREFIX.size
+                yield objMap[intOffset:intOffset + intLength].decode("utf-8")
+                intOffset += intLength
+    finally:
+        objMap.close()
@@ -0,0 +1,267 @@
+from bisect import bisect_left, insort
+import math
+import sys
+import time
+
+
+class IndexedSearch:
+    """
+    Description:
+        Search engine for a list that is queried many times. A hash index
+        from every value to the sorted list of its positions is built once in
+        O(n), after which the first occurrence, all occurrences and the count
+        of a value are found in O(1) instead of an O(n) sequential scan.
+
+        The engine keeps its own copy of the list. Changes made through set,
+        append, swap and move update only the index entries of the positions
+        that changed, and sync brings the index in line with a list that was
+        reordered elsewhere, such as by a self-organizing search, by comparing
+        it position by position with the copy.
+
+        The build time and the index size are measured when the index is
+        built, together with the time of one full sequential scan, so stats
+        can report after how many queries the index has paid for itself.
+
+    Parameters:
+        arrValues (list): The values to index, of any hashable type
+
+    Example:
+        >>> objEngine = IndexedSearch([4, 7, 4])
+        >>> objEngine.search(4), objEngine.search_all(4), objEngine.search(5)
+        (0, [0, 2], -1)
+    """
+    def __init__(self, arrValues: list):
+        self.arrValues: list = list(arrValues)
+
+        fltStart: float = time.perf_counter()
+        # value: ascending positions of that value
+        self.dictPositions: dict = {}
+        for intIndex, varValue in enumerate(self.arrValues):
+            arrPositions: list = self.dictPositions.get(varValue)
+            if arrPositions is None:
+                self.dictPositions[varValue] = [intIndex]
+            else:
+                arrPositions.append(intIndex)
+        self.fltBuildSeconds: float = time.perf_counter() - fltStart
+
+        self.fltScanSeconds: float = self._fnTimeScan()
+
+    def search(self, varTarget) -> int:
+        """
+        Description:
+            Finds the first occurrence of a value in O(1).
+
+        Parameters:
+            varTarget: The target element to search for
+
+        Returns:
+            int: Index of the first occurrence of varTarget if found, -1 otherwise
+        """
+        arrPositions: list = self.dictPositions.get(varTarget)
+        return arrPositions[0] if arrPositions else -1
+
+    def search_all(self, varTarget) -> list:
+        """
+        Description:
+            Finds every occurrence of a value.
+
+        Parameters:
+            varTarget: The target element to search for
+
+        Returns:
+            list: Ascending indices of every occurrence, empty if not found
+        """
+        return list(self.dictPositions.get(varTarget, ()))
+
+    def count(self, varTarget) -> int:
+        """
+        Description:
+            Counts the occurrences of a value in O(1).
+
+        Parameters:
+            varTarget: The target element to count
+
+        Returns:
+            int: Number of occurrences of varTarget
+        """
+        return len(self.dictPositions.get(varTarget, ()))
+
+    def set(self, intIndex: int, varValue) -> None:
+        """
+        Description:
+            Replaces the value at one position, moving that position from the
+            old value's index entry to the new one. The position is found by
+            binary search, but removing it from and inserting it into the
+            sorted position lists shifts their entries, so the update takes
+            O(k) for values that occur k times.
+
+        Parameters:
+            intIndex (int): The position to overwrite
+            varValue: The new value
+        """
+        varOld = self.arrValues[intIndex]
+        if varOld == varValue:
+            return
+
+        arrPositions: list = self.dictPositions[varOld]
+        del arrPositions[bisect_left(arrPositions, intIndex)]
+        if not arrPositions:
+            del self.dictPositions[varOld]
+
+        self.arrValues[intIndex] = varValue
+        arrPositions = self.dictPositions.get(varValue)
+        if arrPositions is None:
+            self.dictPositions[varValue] = [intIndex]
+        else:
+            insort(arrPositions, intIndex)
+
+    def append(self, varValue) -> None:
+        """
+        Description:
+            Adds a value at the end of the list in O(1).
+
+        Parameters:
+            varValue: The value to add
+        """
+        self.arrValues.append(varValue)
+        self.dictPositions.setdefault(varValue, []).append(len(self.arrValues) - 1)
+
+    def swap(self, i: int, j: int) -> None:
+        """
+        Description:
+            Swaps two positions, as the transpose heuristic of a
+            self-organizing list does.
+
+        Parameters:
+            i (int): Index of the first element
+            j (int): Index of the second element
+        """
+        varFirst = self.arrValues[i]
+        self.set(i, self.arrValues[j])
+        self.set(j, varFirst)
+
+    def move(self, intFrom: int, intTo: int) -> None:
+        """
+        Description:
+            Moves one element to another position and shifts the elements in
+            between by one, as the move-to-front heuristic of a self-organizing
+            list does. The values are shifted in place and only the positions
+            between intFrom and intTo are reindexed: every shifted element's
+            position is found by binary search and overwritten with its
+            neighbour, which keeps the position list sorted.
+
+        Parameters:
+            intFrom (int): Current index of the element
+            intTo (int): Index the element ends up at
+        """
+        if intFrom == intTo:
+            return
+        arrValues: list = self.arrValues
+        dictPositions: dict = self.dictPositions
+        varMoved = arrValues[intFrom]
+        arrPositions: list = dictPositions[varMoved]
+        del arrPositions[bisect_left(arrPositions, intFrom)]
+
+        # Shifting towards the far end first frees each target slot before it is written
+        intStep: int = 1 if intTo < intFrom else -1
+        for intIndex in range(intFrom - intStep, intTo - intStep, -intStep):
+            varValue = arrValues[intIndex]
+            arrValues[intIndex + intStep] = varValue
+            arrPositions = dictPositions[varValue]
+            arrPositions[bisect_left(arrPositions, intIndex)] = intIndex + intStep
+
+        arrValues[intTo] = varMoved
+        insort(dictPositions[varMoved], intTo)
+
+    def sync(self, arrValues: list) -> int:
+        """
+        Description:
+            Updates the index to a new version of the list, reindexing only
+            the positions whose value changed. Positions past the end of the
+            shorter list are dropped or appended.
+
+        Parameters:
+            arrValues (list): The current contents of the list
+
+        Returns:
+            int: Number of positions that were reindexed
+        """
+        intChanged: int = 0
+        intCommon: int = min(len(arrValues), len(self.arrValues))
+        for intIndex in range(intCommon):
+            if self.arrValues[intIndex] != arrValues[intIndex]:
+                self.set(intIndex, arrValues[intIndex])
+                intChanged += 1
+
+        while len(self.arrValues) > len(arrValues):
+            varValue = self.arrValues.pop()
+            arrPositions: list = self.dictPositions[varValue]
+            arrPositions.pop()
+            if not arrPositions:
+                del self.dictPositions[varValue]
+            intChanged += 1
+        for varValue in arrValues[intCommon:]:
+            self.append(varValue)
+            intChanged += 1
+        return intChanged
+
+    def stats(self) -> dict:
+        """
+        Description:
+            Reports what the index costs against a sequential scan. A search
+            for a value that is present scans half of the list on average, so
+            the index has paid for its build time once it has answered
+            build time / (scan time / 2) queries.
+
+        Returns:
+            dict: "build_seconds", "index_bytes" (approximate size of the index),
+                  "distinct_values", "scan_seconds" (one full sequential scan) and
+                  "break_even_queries"
+        """
+        intBytes: int = sys.getsizeof(self.dictPositions)
+        for arrPositions in self.dictPositions.values():
+            intBytes += sys.getsizeof(arrPositions)
+            # Small ints are shared by the interpreter, larger positions are separate objects
+            intBytes += sum(sys.getsizeof(intIndex) for intIndex in arrPositions if intIndex > 256)
+
+        intBreakEven: int = 1
+        if self.fltScanSeconds > 0:
+            intBreakEven = max(1, math.ceil(self.fltBuildSeconds / (self.fltScanSeconds / 2)))
+
+        return {
+            "build_seconds": self.fltBuildSeconds,
+            "index_bytes": intBytes,
+            "distinct_values": len(self.dictPositions),
+            "scan_seconds": self.fltScanSeconds,
+            "break_even_queries": intBreakEven
+        }
+
+    def describe(self) -> str:
+        """
+        Returns:
+            str: Summary of stats() as one caption for the search form
+        """
+        dictStats: dict = self.stats()
+        return (f"Index built in {dictStats['build_seconds'] * 1000:.3f} ms using about "
+                f"{dictStats['index_bytes'] / 1024:.1f} KB for {dictStats['distinct_values']} distinct values. "
+                f"A full sequential scan takes {dictStats['scan_seconds'] * 1000:.3f} ms, so the index pays off "
+                f"after {dictStats['break_even_queries']} queries.")
+
+    def __len__(self) -> int:
+        return len(self.arrValues)
+
+    def __repr__(self) -> str:
+        return f"IndexedSearch(size={len(self.arrValues)}, distinct={len(self.dictPositions)})"
+
+    def _fnTimeScan(self) -> float:
+        """
+        Description:
+            Times one sequential scan over the whole list for a value that is
+            not in it.
+        """
+        objMissing: object = object()
+        fltStart: float = time.perf_counter()
+        for varValue in self.arrValues:
+            if varValue == objMissing:
+                break
+        return time.perf_counter() - fltStart
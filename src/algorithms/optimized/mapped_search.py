@@ -0,0 +1,356 @@
+import mmap
+import os
+import time
+
+import numpy as np
+
+from ..brute_force.linear_search import fnLinearSearch
+
+# Scans that MappedColumnSearch can run over each window
+TUP_SCANS: tuple = ("vectorized", "sentinel", "linear")
+INT_DEFAULT_MEMORY_BUDGET: int = 16 * 1024 * 1024
+# Approximate bytes of one element unpacked into a Python list: the int object and its list slot
+INT_PYTHON_ELEMENT_BYTES: int = 40
+INT_SAMPLE_CHUNK: int = 1 << 20
+
+
+class MappedColumnSearch:
+    """
+    Description:
+        Sequential search over a column of fixed-width integers stored in a
+        file, either raw machine values or a one-dimensional .npy file. The
+        file is opened through a read-only memory map viewed as a NumPy
+        array, so opening it reads nothing, and the scans walk it in
+        fixed-size windows: only the window being scanned is paged in and
+        turned into working data, and the pages of each window are released
+        with madvise(MADV_DONTNEED) once it has been scanned, where the
+        platform supports it. A column of several gigabytes is therefore
+        searched within a memory budget of a few megabytes.
+
+        The window size follows from the memory budget and the scan:
+
+        - "vectorized" compares a whole window with NumPy, needing the
+          window's bytes plus one byte per element for the match mask
+        - "sentinel" and "linear" unpack the window into a Python list and
+          run the project's sentinel and bounds-checked loops over it, which
+          costs about INT_PYTHON_ELEMENT_BYTES per element
+
+        Targets that the column's dtype cannot hold, such as 1.5 or a value
+        out of range, are reported as not found without reading the file.
+
+    Parameters:
+        strPath (str): Path of the column file; files ending in .npy are read with their own header
+        strDtype (str): NumPy dtype of a raw column, such as "int32" or "<u8". Ignored for .npy files.
+        intMemoryBudget (int): Approximate bytes the working data of one window may use
+        strScan (str): One of "vectorized", "sentinel" or "linear"
+
+    Raises:
+        ValueError: If the scan or dtype is not supported, or the file size is not a
+                    multiple of the element size
+        OSError: If the file cannot be opened
+
+    Example:
+        >>> fnWriteRandomColumn("column.bin", 1000, 1, 100)
+        >>> objEngine = MappedColumnSearch("column.bin", "int64", strScan="sentinel")
+        >>> objEngine.count(42) == len(objEngine.search_all(42))
+        True
+    """
+    def __init__(self, strPath: str, strDtype: str = "int64", intMemoryBudget: int = INT_DEFAULT_MEMORY_BUDGET,
+                 strScan: str = "vectorized"):
+        if strScan not in TUP_SCANS:
+            raise ValueError(f"strScan must be one of {', '.join(TUP_SCANS)}")
+
+        if strPath.endswith(".npy"):
+            # Only the header is read here; the data is mapped below
+            arrHeader = np.load(strPath, mmap_mode="r")
+            if arrHeader.ndim != 1:
+                raise ValueError("MappedColumnSearch needs a one-dimensional .npy column")
+            objDtype = arrHeader.dtype
+            intOffset: int = arrHeader.offset
+            del arrHeader
+        else:
+            objDtype = np.dtype(strDtype)
+            intOffset = 0
+        if objDtype.kind not in "iu":
+            raise ValueError("MappedColumnSearch needs a column of fixed-width integers")
+
+        intDataBytes: int = os.path.getsize(strPath) - intOffset
+        if intDataBytes % objDtype.itemsize:
+            raise ValueError(f"File size {intDataBytes} is not a multiple of the {objDtype} element size")
+        self.objMap = None
+        # An empty file cannot be mapped
+        if intDataBytes:
+            with open(strPath, "rb") as objFile:
+                self.objMap = mmap.mmap(objFile.fileno(), 0, access=mmap.ACCESS_READ)
+            self.arrData: np.ndarray = np.frombuffer(self.objMap, dtype=objDtype,
+                                                     count=intDataBytes // objDtype.itemsize, offset=intOffset)
+        else:
+            self.arrData = np.empty(0, dtype=objDtype)
+        self.intOffset: int = intOffset
+        self.strPath: str = strPath
+        self.strScan: str = strScan
+        intElementBytes: int = (self.arrData.itemsize + 1 if strScan == "vectorized"
+                                else self.arrData.itemsize + INT_PYTHON_ELEMENT_BYTES)
+        self.intWindow: int = max(intMemoryBudget // intElementBytes, 1)
+
+        self.intLastWindows: int = 0
+        self.fltLastSeconds: float = 0.0
+
+    def search(self, varTarget) -> int:
+        """
+        Description:
+            Finds the first occurrence of a value, stopping at the first window
+            that contains it.
+
+        Parameters:
+            varTarget: The target integer to search for
+
+        Returns:
+            int: Index of the first occurrence of varTarget if found, -1 otherwise
+        """
+        arrIndices: list = self._fnScan(varTarget, intLimit=1)
+        return arrIndices[0] if arrIndices else -1
+
+    def search_all(self, varTarget, intLimit: int = None) -> list:
+        """
+        Description:
+            Finds every occurrence of a value, or only the first intLimit of
+            them. The scan stops at the window where the limit is reached, so
+            a limited query reads and keeps no more than it returns.
+
+        Parameters:
+            varTarget: The target integer to search for
+            intLimit (int, optional): Largest number of indices to return. Defaults to all.
+
+        Returns:
+            list: Ascending indices of the occurrences, empty if not found
+        """
+        return self._fnScan(varTarget, intLimit=intLimit)
+
+    def count(self, varTarget) -> int:
+        """
+        Description:
+            Counts the occurrences of a value. Only the count of each window is
+            kept, not the positions.
+
+        Parameters:
+            varTarget: The target integer to count
+
+        Returns:
+            int: Number of occurrences of varTarget
+        """
+        return self._fnScan(varTarget, boolCount=True)
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: "backend", "file_bytes", "window_elements", "window_bytes" (file bytes
+                  per window), "windows" (windows read by the last query) and "seconds"
+                  (time of the last query)
+        """
+        return {
+            "backend": f"memory-mapped {self.arrData.dtype} column ({self.strScan} scan)",
+            "file_bytes": self.arrData.nbytes,
+            "window_elements": self.intWindow,
+            "window_bytes": self.intWindow * self.arrData.itemsize,
+            "windows": self.intLastWindows,
+            "seconds": self.fltLastSeconds
+        }
+
+    def describe(self) -> str:
+        """
+        Returns:
+            str: Summary of stats() as one caption for the search form
+        """
+        dictStats: dict = self.stats()
+        return (f"Searched {len(self)} values ({dictStats['file_bytes'] / 1024 ** 2:.1f} MB) with the "
+                f"{dictStats['backend']} in {dictStats['seconds'] * 1000:.1f} ms, reading {dictStats['windows']} "
+                f"window(s) of {dictStats['window_elements']} values.")
+
+    def close(self) -> None:
+        """
+        Description:
+            Unmaps the file. The engine answers no queries afterwards.
+        """
+        self.arrData = np.empty(0, dtype=self.arrData.dtype)
+        if self.objMap is not None:
+            self.objMap.close()
+            self.objMap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.arrData)
+
+    def __repr__(self) -> str:
+        return f"MappedColumnSearch(path={self.strPath!r}, dtype={self.arrData.dtype}, scan={self.strScan!r})"
+
+    def _fnScan(self, varTarget, intLimit: int = None, boolCount: bool = False):
+        """
+        Description:
+            Runs the scan over the windows in order and collects the global
+            indices of the matches until intLimit of them are found, or their
+            number if boolCount is set.
+        """
+        fltStart: float = time.perf_counter()
+        self.intLastWindows = 0
+        arrIndices: list = []
+        intCount: int = 0
+
+        intTarget = self._fnCoerce(varTarget)
+        if intTarget is not None:
+            for intStart in range(0, len(self.arrData), self.intWindow):
+                if intLimit is not None and len(arrIndices) >= intLimit:
+                    break
+                self.intLastWindows += 1
+                arrWindow: np.ndarray = self.arrData[intStart:intStart + self.intWindow]
+                if boolCount:
+                    intCount += self._fnCountWindow(arrWindow, intTarget)
+                else:
+                    intRemaining: int = None if intLimit is None else intLimit - len(arrIndices)
+                    arrLocal: list = self._fnScanWindow(arrWindow, intTarget, intRemaining)
+                    arrIndices.extend(intStart + intIndex for intIndex in arrLocal)
+                del arrWindow
+                self._fnRelease(intStart, intStart + self.intWindow)
+
+        self.fltLastSeconds = time.perf_counter() - fltStart
+        return intCount if boolCount else arrIndices
+
+    def _fnCountWindow(self, arrWindow: np.ndarray, intTarget: int) -> int:
+        """
+        Description:
+            Counts the occurrences of intTarget in the window without keeping
+            their indices, so a frequent value needs no more memory than a
+            rare one.
+        """
+        if self.strScan == "vectorized":
+            return int(np.count_nonzero(arrWindow == intTarget))
+
+        arrValues: list = arrWindow.tolist()
+        intCount: int = 0
+        if self.strScan == "linear":
+            for intIndex in range(len(arrValues)):
+                if arrValues[intIndex] == intTarget:
+                    intCount += 1
+            return intCount
+
+        # Sentinel scan: the target in the slot after the window stops every pass
+        intSize: int = len(arrValues)
+        arrValues.append(intTarget)
+        intIndex: int = 0
+        while True:
+            while arrValues[intIndex] != intTarget:
+                intIndex += 1
+            if intIndex == intSize:
+                return intCount
+            intCount += 1
+            intIndex += 1
+
+    def _fnScanWindow(self, arrWindow: np.ndarray, intTarget: int, intLimit: int = None) -> list:
+        """
+        Description:
+            Returns the window-local indices of intTarget, at most intLimit of
+            them if it is given.
+        """
+        if self.strScan == "vectorized":
+            arrMatches: np.ndarray = arrWindow == intTarget
+            if intLimit == 1:
+                intIndex: int = int(np.argmax(arrMatches))
+                return [intIndex] if arrMatches[intIndex] else []
+            return np.flatnonzero(arrMatches)[:intLimit].tolist()
+
+        arrValues: list = arrWindow.tolist()
+        if self.strScan == "linear":
+            if intLimit == 1:
+                intIndex = fnLinearSearch(arrValues, intTarget)
+                return [intIndex] if intIndex != -1 else []
+            arrLocal: list = []
+            for intIndex in range(len(arrValues)):
+                if arrValues[intIndex] == intTarget:
+                    arrLocal.append(intIndex)
+                    if len(arrLocal) == intLimit:
+                        break
+            return arrLocal
+
+        # Sentinel scan: the target in the slot after the window stops every pass
+        intSize: int = len(arrValues)
+        arrValues.append(intTarget)
+        arrLocal = []
+        intIndex = 0
+        while True:
+            while arrValues[intIndex] != intTarget:
+                intIndex += 1
+            if intIndex == intSize:
+                return arrLocal
+            arrLocal.append(intIndex)
+            if len(arrLocal) == intLimit:
+                return arrLocal
+            intIndex += 1
+
+    def _fnRelease(self, intStart: int, intStop: int) -> None:
+        """
+        Description:
+            Lets the operating system drop the pages of the elements from
+            intStart to intStop. The mapping is read-only, so released pages
+            are simply read from the file again if they are needed later.
+        """
+        if self.objMap is None or not hasattr(mmap, "MADV_DONTNEED"):
+            return
+        intItemSize: int = self.arrData.itemsize
+        intFirstByte: int = self.intOffset + intStart * intItemSize
+        intFirstByte -= intFirstByte % mmap.PAGESIZE
+        intLastByte: int = min(self.intOffset + intStop * intItemSize, len(self.objMap))
+        self.objMap.madvise(mmap.MADV_DONTNEED, intFirstByte, intLastByte - intFirstByte)
+
+    def _fnCoerce(self, varTarget):
+        """
+        Description:
+            Returns varTarget as an int the column's dtype can hold, or None if
+            no element can equal it.
+        """
+        if isinstance(varTarget, (bool, np.bool_)):
+            return None
+        if isinstance(varTarget, (float, np.floating)):
+            if not float(varTarget).is_integer():
+                return None
+            varTarget = int(varTarget)
+        if not isinstance(varTarget, (int, np.integer)):
+            return None
+
+        objInfo = np.iinfo(self.arrData.dtype)
+        if not objInfo.min <= int(varTarget) <= objInfo.max:
+            return None
+        return int(varTarget)
+
+
+def fnWriteRandomColumn(strPath: str, intCount: int, intLow: int, intHigh: int, strDtype: str = "int64",
+                        intSeed: int = None) -> int:
+    """
+    Description:
+        Writes a raw binary column of intCount random integers between intLow
+        and intHigh (inclusive) that MappedColumnSearch can open. The values
+        are generated and written in chunks, so large columns are written
+        without holding them in memory.
+
+    Parameters:
+        strPath (str): Path of the file to write
+        intCount (int): Number of values
+        intLow (int): Smallest value
+        intHigh (int): Largest value
+        strDtype (str): NumPy integer dtype of the column
+        intSeed (int, optional): Seed for the random values
+
+    Returns:
+        int: Number of bytes written
+    """
+    objRandom = np.random.default_rng(intSeed)
+    objDtype = np.dtype(strDtype)
+    with open(strPath, "wb") as objFile:
+        for intStart in range(0, intCount, INT_SAMPLE_CHUNK):
+            intSize: int = min(INT_SAMPLE_CHUNK, intCount - intStart)
+            objRandom.integers(intLow, intHigh, size=intSize, endpoint=True).astype(objDtype).tofile(objFile)
+    return intCount * objDtype.itemsize
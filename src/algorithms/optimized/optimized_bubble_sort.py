@@ -1,28 +1,63 @@
-def fnBubbleSortOptimized(arrInput: list, boolAscending: bool = True) -> tuple[list, list]:
+from ..step_trace import SortTrace, fnTraceSort, fnStreamSort, fnDirectionalPasses
+
+
+def fnBubbleSortOptimized(arrInput: list, boolAscending: bool = True, fnKey=None, boolCaseFold: bool = False,
+                          boolLocale: bool = False) -> tuple[list, SortTrace]:
     """
     Description:
-        Optimized Bubble Sort Algorithm (Cocktail Shaker Sort) that traverses 
-        through the array in both directions alternatively, reducing the number 
+        Optimized Bubble Sort Algorithm (Cocktail Shaker Sort) that traverses
+        through the array in both directions alternatively, reducing the number
         of comparisons needed.
 
     Parameters:
         arrInput (list): The array to be sorted, can contain numbers or strings
         boolAscending (bool): Sort in ascending order if True, descending if False
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively
+        boolLocale (bool): Compare strings using the current locale's collation rules
 
-    Returns: 
+    Returns:
         tuple: A tuple containing:
             - list: The sorted array
-            - list: List of steps showing the array state after each iteration
+            - SortTrace: Sequence of steps showing the array state after each iteration
 
     References:
         https://www.geeksforgeeks.org/cocktail-sort/
     """
-    intSize: int = len(arrInput)
+    return fnTraceSort(_fnBubbleSortOptimizedPasses, arrInput.copy(), boolAscending, fnKey, boolCaseFold, boolLocale)
+
+
+def fnBubbleSortOptimizedStream(arrInput: list, boolAscending: bool = True, intMaxSteps: int = None, fnKey=None,
+                                boolCaseFold: bool = False, boolLocale: bool = False):
+    """
+    Description:
+        Streaming variant of fnBubbleSortOptimized that yields the array state
+        after each swap as soon as it happens instead of building the whole trace.
+
+    Parameters:
+        arrInput (list): The array to be sorted, can contain numbers or strings
+        boolAscending (bool): Sort in ascending order if True, descending if False
+        intMaxSteps (int, optional): Maximum number of steps to yield. Defaults to no limit.
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively
+        boolLocale (bool): Compare strings using the current locale's collation rules
+
+    Returns:
+        generator: Yields each step as a list and returns the sorted array
+    """
+    return fnStreamSort(_fnBubbleSortOptimizedPasses, arrInput.copy(), boolAscending, intMaxSteps, fnKey, boolCaseFold, boolLocale)
+
+
+def _fnBubbleSortOptimizedAscending(arrResult: list, fnSwap):
+    """
+    Description:
+        Ascending cocktail shaker sort kernel. Sorts arrResult in place, reports
+        every swap through fnSwap and yields after every swap.
+    """
+    intSize: int = len(arrResult)
     intStart: int = 0
     intEnd: int = intSize - 1
     boolSwapped: bool = True
-    arrResult: list = arrInput.copy()
-    arrSteps: list = []
 
     while boolSwapped:
         boolSwapped = False
@@ -32,8 +67,9 @@ def fnBubbleSortOptimized(arrInput: list, boolAscending: bool = True) -> tuple[l
             if arrResult[i] > arrResult[i + 1]:
                 arrResult[i], arrResult[i + 1] = arrResult[i + 1], arrResult[i]
                 boolSwapped = True
-                arrSteps.append(arrResult.copy())
-        
+                fnSwap(i, i + 1)
+                yield
+
         if not boolSwapped:
             break
 
@@ -45,12 +81,50 @@ def fnBubbleSortOptimized(arrInput: list, boolAscending: bool = True) -> tuple[l
             if arrResult[i] > arrResult[i + 1]:
                 arrResult[i], arrResult[i + 1] = arrResult[i + 1], arrResult[i]
                 boolSwapped = True
-                arrSteps.append(arrResult.copy())
-        
+                fnSwap(i, i + 1)
+                yield
+
+        intStart += 1
+
+
+def _fnBubbleSortOptimizedDescending(arrResult: list, fnSwap):
+    """
+    Description:
+        Descending cocktail shaker sort kernel. Sorts arrResult in place, reports
+        every swap through fnSwap and yields after every swap.
+    """
+    intSize: int = len(arrResult)
+    intStart: int = 0
+    intEnd: int = intSize - 1
+    boolSwapped: bool = True
+
+    while boolSwapped:
+        boolSwapped = False
+
+        # Forward pass
+        for i in range(intStart, intEnd):
+            if arrResult[i] < arrResult[i + 1]:
+                arrResult[i], arrResult[i + 1] = arrResult[i + 1], arrResult[i]
+                boolSwapped = True
+                fnSwap(i, i + 1)
+                yield
+
+        if not boolSwapped:
+            break
+
+        boolSwapped = False
+        intEnd -= 1
+
+        # Backward pass
+        for i in range(intEnd - 1, intStart - 1, -1):
+            if arrResult[i] < arrResult[i + 1]:
+                arrResult[i], arrResult[i + 1] = arrResult[i + 1], arrResult[i]
+                boolSwapped = True
+                fnSwap(i, i + 1)
+                yield
+
         intStart += 1
 
-    if not boolAscending:
-        arrResult.reverse()
-        arrSteps.append(arrResult.copy())
 
-    return arrResult, arrSteps
\ No newline at end of file
+# Descending order is sorted natively instead of reversing an ascending result
+_fnBubbleSortOptimizedPasses = fnDirectionalPasses(_fnBubbleSortOptimizedAscending, _fnBubbleSortOptimizedDescending)
@@ -1,9 +1,21 @@
+import threading
+
+
 def fnSentinelLinearSearch(arrInput: list, varTarget: any) -> int:
     """
     Description:
         Performs an optimized sequential search using the sentinel technique.
-        Temporarily places the target at the end of the array to eliminate 
-        the need for bounds checking in each iteration.
+        The target is placed after the last element of a padded copy of the
+        array, so the loop always stops without checking the bounds in each
+        iteration. The caller's array is never modified, so the search is
+        safe on lists shared between sessions or threads.
+
+        The padded copy costs O(n) time and memory on every call, even when
+        the target is near the front, so a single search is slower than a
+        plain sequential scan: slightly when the whole list is scanned, and
+        by orders of magnitude when the target is found early. Use
+        SentinelSearchBuffer to search the same list repeatedly: it pads the
+        list once and runs the loop without copying it again.
 
     Parameters:
         arrInput (list): The array to search in, can contain any comparable type
@@ -16,23 +28,136 @@ def fnSentinelLinearSearch(arrInput: list, varTarget: any) -> int:
         https://www.geeksforgeeks.org/sentinel-linear-search/
     """
     intSize: int = len(arrInput)
-    if intSize == 0:
+    # A target that is unequal to itself (NaN) would not stop at the sentinel either
+    if varTarget != varTarget:
         return -1
 
-    # Store the last element and place target at the end
-    varLastElement: any = arrInput[intSize - 1]
-    arrInput[intSize - 1] = varTarget
+    # Padded copy with the target in the reserved slot at the end
+    arrBuffer: list = [*arrInput, varTarget]
 
     # Search without bounds checking
     intIndex: int = 0
-    while arrInput[intIndex] != varTarget:
+    while arrBuffer[intIndex] != varTarget:
         intIndex += 1
 
-    # Restore the last element
-    arrInput[intSize - 1] = varLastElement
+    # Only the sentinel was found
+    if intIndex == intSize:
+        return -1
+    return intIndex
+
+
+class SentinelSearchBuffer:
+    """
+    Description:
+        Reentrant sentinel search over a list that is searched many times,
+        possibly from several threads. The values are copied into buffers with
+        one extra slot reserved for the sentinel, and every thread gets its
+        own buffer, created on its first search, so writing the sentinel never
+        touches the caller's list or another thread's search. Each search then
+        runs the same loop without bounds checks as fnSentinelLinearSearch,
+        without copying the list again.
+
+    Parameters:
+        arrValues (list): The values to search, can contain any comparable type
+
+    Example:
+        >>> objBuffer = SentinelSearchBuffer([4, 7, 4])
+        >>> objBuffer.search(7), objBuffer.search(5)
+        (1, -1)
+    """
+    def __init__(self, arrValues: list):
+        # Read-only master copy; the per-thread buffers are padded copies of it
+        self.tupValues: tuple = tuple(arrValues)
+        self.objLocal = threading.local()
+
+    def search(self, varTarget) -> int:
+        """
+        Description:
+            Finds the first occurrence of a value in the calling thread's buffer.
+
+        Parameters:
+            varTarget: The target element to search for
 
-    # Check if element was found
-    if intIndex < intSize - 1 or varLastElement == varTarget:
+        Returns:
+            int: Index of the first occurrence of varTarget if found, -1 otherwise
+        """
+        if varTarget != varTarget:
+            return -1
+
+        arrBuffer: list = self._fnBuffer()
+        intSize: int = len(self.tupValues)
+        arrBuffer[intSize] = varTarget
+
+        intIndex: int = 0
+        while arrBuffer[intIndex] != varTarget:
+            intIndex += 1
+
+        # Clear the slot so the buffer does not keep the target alive
+        arrBuffer[intSize] = None
+        if intIndex == intSize:
+            return -1
         return intIndex
-    return -1
 
+    def search_all(self, varTarget) -> list:
+        """
+        Description:
+            Finds every occurrence of a value. The sentinel stays in place while
+            the loop resumes after each match, so no pass checks the bounds.
+
+        Parameters:
+            varTarget: The target element to search for
+
+        Returns:
+            list: Ascending indices of every occurrence, empty if not found
+        """
+        if varTarget != varTarget:
+            return []
+
+        arrBuffer: list = self._fnBuffer()
+        intSize: int = len(self.tupValues)
+        arrBuffer[intSize] = varTarget
+
+        arrIndices: list = []
+        intIndex: int = 0
+        while True:
+            while arrBuffer[intIndex] != varTarget:
+                intIndex += 1
+            if intIndex == intSize:
+                break
+            arrIndices.append(intIndex)
+            intIndex += 1
+
+        arrBuffer[intSize] = None
+        return arrIndices
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: "backend"
+        """
+        return {"backend": "per-thread sentinel buffer"}
+
+    def describe(self) -> str:
+        """
+        Returns:
+            str: Summary of stats() as one caption for the search form
+        """
+        return f"Searched with the {self.stats()['backend']} backend."
+
+    def __len__(self) -> int:
+        return len(self.tupValues)
+
+    def __repr__(self) -> str:
+        return f"SentinelSearchBuffer(size={len(self.tupValues)})"
+
+    def _fnBuffer(self) -> list:
+        """
+        Description:
+            Returns the calling thread's padded buffer, creating it on the
+            thread's first search.
+        """
+        arrBuffer: list = getattr(self.objLocal, "arrBuffer", None)
+        if arrBuffer is None:
+            arrBuffer = [*self.tupValues, None]
+            self.objLocal.arrBuffer = arrBuffer
+        return arrBuffer
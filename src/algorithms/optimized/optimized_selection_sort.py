@@ -1,39 +1,103 @@
-def fnSelectionSortOptimized(arrInput: list, boolAscending: bool = True) -> tuple[list, list]:
+from ..step_trace import SortTrace, fnTraceSort, fnStreamSort, fnDirectionalPasses
+
+
+def fnSelectionSortOptimized(arrInput: list, boolAscending: bool = True, fnKey=None, boolCaseFold: bool = True,
+                             boolLocale: bool = False) -> tuple[list, SortTrace]:
     """
     Description:
-        Optimized Selection Sort that reduces the number of swaps by only 
-        performing a swap when a new minimum/maximum element is found in 
+        Optimized Selection Sort that reduces the number of swaps by only
+        performing a swap when a new minimum/maximum element is found in
         the unsorted portion.
 
     Parameters:
         arrInput (list): The array to be sorted, can contain numbers or strings
         boolAscending (bool): Sort in ascending order if True, descending if False
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively (the default for selection sort)
+        boolLocale (bool): Compare strings using the current locale's collation rules
 
     Returns:
         tuple: A tuple containing:
             - list: The sorted array
-            - list: List of steps showing the array state after each iteration
+            - SortTrace: Sequence of steps showing the array state after each iteration
 
     References:
         https://www.geeksforgeeks.org/selection-sort/
     """
-    intSize: int = len(arrInput)
-    arrResult: list = arrInput.copy()
-    arrSteps: list = []
+    return fnTraceSort(_fnSelectionSortOptimizedPasses, arrInput.copy(), boolAscending, fnKey, boolCaseFold, boolLocale)
+
+
+def fnSelectionSortOptimizedStream(arrInput: list, boolAscending: bool = True, intMaxSteps: int = None, fnKey=None,
+                                   boolCaseFold: bool = True, boolLocale: bool = False):
+    """
+    Description:
+        Streaming variant of fnSelectionSortOptimized that yields the array
+        state after each placement as soon as it happens.
+
+    Parameters:
+        arrInput (list): The array to be sorted, can contain numbers or strings
+        boolAscending (bool): Sort in ascending order if True, descending if False
+        intMaxSteps (int, optional): Maximum number of steps to yield. Defaults to no limit.
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively (the default for selection sort)
+        boolLocale (bool): Compare strings using the current locale's collation rules
+
+    Returns:
+        generator: Yields each step as a list and returns the sorted array
+    """
+    return fnStreamSort(_fnSelectionSortOptimizedPasses, arrInput.copy(), boolAscending, intMaxSteps, fnKey, boolCaseFold, boolLocale)
+
+
+def _fnSelectionSortOptimizedAscending(arrResult: list, fnSwap):
+    """
+    Description:
+        Ascending optimized selection sort kernel. Sorts arrResult (the
+        precomputed keys) in place, reports every swap through fnSwap and
+        yields after every placement that moved an element.
+    """
+    intSize: int = len(arrResult)
 
     for i in range(intSize):
         intMinIndex: int = i
-        varCurrent = arrResult[intMinIndex].lower() if isinstance(arrResult[intMinIndex], str) else arrResult[intMinIndex]
+        varCurrent = arrResult[intMinIndex]
 
         for j in range(i + 1, intSize):
-            varComp = arrResult[j].lower() if isinstance(arrResult[j], str) else arrResult[j]
+            varComp = arrResult[j]
 
-            if (varComp < varCurrent and boolAscending) or (varComp > varCurrent and not boolAscending):
+            if varComp < varCurrent:
                 intMinIndex = j
                 varCurrent = varComp
 
         if intMinIndex != i:
             arrResult[i], arrResult[intMinIndex] = arrResult[intMinIndex], arrResult[i]
-            arrSteps.append(arrResult.copy())
+            fnSwap(i, intMinIndex)
+            yield
+
+
+def _fnSelectionSortOptimizedDescending(arrResult: list, fnSwap):
+    """
+    Description:
+        Descending optimized selection sort kernel. Sorts arrResult (the
+        precomputed keys) in place, reports every swap through fnSwap and
+        yields after every placement that moved an element.
+    """
+    intSize: int = len(arrResult)
+
+    for i in range(intSize):
+        intMinIndex: int = i
+        varCurrent = arrResult[intMinIndex]
+
+        for j in range(i + 1, intSize):
+            varComp = arrResult[j]
+
+            if varComp > varCurrent:
+                intMinIndex = j
+                varCurrent = varComp
+
+        if intMinIndex != i:
+            arrResult[i], arrResult[intMinIndex] = arrResult[intMinIndex], arrResult[i]
+            fnSwap(i, intMinIndex)
+            yield
+
 
-    return arrResult, arrSteps
\ No newline at end of file
+_fnSelectionSortOptimizedPasses = fnDirectionalPasses(_fnSelectionSortOptimizedAscending, _fnSelectionSortOptimizedDescending)
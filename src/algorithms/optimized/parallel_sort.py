@@ -0,0 +1,116 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import heapq
+import os
+import time
+
+
+def fnParallelSort(fnSortFunction, arrInput: list, boolAscending: bool = True, intWorkers: int = None,
+                   intChunkSize: int = None, fnKey=None, boolCaseFold: bool = False) -> tuple[list, dict]:
+    """
+    Description:
+        Sorts a large list by splitting it into chunks, sorting every chunk in
+        a separate process with any of the project sorts (comb sort, cocktail
+        shaker sort, selection sort, ...) and combining the sorted runs with a
+        heap-based k-way merge. The quadratic sorts only ever see one chunk, so
+        the total work drops from O(n²) to O(n·c + n log k) for chunk size c
+        and k chunks, and the chunks are processed on all CPU cores.
+
+    Parameters:
+        fnSortFunction (callable): A project sort taking (list, bool, fnKey=..., boolCaseFold=...) and
+                                   returning (result, steps). Must be a module-level function so it can
+                                   be sent to worker processes.
+        arrInput (list): The array to be sorted
+        boolAscending (bool): Sort in ascending order if True, descending if False
+        intWorkers (int, optional): Number of worker processes. Defaults to the CPU count.
+        intChunkSize (int, optional): Number of elements per chunk. Defaults to an even split across the workers.
+        fnKey (callable, optional): Sort key forwarded to fnSortFunction and used by the merge. It is
+                                    sent to the worker processes, so it must be picklable: a
+                                    module-level function works, a lambda or nested function does not.
+        boolCaseFold (bool): Fold the case of strings. The same value is given to fnSortFunction
+                             and to the merge, so both order the elements alike.
+
+    Returns:
+        tuple: A tuple containing:
+            - list: The sorted array
+            - dict: Seconds spent per phase with keys "split", "sort", "merge" and "total",
+                    plus the "chunks" and "workers" that were used
+    """
+    fltStart: float = time.perf_counter()
+    intSize: int = len(arrInput)
+    intWorkers = intWorkers or os.cpu_count() or 1
+
+    if intChunkSize is None:
+        intChunkSize = -(-intSize // intWorkers) if intSize else 1
+    if intChunkSize < 1:
+        raise ValueError("intChunkSize must be a positive integer")
+
+    # Case folding is always passed, since the project sorts disagree on its default
+    dictSortOptions: dict = {"boolCaseFold": boolCaseFold}
+    if fnKey is not None:
+        dictSortOptions["fnKey"] = fnKey
+
+    # Split phase
+    arrChunks: list = [arrInput[i:i + intChunkSize] for i in range(0, intSize, intChunkSize)]
+    fltSplitDone: float = time.perf_counter()
+
+    # Sort phase, in-process when there is nothing to parallelize
+    if len(arrChunks) <= 1 or intWorkers == 1:
+        arrRuns: list = [_fnSortChunk(fnSortFunction, arrChunk, boolAscending, dictSortOptions) for arrChunk in arrChunks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(intWorkers, len(arrChunks))) as objExecutor:
+            arrRuns = list(objExecutor.map(
+                _fnSortChunk,
+                repeat(fnSortFunction),
+                arrChunks,
+                repeat(boolAscending),
+                repeat(dictSortOptions)
+            ))
+    fltSortDone: float = time.perf_counter()
+
+    # Merge phase
+    fnMergeKey = fnBuildMergeKey(fnKey, boolCaseFold)
+    arrResult: list = list(heapq.merge(*arrRuns, key=fnMergeKey, reverse=not boolAscending))
+    fltMergeDone: float = time.perf_counter()
+
+    dictTimings: dict = {
+        "split": fltSplitDone - fltStart,
+        "sort": fltSortDone - fltSplitDone,
+        "merge": fltMergeDone - fltSortDone,
+        "total": fltMergeDone - fltStart,
+        "chunks": len(arrChunks),
+        "workers": intWorkers
+    }
+    return arrResult, dictTimings
+
+
+def _fnSortChunk(fnSortFunction, arrChunk: list, boolAscending: bool, dictSortOptions: dict) -> list:
+    """
+    Description:
+        Worker entry point. Sorts one chunk and drops its step trace, which is
+        not needed for the merge and would only be pickled back.
+    """
+    arrSorted, _ = fnSortFunction(arrChunk, boolAscending, **dictSortOptions)
+    return arrSorted
+
+
+def fnBuildMergeKey(fnKey, boolCaseFold: bool):
+    """
+    Description:
+        Builds the key used by a k-way merge of sorted runs so it orders
+        elements the same way the chunk sort did.
+
+    Parameters:
+        fnKey (callable): Sort key given to the chunk sort, or None
+        boolCaseFold (bool): Whether the chunk sort folded the case of strings
+
+    Returns:
+        callable: Key function for heapq.merge, or None to compare elements directly
+    """
+    if not boolCaseFold:
+        return fnKey
+
+    def fnFoldedKey(varValue):
+        varKey = fnKey(varValue) if fnKey is not None else varValue
+        return varKey.casefold() if isinstance(varKey, str) else varKey
+    return fnFoldedKey
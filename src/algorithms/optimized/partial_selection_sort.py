@@ -0,0 +1,160 @@
+import heapq
+
+from ..step_trace import SortTrace, fnTraceSort, fnStreamSort, fnDirectionalPasses
+
+# Up to this many selections a full scan per selection beats the bounded heap
+INT_SELECTION_MAX_K: int = 2
+
+
+def fnPartialSelectionSort(arrInput: list, boolAscending: bool = True, intK: int = None, fnKey=None,
+                           boolCaseFold: bool = True, boolLocale: bool = False) -> tuple[list, SortTrace]:
+    """
+    Description:
+        Partial Selection Sort that only places the intK smallest (or largest)
+        elements at the front instead of sorting the whole array. For small k
+        it runs k passes of optimized selection sort and stops, for O(k·n).
+        For larger k it picks the k elements in a single pass with a heap
+        bounded to k entries, for O(n log k), and then moves them to the front
+        with the same swaps selection sort would make. Either way the rest of
+        the array is never sorted, so the top 10 of a million elements does
+        not pay for a full quadratic sort.
+
+    Parameters:
+        arrInput (list): The array to select from, can contain numbers or strings
+        boolAscending (bool): Select the smallest elements if True, the largest if False
+        intK (int, optional): Number of elements to place. Defaults to the whole array.
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively (the default for selection sort)
+        boolLocale (bool): Compare strings using the current locale's collation rules
+
+    Returns:
+        tuple: A tuple containing:
+            - list: The first intK elements in sorted order
+            - SortTrace: Sequence of steps showing the array state after each placement
+
+    References:
+        https://en.wikipedia.org/wiki/Partial_sorting
+    """
+    intK = _fnClampK(intK, len(arrInput))
+    arrResult, objTrace = fnTraceSort(_fnPartialSelectionPasses(intK), arrInput.copy(), boolAscending, fnKey,
+                                      boolCaseFold, boolLocale)
+    return arrResult[:intK], objTrace
+
+
+def fnPartialSelectionSortStream(arrInput: list, boolAscending: bool = True, intMaxSteps: int = None, intK: int = None,
+                                 fnKey=None, boolCaseFold: bool = True, boolLocale: bool = False):
+    """
+    Description:
+        Streaming variant of fnPartialSelectionSort that yields the array
+        state after each placement as soon as it happens.
+
+    Parameters:
+        arrInput (list): The array to select from, can contain numbers or strings
+        boolAscending (bool): Select the smallest elements if True, the largest if False
+        intMaxSteps (int, optional): Maximum number of steps to yield. Defaults to no limit.
+        intK (int, optional): Number of elements to place. Defaults to the whole array.
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively (the default for selection sort)
+        boolLocale (bool): Compare strings using the current locale's collation rules
+
+    Returns:
+        generator: Yields each step as a list and returns the first intK elements in sorted order
+    """
+    intK = _fnClampK(intK, len(arrInput))
+    arrResult: list = yield from fnStreamSort(_fnPartialSelectionPasses(intK), arrInput.copy(), boolAscending,
+                                              intMaxSteps, fnKey, boolCaseFold, boolLocale)
+    return arrResult[:intK]
+
+
+def _fnClampK(intK: int, intSize: int) -> int:
+    """
+    Description:
+        Resolves the requested k against the array size.
+    """
+    if intK is None:
+        return intSize
+    if not isinstance(intK, int) or intK < 0:
+        raise ValueError("intK must be a non-negative integer")
+    return min(intK, intSize)
+
+
+def _fnPartialSelectionPasses(intK: int):
+    """
+    Description:
+        Builds the sort core that places intK elements, choosing between the
+        selection and the bounded-heap kernels.
+    """
+    if intK <= INT_SELECTION_MAX_K:
+        def fnAscending(arrResult: list, fnSwap):
+            return _fnSelectionPrefixAscending(arrResult, fnSwap, intK)
+
+        def fnDescending(arrResult: list, fnSwap):
+            return _fnSelectionPrefixDescending(arrResult, fnSwap, intK)
+    else:
+        def fnAscending(arrResult: list, fnSwap):
+            arrOrder: list = heapq.nsmallest(intK, range(len(arrResult)), key=arrResult.__getitem__)
+            return _fnPlacePrefix(arrResult, fnSwap, arrOrder)
+
+        def fnDescending(arrResult: list, fnSwap):
+            arrOrder: list = heapq.nlargest(intK, range(len(arrResult)), key=arrResult.__getitem__)
+            return _fnPlacePrefix(arrResult, fnSwap, arrOrder)
+
+    return fnDirectionalPasses(fnAscending, fnDescending)
+
+
+def _fnSelectionPrefixAscending(arrResult: list, fnSwap, intK: int):
+    """
+    Description:
+        Ascending kernel running the first intK passes of optimized selection
+        sort. Reports every swap through fnSwap and yields after every
+        placement that moved an element.
+    """
+    intSize: int = len(arrResult)
+
+    for i in range(intK):
+        intMinIndex: int = min(range(i, intSize), key=arrResult.__getitem__)
+
+        if intMinIndex != i:
+            arrResult[i], arrResult[intMinIndex] = arrResult[intMinIndex], arrResult[i]
+            fnSwap(i, intMinIndex)
+            yield
+
+
+def _fnSelectionPrefixDescending(arrResult: list, fnSwap, intK: int):
+    """
+    Description:
+        Descending counterpart of _fnSelectionPrefixAscending.
+    """
+    intSize: int = len(arrResult)
+
+    for i in range(intK):
+        intMaxIndex: int = max(range(i, intSize), key=arrResult.__getitem__)
+
+        if intMaxIndex != i:
+            arrResult[i], arrResult[intMaxIndex] = arrResult[intMaxIndex], arrResult[i]
+            fnSwap(i, intMaxIndex)
+            yield
+
+
+def _fnPlacePrefix(arrResult: list, fnSwap, arrOrder: list):
+    """
+    Description:
+        Swaps the elements that started at the positions in arrOrder to the
+        front of arrResult, one placement per step. A placement can move a
+        later element, so the moved elements are tracked in both directions;
+        every other element is still at its starting position.
+    """
+    dictPosition: dict = {}
+    dictOrigin: dict = {}
+
+    for i, intOrigin in enumerate(arrOrder):
+        j: int = dictPosition.get(intOrigin, intOrigin)
+        if j == i:
+            continue
+
+        arrResult[i], arrResult[j] = arrResult[j], arrResult[i]
+        fnSwap(i, j)
+        intDisplaced: int = dictOrigin.get(i, i)
+        dictOrigin[i], dictOrigin[j] = intOrigin, intDisplaced
+        dictPosition[intOrigin], dictPosition[intDisplaced] = i, j
+        yield
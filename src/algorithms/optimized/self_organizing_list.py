@@ -1,66 +1,265 @@
-def fnSelfOrganizingSearch(arrInput: list, varTarget: any) -> int:
+from .indexed_search import IndexedSearch
+
+# Names of the reordering strategies of SelfOrganizingList
+TUP_STRATEGIES: tuple = ("move_to_front", "transpose", "count")
+# Access counts are halved once one of them reaches this bound
+INT_MAX_COUNT: int = 1 << 16
+
+
+class SelfOrganizingList:
+    """
+    Description:
+        Self-organizing list that moves the elements that are searched for
+        towards the front, so a sequential search over a skewed access
+        pattern needs fewer comparisons over time. Three strategies decide
+        how a found element moves:
+
+        - "move_to_front" moves it to index 0
+        - "transpose" swaps it with its predecessor
+        - "count" keeps an access count per element and moves the element in
+          front of every element with a lower count, so the list stays
+          ordered by count
+
+        The values and counts are kept in two parallel arrays. A count update
+        is O(1), and a reorder moves the element with one pop and one insert
+        instead of rebuilding the list. Counts are bounded by halving all of
+        them whenever one reaches intMaxCount, which keeps their order and
+        lets old accesses fade.
+
+        The work of every search is recorded: comparisons made by the scan
+        and elements shifted by the reorder.
+
+    Parameters:
+        arrValues (list): The initial values, in their initial order
+        strStrategy (str): One of "move_to_front", "transpose" or "count"
+        intMaxCount (int): Bound of the access counts of the "count" strategy
+
+    Raises:
+        ValueError: If strStrategy is not one of the strategies
+
+    Example:
+        >>> objList = SelfOrganizingList([1, 2, 3], "move_to_front")
+        >>> objList.search(3), objList.arrValues
+        (0, [3, 1, 2])
+
+    References:
+        https://en.wikipedia.org/wiki/Self-organizing_list
+    """
+    def __init__(self, arrValues: list, strStrategy: str = "count", intMaxCount: int = INT_MAX_COUNT):
+        if strStrategy not in TUP_STRATEGIES:
+            raise ValueError(f"strStrategy must be one of {', '.join(TUP_STRATEGIES)}")
+
+        self.arrValues: list = list(arrValues)
+        self.strStrategy: str = strStrategy
+        self.intMaxCount: int = intMaxCount
+        # Access count of the element at the same position of arrValues
+        self.arrCounts: list = [0] * len(self.arrValues)
+
+        self.intSearches: int = 0
+        self.intComparisons: int = 0
+        self.intShifts: int = 0
+        self.intLastComparisons: int = 0
+
+    def search(self, varTarget) -> int:
+        """
+        Description:
+            Finds the first occurrence of a value by sequential search and
+            moves it according to the strategy.
+
+        Parameters:
+            varTarget: The target element to search for
+
+        Returns:
+            int: Index of the target after the reorder, -1 if not found
+        """
+        intIndex, intComparisons = self._fnFind(varTarget)
+
+        self.intSearches += 1
+        self.intLastComparisons = intComparisons
+        self.intComparisons += intComparisons
+        if intIndex == -1:
+            return -1
+
+        if self.strStrategy == "move_to_front":
+            intNewIndex: int = 0
+        elif self.strStrategy == "transpose":
+            intNewIndex = max(intIndex - 1, 0)
+        else:
+            intNewIndex = self._fnCount(intIndex)
+
+        if intNewIndex != intIndex:
+            self._fnReorder(intIndex, intNewIndex)
+            self.intShifts += intIndex - intNewIndex
+        return intNewIndex
+
+    def search_all(self, varTarget) -> list:
+        """
+        Description:
+            Finds every occurrence of a value without reordering the list.
+
+        Parameters:
+            varTarget: The target element to search for
+
+        Returns:
+            list: Ascending indices of every occurrence, empty if not found
+        """
+        return [intIndex for intIndex, varValue in enumerate(self.arrValues) if varValue == varTarget]
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: "backend" (the strategy), "searches", "mean_comparisons" per search
+                  and "shifts" (elements moved by all reorders)
+        """
+        return {
+            "backend": f"self-organizing list ({self.strStrategy.replace('_', ' ')})",
+            "searches": self.intSearches,
+            "mean_comparisons": self.intComparisons / self.intSearches if self.intSearches else 0.0,
+            "shifts": self.intShifts
+        }
+
+    def describe(self) -> str:
+        """
+        Returns:
+            str: Summary of stats() as one caption for the search form
+        """
+        dictStats: dict = self.stats()
+        return (f"Searched with the {dictStats['backend']}: {dictStats['mean_comparisons']:.2f} comparisons per search "
+                f"on average over {dictStats['searches']} searches, {dictStats['shifts']} elements shifted by reorders.")
+
+    def __len__(self) -> int:
+        return len(self.arrValues)
+
+    def __repr__(self) -> str:
+        return f"SelfOrganizingList(size={len(self.arrValues)}, strategy={self.strStrategy!r})"
+
+    def _fnFind(self, varTarget) -> tuple:
+        """
+        Description:
+            Scans the list for the first occurrence of varTarget and returns
+            its index (-1 if not found) and the comparisons made.
+        """
+        arrValues: list = self.arrValues
+        for i in range(len(arrValues)):
+            if arrValues[i] == varTarget:
+                return i, i + 1
+        return -1, len(arrValues)
+
+    def _fnReorder(self, intIndex: int, intNewIndex: int) -> None:
+        """
+        Description:
+            Moves the element at intIndex and its access count to intNewIndex
+            with one pop and one insert.
+        """
+        self.arrValues.insert(intNewIndex, self.arrValues.pop(intIndex))
+        self.arrCounts.insert(intNewIndex, self.arrCounts.pop(intIndex))
+
+    def _fnCount(self, intIndex: int) -> int:
+        """
+        Description:
+            Counts an access of the element at intIndex and returns the
+            position in front of every element with a lower count.
+        """
+        arrCounts: list = self.arrCounts
+        intCount: int = arrCounts[intIndex] + 1
+        arrCounts[intIndex] = intCount
+
+        if intCount >= self.intMaxCount:
+            # Halving keeps the list ordered by count
+            for i in range(len(arrCounts)):
+                arrCounts[i] >>= 1
+            intCount = arrCounts[intIndex]
+
+        intNewIndex: int = intIndex
+        while intNewIndex > 0 and arrCounts[intNewIndex - 1] < intCount:
+            intNewIndex -= 1
+        return intNewIndex
+
+
+class IndexedSelfOrganizingList(SelfOrganizingList):
     """
     Description:
-        This function implements a self-organizing list search that positions the most 
-        frequently searched items at the front of the array to improve sequential search 
-        performance. It uses the count method where each element maintains a count of 
-        how many times it has been accessed.
+        Self-organizing list whose elements are found through an
+        IndexedSearch instead of a sequential scan. The list and the index
+        share one array of values: every reorder of a search is forwarded to
+        IndexedSearch.move, which shifts the values and reindexes only the
+        positions between the old and the new index of the element. The
+        first occurrence, all occurrences and the count of a value are
+        therefore answered from an index that stays current while the list
+        reorganizes itself, and every search costs one hash lookup instead
+        of a scan.
 
     Parameters:
-        arrInput (list): The array to search in, can contain any comparable type
-        varTarget (any): The target element to search for
+        arrValues (list): The initial values, in their initial order, of any hashable type
+        strStrategy (str): One of "move_to_front", "transpose" or "count"
+        intMaxCount (int): Bound of the access counts of the "count" strategy
 
-    Returns:
-        int: Index of the target element in the current state of the list, -1 if not found
+    Raises:
+        ValueError: If strStrategy is not one of the strategies
 
-    Reference:
-        https://www.geeksforgeeks.org/self-organizing-list-count-method/
+    Example:
+        >>> objList = IndexedSelfOrganizingList([1, 2, 3, 2], "move_to_front")
+        >>> objList.search(3), objList.arrValues, objList.search_all(2)
+        (0, [3, 1, 2, 2], [2, 3])
     """
-    import streamlit as st
-    
-    if not arrInput:
-        return -1
-
-    # Get session key for this specific list
-    list_id = id(arrInput)
-    session_key = f"sol_counts_{list_id}"
-    
-    # Initialize or retrieve counts from session state
-    if session_key not in st.session_state:
-        st.session_state[session_key] = {val: 0 for val in arrInput}
-    
-    # Get the existing counts
-    counts = st.session_state[session_key]
-    intLength = len(arrInput)
-    intIndex = -1
-
-    # Search for the target and update its count
-    for i in range(intLength):
-        if arrInput[i] == varTarget:
-            intIndex = i
-            # Update count in session state
-            counts[varTarget] = counts.get(varTarget, 0) + 1
-            break
-
-    if intIndex == -1:
-        return -1
-
-    # Create a list of [value, count] pairs for reorganization
-    arrList = [[arrInput[i], counts.get(arrInput[i], 0)] for i in range(intLength)]
-    
-    # Reorganize list based on access frequency
-    while (intIndex > 0 and arrList[intIndex][1] > arrList[intIndex - 1][1]):
-        # Swap elements only (counts are already in session state)
-        arrList[intIndex], arrList[intIndex - 1] = arrList[intIndex - 1], arrList[intIndex]
-        intIndex -= 1
-
-    # Update the original input array to reflect the new order
-    for i in range(intLength):
-        arrInput[i] = arrList[i][0]
-    
-    # Update counts in session state with any new values
-    st.session_state[session_key] = {arrInput[i]: arrList[i][1] for i in range(intLength)}
-
-    return intIndex
-
-    
\ No newline at end of file
+    def __init__(self, arrValues: list, strStrategy: str = "count", intMaxCount: int = INT_MAX_COUNT):
+        super().__init__(arrValues, strStrategy, intMaxCount)
+        self.objIndex: IndexedSearch = IndexedSearch(self.arrValues)
+        # The list reads the values the index shifts
+        self.arrValues = self.objIndex.arrValues
+
+    def search_all(self, varTarget) -> list:
+        """
+        Description:
+            Finds every occurrence of a value from the index, without
+            reordering the list.
+
+        Parameters:
+            varTarget: The target element to search for
+
+        Returns:
+            list: Ascending indices of every occurrence, empty if not found
+        """
+        return self.objIndex.search_all(varTarget)
+
+    def count(self, varTarget) -> int:
+        """
+        Description:
+            Counts the occurrences of a value from the index.
+
+        Parameters:
+            varTarget: The target element to count
+
+        Returns:
+            int: Number of occurrences of varTarget
+        """
+        return self.objIndex.count(varTarget)
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: The statistics of SelfOrganizingList, with one lookup counted as
+                  one comparison
+        """
+        dictStats: dict = super().stats()
+        dictStats["backend"] = f"indexed {dictStats['backend']}"
+        return dictStats
+
+    def __repr__(self) -> str:
+        return f"IndexedSelfOrganizingList(size={len(self.arrValues)}, strategy={self.strStrategy!r})"
+
+    def _fnFind(self, varTarget) -> tuple:
+        """
+        Description:
+            Looks up the first occurrence of varTarget in the index.
+        """
+        return self.objIndex.search(varTarget), 1
+
+    def _fnReorder(self, intIndex: int, intNewIndex: int) -> None:
+        """
+        Description:
+            Moves the element through the index, which shifts the shared
+            values, and moves its access count alongside.
+        """
+        self.objIndex.move(intIndex, intNewIndex)
+        self.arrCounts.insert(intNewIndex, self.arrCounts.pop(intIndex))
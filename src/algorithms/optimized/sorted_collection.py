@@ -0,0 +1,353 @@
+from bisect import bisect_left, bisect_right
+
+from ..step_trace import ReplayTrace, fnBuildSortKeys
+
+# Target number of elements per block; a block is split once it holds twice as many
+INT_BLOCK_LOAD: int = 1000
+
+
+class SortedCollection:
+    """
+    Description:
+        Sorted container kept as a list of sorted blocks of about
+        INT_BLOCK_LOAD elements, with the largest key of every block indexed
+        for bisection. Finding a value bisects the block index and then the
+        block, in O(log n), and inserting or deleting only shifts the elements
+        of one block, in O(√n) for the default load, so a sorted list can take
+        new values without being sorted again. The blocks are always kept in
+        ascending order and read backwards for a descending collection.
+        Equal keys keep their insertion order in both directions.
+
+        Every change since the last call to snapshot is logged, and snapshot
+        returns the contents together with the state after each change, in
+        the same (result, steps) format as the sorting functions.
+
+    Parameters:
+        arrValues (list, optional): Initial values, in any order
+        boolAscending (bool): Keep the values in ascending order if True, descending if False
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively
+
+    Example:
+        >>> objCollection = SortedCollection([5, 1, 3])
+        >>> objCollection.add(2); objCollection.remove(5)
+        >>> objCollection.snapshot()[0]
+        [1, 2, 3]
+    """
+    def __init__(self, arrValues: list = (), boolAscending: bool = True, fnKey=None, boolCaseFold: bool = False):
+        self.boolAscending: bool = boolAscending
+        self.fnKey = fnKey
+        self.boolCaseFold: bool = boolCaseFold
+
+        # Stored ascending and read backwards when descending, so earlier values go last
+        arrValues = list(arrValues) if boolAscending else list(arrValues)[::-1]
+        arrKeys: list = self._fnKeys(arrValues)
+        arrOrder: list = sorted(range(len(arrValues)), key=arrKeys.__getitem__)
+        self._fnLoad([arrValues[i] for i in arrOrder], [arrKeys[i] for i in arrOrder])
+
+    @classmethod
+    def from_sorted(cls, arrSorted: list, boolAscending: bool = True, fnKey=None,
+                    boolCaseFold: bool = False) -> "SortedCollection":
+        """
+        Description:
+            Wraps a list that is already sorted in the given direction, in
+            O(n) and without comparing any elements.
+
+        Parameters:
+            arrSorted (list): Values sorted in the order given by boolAscending
+            boolAscending (bool): Whether arrSorted is in ascending order
+            fnKey (callable, optional): Function computing each element's sort key
+            boolCaseFold (bool): Compare strings case-insensitively
+
+        Returns:
+            SortedCollection: A collection holding the values of arrSorted
+        """
+        objCollection: SortedCollection = cls.__new__(cls)
+        objCollection.boolAscending = boolAscending
+        objCollection.fnKey = fnKey
+        objCollection.boolCaseFold = boolCaseFold
+
+        arrValues: list = list(arrSorted) if boolAscending else arrSorted[::-1]
+        objCollection._fnLoad(arrValues, objCollection._fnKeys(arrValues))
+        return objCollection
+
+    def add(self, varValue) -> None:
+        """
+        Description:
+            Inserts a value after any values with an equal key (in the
+            order of the collection).
+
+        Parameters:
+            varValue: The value to insert
+        """
+        varKey = self._fnKeys([varValue])[0]
+        self.arrLog.append((True, varValue, varKey))
+        self.intSize += 1
+
+        if not self.arrMaxKeys:
+            self.arrBlocks.append([varValue])
+            self.arrKeyBlocks.append([varKey])
+            self.arrMaxKeys.append(varKey)
+            return
+
+        fnBisect = bisect_right if self.boolAscending else bisect_left
+        intBlock: int = min(fnBisect(self.arrMaxKeys, varKey), len(self.arrMaxKeys) - 1)
+        arrKeyBlock: list = self.arrKeyBlocks[intBlock]
+        intIndex: int = fnBisect(arrKeyBlock, varKey)
+        arrKeyBlock.insert(intIndex, varKey)
+        self.arrBlocks[intBlock].insert(intIndex, varValue)
+        self.arrMaxKeys[intBlock] = arrKeyBlock[-1]
+
+        if len(arrKeyBlock) > 2 * INT_BLOCK_LOAD:
+            self._fnSplit(intBlock)
+
+    def update(self, arrValues: list) -> None:
+        """
+        Description:
+            Inserts every value of arrValues.
+
+        Parameters:
+            arrValues (list): The values to insert
+        """
+        for varValue in arrValues:
+            self.add(varValue)
+
+    def remove(self, varValue) -> None:
+        """
+        Description:
+            Deletes the first occurrence of a value.
+
+        Parameters:
+            varValue: The value to delete
+
+        Raises:
+            ValueError: If the value is not in the collection
+        """
+        if not self.discard(varValue):
+            raise ValueError(f"{varValue!r} is not in the collection")
+
+    def discard(self, varValue) -> bool:
+        """
+        Description:
+            Deletes the first occurrence of a value if there is one.
+
+        Parameters:
+            varValue: The value to delete
+
+        Returns:
+            bool: True if a value was deleted
+        """
+        tupPosition: tuple = self._fnFind(varValue)
+        if tupPosition is None:
+            return False
+
+        intBlock, intIndex = tupPosition
+        varKey = self.arrKeyBlocks[intBlock].pop(intIndex)
+        self.arrBlocks[intBlock].pop(intIndex)
+        self.arrLog.append((False, varValue, varKey))
+        self.intSize -= 1
+
+        if self.arrKeyBlocks[intBlock]:
+            self.arrMaxKeys[intBlock] = self.arrKeyBlocks[intBlock][-1]
+        else:
+            del self.arrBlocks[intBlock]
+            del self.arrKeyBlocks[intBlock]
+            del self.arrMaxKeys[intBlock]
+        return True
+
+    def irange(self, varMinimum=None, varMaximum=None):
+        """
+        Description:
+            Iterates over the values whose keys lie between two bounds (both
+            inclusive), in the order of the collection. Finding the first
+            value takes O(log n) and each further value O(1).
+
+        Parameters:
+            varMinimum (optional): Smallest key to include. Defaults to no lower bound.
+            varMaximum (optional): Largest key to include. Defaults to no upper bound.
+
+        Returns:
+            iterator: The values in range
+        """
+        # The bounds are keys already, only the case folding still applies
+        if varMinimum is not None:
+            varMinimum = (fnBuildSortKeys([varMinimum], None, self.boolCaseFold) or [varMinimum])[0]
+        if varMaximum is not None:
+            varMaximum = (fnBuildSortKeys([varMaximum], None, self.boolCaseFold) or [varMaximum])[0]
+
+        arrRange: list = []
+        intBlock: int = 0 if varMinimum is None else bisect_left(self.arrMaxKeys, varMinimum)
+        intIndex: int = 0 if varMinimum is None or intBlock == len(self.arrMaxKeys) else \
+            bisect_left(self.arrKeyBlocks[intBlock], varMinimum)
+
+        while intBlock < len(self.arrBlocks):
+            arrKeyBlock: list = self.arrKeyBlocks[intBlock]
+            intEnd: int = len(arrKeyBlock) if varMaximum is None else bisect_right(arrKeyBlock, varMaximum)
+            arrRange.extend(self.arrBlocks[intBlock][intIndex:intEnd])
+            if intEnd < len(arrKeyBlock):
+                break
+            intBlock += 1
+            intIndex = 0
+
+        return iter(arrRange) if self.boolAscending else reversed(arrRange)
+
+    def snapshot(self) -> tuple[list, ReplayTrace]:
+        """
+        Description:
+            Returns the contents and the changes made since the previous
+            snapshot (or since the collection was created), then starts a new
+            change log. Steps are rebuilt on demand by replaying the logged
+            insertions and deletions on the previous contents.
+
+        Returns:
+            tuple: A tuple containing:
+                - list: The values in the order of the collection
+                - ReplayTrace: Sequence of steps showing the contents after each change
+        """
+        arrBase: list = self.arrBase
+        arrBaseKeys: list = self.arrBaseKeys
+        arrLog: list = self.arrLog
+        boolAscending: bool = self.boolAscending
+        fnBisect = bisect_right if boolAscending else bisect_left
+
+        def fnReplay():
+            arrState: list = arrBase.copy()
+            arrStateKeys: list = arrBaseKeys.copy()
+            for boolAdd, varValue, varKey in arrLog:
+                if boolAdd:
+                    intIndex: int = fnBisect(arrStateKeys, varKey)
+                    arrStateKeys.insert(intIndex, varKey)
+                    arrState.insert(intIndex, varValue)
+                else:
+                    intIndex = bisect_left(arrStateKeys, varKey)
+                    while arrState[intIndex] != varValue:
+                        intIndex += 1
+                    del arrStateKeys[intIndex]
+                    del arrState[intIndex]
+                yield arrState.copy() if boolAscending else arrState[::-1]
+
+        objTrace: ReplayTrace = ReplayTrace(fnReplay, len(arrLog))
+        self._fnStartLog()
+        return list(self), objTrace
+
+    def __len__(self) -> int:
+        return self.intSize
+
+    def __contains__(self, varValue) -> bool:
+        return self._fnFind(varValue) is not None
+
+    def __iter__(self):
+        if self.boolAscending:
+            for arrBlock in self.arrBlocks:
+                yield from arrBlock
+        else:
+            for arrBlock in reversed(self.arrBlocks):
+                yield from reversed(arrBlock)
+
+    def __getitem__(self, intIndex: int):
+        if intIndex < 0:
+            intIndex += self.intSize
+        if intIndex < 0 or intIndex >= self.intSize:
+            raise IndexError("SortedCollection index out of range")
+        if not self.boolAscending:
+            intIndex = self.intSize - 1 - intIndex
+
+        for arrBlock in self.arrBlocks:
+            if intIndex < len(arrBlock):
+                return arrBlock[intIndex]
+            intIndex -= len(arrBlock)
+
+    def __repr__(self) -> str:
+        return f"SortedCollection(size={self.intSize}, blocks={len(self.arrBlocks)})"
+
+    def _fnKeys(self, arrValues: list) -> list:
+        """
+        Description:
+            Computes the comparison keys of arrValues.
+        """
+        arrKeys: list = fnBuildSortKeys(arrValues, self.fnKey, self.boolCaseFold)
+        return list(arrValues) if arrKeys is None else arrKeys
+
+    def _fnLoad(self, arrValues: list, arrKeys: list) -> None:
+        """
+        Description:
+            Cuts ascending values and their keys into blocks of INT_BLOCK_LOAD
+            elements and starts an empty change log.
+        """
+        self.arrBlocks: list = [arrValues[i:i + INT_BLOCK_LOAD] for i in range(0, len(arrValues), INT_BLOCK_LOAD)]
+        self.arrKeyBlocks: list = [arrKeys[i:i + INT_BLOCK_LOAD] for i in range(0, len(arrKeys), INT_BLOCK_LOAD)]
+        self.arrMaxKeys: list = [arrKeyBlock[-1] for arrKeyBlock in self.arrKeyBlocks]
+        self.intSize: int = len(arrValues)
+        self._fnStartLog()
+
+    def _fnStartLog(self) -> None:
+        """
+        Description:
+            Records the current ascending contents as the base of the next
+            snapshot and clears the change log.
+        """
+        self.arrBase: list = [varValue for arrBlock in self.arrBlocks for varValue in arrBlock]
+        self.arrBaseKeys: list = [varKey for arrKeyBlock in self.arrKeyBlocks for varKey in arrKeyBlock]
+        # (added, value, key) for every change since the last snapshot
+        self.arrLog: list = []
+
+    def _fnSplit(self, intBlock: int) -> None:
+        """
+        Description:
+            Splits an overfull block into two halves.
+        """
+        arrBlock: list = self.arrBlocks[intBlock]
+        arrKeyBlock: list = self.arrKeyBlocks[intBlock]
+        intHalf: int = len(arrBlock) // 2
+
+        self.arrBlocks[intBlock:intBlock + 1] = [arrBlock[:intHalf], arrBlock[intHalf:]]
+        self.arrKeyBlocks[intBlock:intBlock + 1] = [arrKeyBlock[:intHalf], arrKeyBlock[intHalf:]]
+        self.arrMaxKeys[intBlock:intBlock + 1] = [arrKeyBlock[intHalf - 1], arrKeyBlock[-1]]
+
+    def _fnFind(self, varValue) -> tuple:
+        """
+        Description:
+            Returns (block, index) of the first occurrence of varValue, or
+            None. Values with an equal key can run across several blocks.
+        """
+        varKey = self._fnKeys([varValue])[0]
+        intBlock: int = bisect_left(self.arrMaxKeys, varKey)
+
+        while intBlock < len(self.arrBlocks):
+            arrKeyBlock: list = self.arrKeyBlocks[intBlock]
+            arrBlock: list = self.arrBlocks[intBlock]
+            intIndex: int = bisect_left(arrKeyBlock, varKey)
+            while intIndex < len(arrKeyBlock) and not varKey < arrKeyBlock[intIndex]:
+                if arrBlock[intIndex] == varValue:
+                    return intBlock, intIndex
+                intIndex += 1
+            if intIndex < len(arrKeyBlock):
+                return None
+            intBlock += 1
+        return None
+
+
+def fnAbsorbSorted(arrSorted: list, arrNewValues: list, boolAscending: bool = True, fnKey=None,
+                   boolCaseFold: bool = False) -> tuple[list, ReplayTrace]:
+    """
+    Description:
+        Inserts new values into a list that is already sorted, instead of
+        sorting everything again. The sorted list is wrapped in a
+        SortedCollection in O(n) and each new value is inserted in O(√n), so
+        absorbing m values costs O(n + m·√n) rather than a full sort.
+
+    Parameters:
+        arrSorted (list): Values already sorted in the order given by boolAscending
+        arrNewValues (list): Values to insert, in any order
+        boolAscending (bool): Whether arrSorted is in ascending order
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively
+
+    Returns:
+        tuple: A tuple containing:
+            - list: The sorted array with the new values
+            - ReplayTrace: Sequence of steps showing the array state after each insertion
+    """
+    objCollection: SortedCollection = SortedCollection.from_sorted(arrSorted, boolAscending, fnKey, boolCaseFold)
+    objCollection.update(arrNewValues)
+    return objCollection.snapshot()
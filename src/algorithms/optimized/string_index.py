@@ -0,0 +1,267 @@
+import sys
+import time
+
+INT_GRAM: int = 3
+# Marks the start of a key, so the first trigrams of a key also answer prefix queries
+STR_START: str = "\x02"
+
+
+class StringIndex:
+    """
+    Description:
+        Search engine for lists of strings that answers exact,
+        case-insensitive, prefix and substring queries without a full scan.
+        Every value's casefolded key is computed once when it is added, so no
+        query lowercases the list again, and three indexes are kept:
+
+        - the positions of every value, for exact queries
+        - the positions of every casefolded key, for case-insensitive queries
+        - an inverted index from every trigram (three consecutive characters)
+          of the keys to the ascending positions of the keys containing it
+        - the same kind of index for every run of one or two characters, so
+          substrings shorter than a trigram are looked up as well
+
+        Keys are indexed with two start markers in front, so "\\x02\\x02a" and
+        "\\x02ab" are trigrams of every key starting with "ab". A prefix or
+        substring query looks up the trigrams of the query, intersects their
+        position lists starting with the shortest, and verifies only the
+        remaining candidates. Substring queries shorter than three characters
+        have no trigram and are answered from the short-run index instead,
+        which lists exactly the keys containing them.
+
+        Values that are not strings are indexed by their str(). Values are
+        added at the end with append, which extends the position lists in
+        place; positions in the middle never move.
+
+    Parameters:
+        arrValues (list): The values to index, usually strings
+
+    Example:
+        >>> objIndex = StringIndex(["Apple", "banana", "apple pie"])
+        >>> objIndex.search_casefold("APPLE"), objIndex.search_prefix("app"), objIndex.search_substring("an")
+        ([0], [0, 2], [1])
+
+    References:
+        https://en.wikipedia.org/wiki/Trigram_search
+    """
+    def __init__(self, arrValues: list):
+        self.arrValues: list = []
+        self.arrKeys: list = []
+        # value: ascending positions of that value
+        self.dictExact: dict = {}
+        # casefolded key: ascending positions of that key
+        self.dictFolded: dict = {}
+        # trigram: ascending positions of the keys that contain it
+        self.dictTrigrams: dict = {}
+        # run of one or two characters: ascending positions of the keys that contain it
+        self.dictShortGrams: dict = {}
+
+        fltStart: float = time.perf_counter()
+        for varValue in arrValues:
+            self.append(varValue)
+        self.fltBuildSeconds: float = time.perf_counter() - fltStart
+
+        self.fltLastSeconds: float = 0.0
+        self.intLastCandidates: int = 0
+
+    def append(self, varValue) -> None:
+        """
+        Description:
+            Adds a value at the end of the list and indexes it in time
+            proportional to its length.
+
+        Parameters:
+            varValue: The value to add
+        """
+        intIndex: int = len(self.arrValues)
+        strKey: str = str(varValue).casefold()
+        self.arrValues.append(varValue)
+        self.arrKeys.append(strKey)
+        self.dictExact.setdefault(varValue, []).append(intIndex)
+        self.dictFolded.setdefault(strKey, []).append(intIndex)
+
+        # A trigram that repeats within the key is listed once
+        for strGram in set(_fnGrams(STR_START * (INT_GRAM - 1) + strKey)):
+            self.dictTrigrams.setdefault(strGram, []).append(intIndex)
+        for strGram in set(_fnGrams(strKey, 1)) | set(_fnGrams(strKey, 2)):
+            self.dictShortGrams.setdefault(strGram, []).append(intIndex)
+
+    def search(self, varTarget) -> int:
+        """
+        Description:
+            Finds the first occurrence of a value.
+
+        Parameters:
+            varTarget: The target element to search for
+
+        Returns:
+            int: Index of the first occurrence of varTarget if found, -1 otherwise
+        """
+        arrPositions: list = self.search_all(varTarget)
+        return arrPositions[0] if arrPositions else -1
+
+    def search_all(self, varTarget) -> list:
+        """
+        Description:
+            Finds every exact occurrence of a value.
+
+        Parameters:
+            varTarget: The target element to search for
+
+        Returns:
+            list: Ascending indices of every occurrence, empty if not found
+        """
+        fltStart: float = time.perf_counter()
+        arrPositions: list = list(self.dictExact.get(varTarget, ()))
+        self._fnRecord(fltStart, len(arrPositions))
+        return arrPositions
+
+    def search_casefold(self, strQuery: str) -> list:
+        """
+        Description:
+            Finds every value equal to the query when case is ignored.
+
+        Parameters:
+            strQuery (str): The text to search for
+
+        Returns:
+            list: Ascending indices of the matching values
+        """
+        fltStart: float = time.perf_counter()
+        arrPositions: list = list(self.dictFolded.get(str(strQuery).casefold(), ()))
+        self._fnRecord(fltStart, len(arrPositions))
+        return arrPositions
+
+    def search_prefix(self, strPrefix: str, boolCaseFold: bool = True) -> list:
+        """
+        Description:
+            Finds every value that starts with the prefix.
+
+        Parameters:
+            strPrefix (str): The prefix to search for
+            boolCaseFold (bool): Ignore case if True
+
+        Returns:
+            list: Ascending indices of the matching values
+        """
+        strPrefix = str(strPrefix)
+        strKey: str = strPrefix.casefold()
+        fltStart: float = time.perf_counter()
+        arrCandidates: list = self._fnCandidates(STR_START * (INT_GRAM - 1) + strKey)
+        if boolCaseFold:
+            arrPositions: list = [i for i in arrCandidates if self.arrKeys[i].startswith(strKey)]
+        else:
+            arrPositions = [i for i in arrCandidates if str(self.arrValues[i]).startswith(strPrefix)]
+        self._fnRecord(fltStart, len(arrCandidates))
+        return arrPositions
+
+    def search_substring(self, strPart: str, boolCaseFold: bool = True) -> list:
+        """
+        Description:
+            Finds every value that contains the text.
+
+        Parameters:
+            strPart (str): The text to search for
+            boolCaseFold (bool): Ignore case if True
+
+        Returns:
+            list: Ascending indices of the matching values
+        """
+        strPart = str(strPart)
+        strKey: str = strPart.casefold()
+        fltStart: float = time.perf_counter()
+        if not strKey:
+            arrCandidates: list = range(len(self.arrKeys))
+        elif len(strKey) < INT_GRAM:
+            arrCandidates = self.dictShortGrams.get(strKey, [])
+        else:
+            arrCandidates = self._fnCandidates(strKey)
+        if boolCaseFold:
+            arrPositions: list = [i for i in arrCandidates if strKey in self.arrKeys[i]]
+        else:
+            arrPositions = [i for i in arrCandidates if strPart in str(self.arrValues[i])]
+        self._fnRecord(fltStart, len(arrCandidates))
+        return arrPositions
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: "build_seconds", "index_bytes" (approximate size of the keys and the
+                  four indexes), "trigrams" (distinct trigrams), "query_seconds" and
+                  "candidates" (values verified by the last query)
+        """
+        intBytes: int = sys.getsizeof(self.arrKeys) + sum(sys.getsizeof(strKey) for strKey in self.arrKeys)
+        for dictIndex in (self.dictExact, self.dictFolded, self.dictTrigrams, self.dictShortGrams):
+            intBytes += sys.getsizeof(dictIndex)
+            for arrPositions in dictIndex.values():
+                intBytes += sys.getsizeof(arrPositions)
+        intBytes += sum(sys.getsizeof(strGram) for strGram in self.dictTrigrams)
+        intBytes += sum(sys.getsizeof(strGram) for strGram in self.dictShortGrams)
+
+        return {
+            "build_seconds": self.fltBuildSeconds,
+            "index_bytes": intBytes,
+            "trigrams": len(self.dictTrigrams),
+            "query_seconds": self.fltLastSeconds,
+            "candidates": self.intLastCandidates
+        }
+
+    def describe(self) -> str:
+        """
+        Returns:
+            str: Summary of stats() as one caption for the search form
+        """
+        dictStats: dict = self.stats()
+        return (f"Trigram index of about {dictStats['index_bytes'] / 1024:.1f} KB with {dictStats['trigrams']} "
+                f"trigrams, built in {dictStats['build_seconds'] * 1000:.3f} ms. The query took "
+                f"{dictStats['query_seconds'] * 1e6:.1f} µs and checked {dictStats['candidates']} of "
+                f"{len(self.arrValues)} values.")
+
+    def __len__(self) -> int:
+        return len(self.arrValues)
+
+    def __repr__(self) -> str:
+        return f"StringIndex(size={len(self.arrValues)}, trigrams={len(self.dictTrigrams)})"
+
+    def _fnCandidates(self, strKey: str) -> list:
+        """
+        Description:
+            Returns the ascending positions of the keys that contain every
+            trigram of strKey, intersecting the shortest position lists first.
+        """
+        arrPostings: list = []
+        for strGram in set(_fnGrams(strKey)):
+            arrPositions: list = self.dictTrigrams.get(strGram)
+            if arrPositions is None:
+                return []
+            arrPostings.append(arrPositions)
+
+        # A key without trigrams, such as an empty prefix, rules nothing out
+        if not arrPostings:
+            return list(range(len(self.arrKeys)))
+
+        arrPostings.sort(key=len)
+        setCandidates: set = set(arrPostings[0])
+        for arrPositions in arrPostings[1:]:
+            setCandidates.intersection_update(arrPositions)
+            if not setCandidates:
+                return []
+        return sorted(setCandidates)
+
+    def _fnRecord(self, fltStart: float, intCandidates: int) -> None:
+        """
+        Description:
+            Stores the latency and verified candidates of the last query.
+        """
+        self.fltLastSeconds = time.perf_counter() - fltStart
+        self.intLastCandidates = intCandidates
+
+
+def _fnGrams(strText: str, intGram: int = INT_GRAM):
+    """
+    Description:
+        Yields every run of intGram consecutive characters of strText,
+        trigrams by default.
+    """
+    for i in range(len(strText) - intGram + 1):
+        yield strText[i:i + intGram]
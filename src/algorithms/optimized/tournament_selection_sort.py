@@ -0,0 +1,166 @@
+from ..step_trace import SortTrace, fnTraceSort, fnStreamSort, fnDirectionalPasses
+
+# Leaf value of a position that has already been placed
+INT_EMPTY_LEAF: int = -1
+
+
+def fnTournamentSelectionSort(arrInput: list, boolAscending: bool = True, fnKey=None, boolCaseFold: bool = True,
+                              boolLocale: bool = False) -> tuple[list, SortTrace]:
+    """
+    Description:
+        Selection sort that finds the next minimum/maximum with a tournament
+        tree instead of rescanning the unsorted portion. Every internal node of
+        the tree holds the position of the winner of its two children, so the
+        root is the extreme of the unsorted portion. Placing it only changes
+        two leaves (the placed position leaves the tournament and the swapped
+        position gets a new value), and each leaf is replayed up to the root in
+        O(log n), for O(n log n) in total. Ties go to the leftmost position, so
+        the swaps and steps are the same as fnSelectionSortOptimized.
+
+    Parameters:
+        arrInput (list): The array to be sorted, can contain numbers or strings
+        boolAscending (bool): Sort in ascending order if True, descending if False
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively (the default for selection sort)
+        boolLocale (bool): Compare strings using the current locale's collation rules
+
+    Returns:
+        tuple: A tuple containing:
+            - list: The sorted array
+            - SortTrace: Sequence of steps showing the array state after each iteration
+
+    References:
+        https://en.wikipedia.org/wiki/Tournament_sort
+    """
+    return fnTraceSort(_fnTournamentSelectionPasses, arrInput.copy(), boolAscending, fnKey, boolCaseFold, boolLocale)
+
+
+def fnTournamentSelectionSortStream(arrInput: list, boolAscending: bool = True, intMaxSteps: int = None, fnKey=None,
+                                    boolCaseFold: bool = True, boolLocale: bool = False):
+    """
+    Description:
+        Streaming variant of fnTournamentSelectionSort that yields the array
+        state after each placement as soon as it happens.
+
+    Parameters:
+        arrInput (list): The array to be sorted, can contain numbers or strings
+        boolAscending (bool): Sort in ascending order if True, descending if False
+        intMaxSteps (int, optional): Maximum number of steps to yield. Defaults to no limit.
+        fnKey (callable, optional): Function computing each element's sort key, evaluated once per element
+        boolCaseFold (bool): Compare strings case-insensitively (the default for selection sort)
+        boolLocale (bool): Compare strings using the current locale's collation rules
+
+    Returns:
+        generator: Yields each step as a list and returns the sorted array
+    """
+    return fnStreamSort(_fnTournamentSelectionPasses, arrInput.copy(), boolAscending, intMaxSteps, fnKey, boolCaseFold, boolLocale)
+
+
+def _fnBuildTournament(intSize: int) -> tuple[list, int]:
+    """
+    Description:
+        Allocates a tournament tree with one leaf per position, padded with
+        empty leaves up to the next power of two. Node k has the children 2k
+        and 2k + 1, and the leaves start at the returned offset. The internal
+        nodes still have to be played by the caller.
+    """
+    intLeaves: int = 1
+    while intLeaves < intSize:
+        intLeaves *= 2
+
+    arrTree: list = [INT_EMPTY_LEAF] * (2 * intLeaves)
+    arrTree[intLeaves:intLeaves + intSize] = range(intSize)
+    return arrTree, intLeaves
+
+
+def _fnTournamentSelectionAscending(arrResult: list, fnSwap):
+    """
+    Description:
+        Ascending tournament selection sort kernel. Sorts arrResult (the
+        precomputed keys) in place, reports every swap through fnSwap and
+        yields after every placement that moved an element.
+    """
+    intSize: int = len(arrResult)
+    arrTree, intLeaves = _fnBuildTournament(intSize)
+
+    # Play every match once, bottom-up
+    for intNode in range(intLeaves - 1, 0, -1):
+        intLeft: int = arrTree[2 * intNode]
+        intRight: int = arrTree[2 * intNode + 1]
+        if intLeft == INT_EMPTY_LEAF or (intRight != INT_EMPTY_LEAF and arrResult[intRight] < arrResult[intLeft]):
+            arrTree[intNode] = intRight
+        else:
+            arrTree[intNode] = intLeft
+
+    for i in range(intSize):
+        intMinIndex: int = arrTree[1]
+        arrChanged: tuple = (i,)
+
+        if intMinIndex != i:
+            arrResult[i], arrResult[intMinIndex] = arrResult[intMinIndex], arrResult[i]
+            fnSwap(i, intMinIndex)
+            arrChanged = (intMinIndex, i)
+
+        # Position i is placed and leaves the tournament; the swapped position replays its matches
+        arrTree[intLeaves + i] = INT_EMPTY_LEAF
+        for intPosition in arrChanged:
+            intNode = (intLeaves + intPosition) // 2
+            while intNode:
+                intLeft = arrTree[2 * intNode]
+                intRight = arrTree[2 * intNode + 1]
+                if intLeft == INT_EMPTY_LEAF or (intRight != INT_EMPTY_LEAF and arrResult[intRight] < arrResult[intLeft]):
+                    arrTree[intNode] = intRight
+                else:
+                    arrTree[intNode] = intLeft
+                intNode //= 2
+
+        if intMinIndex != i:
+            yield
+
+
+def _fnTournamentSelectionDescending(arrResult: list, fnSwap):
+    """
+    Description:
+        Descending tournament selection sort kernel. Sorts arrResult (the
+        precomputed keys) in place, reports every swap through fnSwap and
+        yields after every placement that moved an element.
+    """
+    intSize: int = len(arrResult)
+    arrTree, intLeaves = _fnBuildTournament(intSize)
+
+    # Play every match once, bottom-up
+    for intNode in range(intLeaves - 1, 0, -1):
+        intLeft: int = arrTree[2 * intNode]
+        intRight: int = arrTree[2 * intNode + 1]
+        if intLeft == INT_EMPTY_LEAF or (intRight != INT_EMPTY_LEAF and arrResult[intRight] > arrResult[intLeft]):
+            arrTree[intNode] = intRight
+        else:
+            arrTree[intNode] = intLeft
+
+    for i in range(intSize):
+        intMaxIndex: int = arrTree[1]
+        arrChanged: tuple = (i,)
+
+        if intMaxIndex != i:
+            arrResult[i], arrResult[intMaxIndex] = arrResult[intMaxIndex], arrResult[i]
+            fnSwap(i, intMaxIndex)
+            arrChanged = (intMaxIndex, i)
+
+        # Position i is placed and leaves the tournament; the swapped position replays its matches
+        arrTree[intLeaves + i] = INT_EMPTY_LEAF
+        for intPosition in arrChanged:
+            intNode = (intLeaves + intPosition) // 2
+            while intNode:
+                intLeft = arrTree[2 * intNode]
+                intRight = arrTree[2 * intNode + 1]
+                if intLeft == INT_EMPTY_LEAF or (intRight != INT_EMPTY_LEAF and arrResult[intRight] > arrResult[intLeft]):
+                    arrTree[intNode] = intRight
+                else:
+                    arrTree[intNode] = intLeft
+                intNode //= 2
+
+        if intMaxIndex != i:
+            yield
+
+
+_fnTournamentSelectionPasses = fnDirectionalPasses(_fnTournamentSelectionAscending, _fnTournamentSelectionDescending)
@@ -0,0 +1,321 @@
+import math
+
+import numpy as np
+
+# Numeric lists from this size on are searched with NumPy, smaller ones in Python
+INT_VECTORIZE_MIN_SIZE: int = 1000
+
+
+class VectorizedSearch:
+    """
+    Description:
+        Sequential search backend for numeric lists. The values are copied
+        once into a contiguous int64 or float64 array, and every query
+        compares the whole buffer in compiled code, so a scan over a million
+        elements takes about a millisecond instead of a Python loop over
+        boxed numbers. First occurrences come from np.argmax on the match
+        mask, and the other queries from np.flatnonzero and np.count_nonzero.
+
+        Lists of ints are stored as int64 and lists of floats as float64. A
+        mix of both is stored as float64 only if every int converts to a
+        float exactly. Targets are converted to the buffer's type the same
+        exact way, and a target that cannot be represented exactly matches
+        nothing, so the answers are the same as a Python comparison.
+
+    Parameters:
+        arrValues (list): The values to search, all ints or floats
+
+    Raises:
+        ValueError: If the values do not fit exactly in an int64 or float64 array
+
+    Example:
+        >>> objEngine = VectorizedSearch([4, 7, 4, 9])
+        >>> objEngine.search(4), objEngine.search_all(4), objEngine.search_range(5, 9)
+        (0, [0, 2], [1, 3])
+    """
+    def __init__(self, arrValues: list):
+        if not fnIsNumeric(arrValues):
+            raise ValueError("VectorizedSearch needs a list of ints or floats")
+        if all(type(varValue) is int for varValue in arrValues):
+            try:
+                self.arrData: np.ndarray = np.array(arrValues, dtype=np.int64)
+            except OverflowError:
+                raise ValueError("VectorizedSearch needs ints that fit in 64 bits") from None
+        else:
+            try:
+                boolExact: bool = all(type(varValue) is not int or float(varValue) == varValue for varValue in arrValues)
+            except OverflowError:
+                boolExact = False
+            if not boolExact:
+                raise ValueError("VectorizedSearch needs ints that are exact as floats when mixed with floats")
+            self.arrData = np.array(arrValues, dtype=np.float64)
+
+    def search(self, varTarget) -> int:
+        """
+        Description:
+            Finds the first occurrence of a value.
+
+        Parameters:
+            varTarget: The target number to search for
+
+        Returns:
+            int: Index of the first occurrence of varTarget if found, -1 otherwise
+        """
+        varTarget = self._fnExactTarget(varTarget)
+        if varTarget is None or not len(self.arrData):
+            return -1
+        arrMatches: np.ndarray = self.arrData == varTarget
+        intIndex: int = int(np.argmax(arrMatches))
+        return intIndex if arrMatches[intIndex] else -1
+
+    def search_all(self, varTarget) -> list:
+        """
+        Description:
+            Finds every occurrence of a value.
+
+        Parameters:
+            varTarget: The target number to search for
+
+        Returns:
+            list: Ascending indices of every occurrence, empty if not found
+        """
+        varTarget = self._fnExactTarget(varTarget)
+        if varTarget is None:
+            return []
+        return np.flatnonzero(self.arrData == varTarget).tolist()
+
+    def count(self, varTarget) -> int:
+        """
+        Description:
+            Counts the occurrences of a value.
+
+        Parameters:
+            varTarget: The target number to count
+
+        Returns:
+            int: Number of occurrences of varTarget
+        """
+        varTarget = self._fnExactTarget(varTarget)
+        if varTarget is None:
+            return 0
+        return int(np.count_nonzero(self.arrData == varTarget))
+
+    def search_range(self, varLow, varHigh) -> list:
+        """
+        Description:
+            Finds every element with varLow <= element <= varHigh.
+
+        Parameters:
+            varLow: Smallest value to match
+            varHigh: Largest value to match
+
+        Returns:
+            list: Ascending indices of the matching elements
+        """
+        varLow = self._fnRangeBound(varLow, boolLow=True)
+        varHigh = self._fnRangeBound(varHigh, boolLow=False)
+        if varLow is None or varHigh is None:
+            return []
+        return np.flatnonzero((self.arrData >= varLow) & (self.arrData <= varHigh)).tolist()
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: "backend" and "buffer_bytes" (size of the typed array)
+        """
+        return {"backend": f"NumPy ({self.arrData.dtype})", "buffer_bytes": self.arrData.nbytes}
+
+    def describe(self) -> str:
+        """
+        Returns:
+            str: Summary of stats() as one caption for the search form
+        """
+        return f"Searched with the {self.stats()['backend']} backend."
+
+    def __len__(self) -> int:
+        return len(self.arrData)
+
+    def __repr__(self) -> str:
+        return f"VectorizedSearch(size={len(self.arrData)}, dtype={self.arrData.dtype})"
+
+    def _fnExactTarget(self, varTarget):
+        """
+        Description:
+            Converts a target to the buffer's type without rounding, or returns
+            None if no element can equal it.
+        """
+        if not fnIsNumeric((varTarget,)):
+            return None
+        if self.arrData.dtype.kind == "f":
+            if type(varTarget) is float:
+                return varTarget
+            try:
+                fltTarget: float = float(varTarget)
+            except OverflowError:
+                # An int too large for a float cannot equal any element
+                return None
+            return fltTarget if fltTarget == varTarget else None
+        if type(varTarget) is float and not varTarget.is_integer():
+            return None
+        intTarget: int = int(varTarget)
+        return intTarget if -2 ** 63 <= intTarget < 2 ** 63 else None
+
+    def _fnRangeBound(self, varBound, boolLow: bool):
+        """
+        Description:
+            Converts a range bound to the buffer's type, rounding inwards so the
+            comparison keeps the exact Python result. Returns None if the bound
+            excludes every possible element.
+        """
+        if self.arrData.dtype.kind == "f":
+            if type(varBound) is float:
+                return varBound
+            try:
+                fltBound: float = float(varBound)
+            except OverflowError:
+                fltBound = math.inf if varBound > 0 else -math.inf
+            if boolLow and fltBound < varBound:
+                fltBound = math.nextafter(fltBound, math.inf)
+            elif not boolLow and fltBound > varBound:
+                fltBound = math.nextafter(fltBound, -math.inf)
+            return fltBound
+
+        if type(varBound) is float:
+            if varBound != varBound:
+                return None
+            if math.isinf(varBound):
+                # Any int outside the int64 range keeps the infinite bound's meaning
+                varBound = -2 ** 64 if varBound < 0 else 2 ** 64
+            else:
+                varBound = math.ceil(varBound) if boolLow else math.floor(varBound)
+        intBound: int = min(max(varBound, -2 ** 63), 2 ** 63 - 1)
+        if (boolLow and varBound > 2 ** 63 - 1) or (not boolLow and varBound < -2 ** 63):
+            return None
+        return intBound
+
+
+class PythonSearch:
+    """
+    Description:
+        Pure-Python sequential search backend with the same queries as
+        VectorizedSearch, for lists that are small or not numeric.
+
+    Parameters:
+        arrValues (list): The values to search, of any comparable type
+    """
+    def __init__(self, arrValues: list):
+        self.arrValues: list = list(arrValues)
+
+    def search(self, varTarget) -> int:
+        """
+        Description:
+            Finds the first occurrence of a value.
+
+        Parameters:
+            varTarget: The target element to search for
+
+        Returns:
+            int: Index of the first occurrence of varTarget if found, -1 otherwise
+        """
+        for intIndex, varValue in enumerate(self.arrValues):
+            if varValue == varTarget:
+                return intIndex
+        return -1
+
+    def search_all(self, varTarget) -> list:
+        """
+        Description:
+            Finds every occurrence of a value.
+
+        Parameters:
+            varTarget: The target element to search for
+
+        Returns:
+            list: Ascending indices of every occurrence, empty if not found
+        """
+        return [intIndex for intIndex, varValue in enumerate(self.arrValues) if varValue == varTarget]
+
+    def count(self, varTarget) -> int:
+        """
+        Description:
+            Counts the occurrences of a value.
+
+        Parameters:
+            varTarget: The target element to count
+
+        Returns:
+            int: Number of occurrences of varTarget
+        """
+        return sum(1 for varValue in self.arrValues if varValue == varTarget)
+
+    def search_range(self, varLow, varHigh) -> list:
+        """
+        Description:
+            Finds every element with varLow <= element <= varHigh.
+
+        Parameters:
+            varLow: Smallest value to match
+            varHigh: Largest value to match
+
+        Returns:
+            list: Ascending indices of the matching elements
+        """
+        return [intIndex for intIndex, varValue in enumerate(self.arrValues) if varLow <= varValue <= varHigh]
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: "backend"
+        """
+        return {"backend": "Python"}
+
+    def describe(self) -> str:
+        """
+        Returns:
+            str: Summary of stats() as one caption for the search form
+        """
+        return f"Searched with the {self.stats()['backend']} backend."
+
+    def __len__(self) -> int:
+        return len(self.arrValues)
+
+    def __repr__(self) -> str:
+        return f"PythonSearch(size={len(self.arrValues)})"
+
+
+def fnCreateSearchEngine(arrValues: list):
+    """
+    Description:
+        Picks the sequential search backend for a list. Numeric lists of at
+        least INT_VECTORIZE_MIN_SIZE elements that fit in a 64-bit array get
+        VectorizedSearch. Smaller lists stay in Python, where copying them
+        into an array costs more than it saves, and so do lists of strings
+        or mixed types.
+
+    Parameters:
+        arrValues (list): The values to search
+
+    Returns:
+        VectorizedSearch | PythonSearch: The search engine for arrValues
+    """
+    if len(arrValues) >= INT_VECTORIZE_MIN_SIZE and fnIsNumeric(arrValues):
+        try:
+            return VectorizedSearch(arrValues)
+        except ValueError:
+            pass
+    return PythonSearch(arrValues)
+
+
+def fnIsNumeric(arrValues) -> bool:
+    """
+    Description:
+        Checks that every value is an int or a float. Bools are left out, so
+        True is not matched as 1.
+
+    Parameters:
+        arrValues (iterable): The values to check
+
+    Returns:
+        bool: True if every value is an int or a float
+    """
+    return all(type(varValue) in (int, float) for varValue in arrValues)
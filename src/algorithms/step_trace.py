@@ -0,0 +1,310 @@
+from array import array
+from collections.abc import Sequence
+import locale
+
+
+class SortTrace(Sequence):
+    """
+    Description:
+        Compact, delta-encoded record of the steps taken by a swap-based sort.
+        Instead of storing a full copy of the array after every step, only the
+        swapped index pairs are kept in an array-backed buffer together with
+        the offset at which each step ends. Any step is rebuilt on demand by
+        replaying the swaps on a copy of the initial array, so the trace
+        behaves like the old list of snapshots (len, indexing, iteration)
+        while using O(swaps) machine integers instead of O(steps * n) objects.
+
+    Parameters:
+        arrInitial (list): The array before sorting starts (copied)
+
+    Example:
+        >>> objTrace = SortTrace([3, 1, 2])
+        >>> objTrace.swap(0, 1); objTrace.end_step()
+        >>> objTrace.swap(1, 2); objTrace.end_step()
+        >>> list(objTrace)
+        [[1, 3, 2], [1, 2, 3]]
+    """
+    def __init__(self, arrInitial: list):
+        self.arrInitial: list = list(arrInitial)
+        # Flattened (i, j) pairs of every swap performed so far
+        self.arrSwaps: array = array('q')
+        # Length of arrSwaps at the end of each recorded step
+        self.arrStepEnds: array = array('Q')
+        # Cursor used to rebuild consecutive steps incrementally
+        self.intCursorStep: int = -1
+        self.arrCursorState: list = None
+
+    def swap(self, i: int, j: int) -> None:
+        """
+        Description:
+            Records that the elements at positions i and j were swapped.
+
+        Parameters:
+            i (int): Index of the first swapped element
+            j (int): Index of the second swapped element
+        """
+        self.arrSwaps.append(i)
+        self.arrSwaps.append(j)
+
+    def end_step(self) -> None:
+        """
+        Description:
+            Closes the current step. Every swap recorded since the previous
+            step boundary becomes part of this step.
+        """
+        self.arrStepEnds.append(len(self.arrSwaps))
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns:
+            int: Size in bytes of the swap and step buffers
+        """
+        return (len(self.arrSwaps) * self.arrSwaps.itemsize
+                + len(self.arrStepEnds) * self.arrStepEnds.itemsize)
+
+    def __len__(self) -> int:
+        return len(self.arrStepEnds)
+
+    def __getitem__(self, varIndex):
+        if isinstance(varIndex, slice):
+            return [self[i] for i in range(*varIndex.indices(len(self)))]
+
+        intSteps: int = len(self.arrStepEnds)
+        if varIndex < 0:
+            varIndex += intSteps
+        if varIndex < 0 or varIndex >= intSteps:
+            raise IndexError("SortTrace index out of range")
+
+        # Restart from the initial array unless we can move the cursor forward
+        if self.arrCursorState is None or varIndex < self.intCursorStep:
+            self.arrCursorState = self.arrInitial.copy()
+            self.intCursorStep = -1
+
+        intFrom: int = self.arrStepEnds[self.intCursorStep] if self.intCursorStep >= 0 else 0
+        self._fnReplay(self.arrCursorState, intFrom, self.arrStepEnds[varIndex])
+        self.intCursorStep = varIndex
+        return self.arrCursorState.copy()
+
+    def __iter__(self):
+        arrState: list = self.arrInitial.copy()
+        intFrom: int = 0
+        for intTo in self.arrStepEnds:
+            self._fnReplay(arrState, intFrom, intTo)
+            intFrom = intTo
+            yield arrState.copy()
+
+    def __repr__(self) -> str:
+        return f"SortTrace(steps={len(self)}, swaps={len(self.arrSwaps) // 2})"
+
+    def _fnReplay(self, arrState: list, intFrom: int, intTo: int) -> None:
+        """
+        Description:
+            Applies the recorded swaps in arrSwaps[intFrom:intTo] to arrState in place.
+        """
+        arrSwaps: array = self.arrSwaps
+        for k in range(intFrom, intTo, 2):
+            i, j = arrSwaps[k], arrSwaps[k + 1]
+            arrState[i], arrState[j] = arrState[j], arrState[i]
+
+
+class ReplayTrace(Sequence):
+    """
+    Description:
+        Step trace for sorts that do not work by swapping, such as merge sort,
+        whose steps cannot be rebuilt from swapped index pairs. Only the input
+        of the sort is kept, and steps are produced by running the sort again
+        from the start. Consecutive steps (iteration or increasing indices)
+        reuse one running replay, so reading the whole trace costs a single
+        extra run of the sort.
+
+    Parameters:
+        fnReplay (callable): Takes no arguments and returns a fresh iterator over every step
+        intSteps (int): Number of steps the replay produces
+    """
+    def __init__(self, fnReplay, intSteps: int):
+        self.fnReplay = fnReplay
+        self.intSteps: int = intSteps
+        # Running replay used to serve consecutive indices
+        self.intCursorStep: int = -1
+        self.iterCursor = None
+        self.arrCursorState: list = None
+
+    def __len__(self) -> int:
+        return self.intSteps
+
+    def __getitem__(self, varIndex):
+        if isinstance(varIndex, slice):
+            return [self[i] for i in range(*varIndex.indices(len(self)))]
+
+        if varIndex < 0:
+            varIndex += self.intSteps
+        if varIndex < 0 or varIndex >= self.intSteps:
+            raise IndexError("ReplayTrace index out of range")
+
+        # Restart the replay unless we can move the cursor forward
+        if self.iterCursor is None or varIndex < self.intCursorStep:
+            self.iterCursor = iter(self.fnReplay())
+            self.intCursorStep = -1
+
+        while self.intCursorStep < varIndex:
+            self.arrCursorState = next(self.iterCursor)
+            self.intCursorStep += 1
+        return self.arrCursorState.copy()
+
+    def __iter__(self):
+        return iter(self.fnReplay())
+
+    def __repr__(self) -> str:
+        return f"ReplayTrace(steps={len(self)})"
+
+
+def _fnIgnoreSwap(i: int, j: int) -> None:
+    """
+    Description:
+        Swap callback used when steps are streamed instead of recorded.
+    """
+
+
+def fnDirectionalPasses(fnAscendingPasses, fnDescendingPasses):
+    """
+    Description:
+        Builds a sort core out of two direction-specialized kernels. The kernel
+        is picked once, before the sort starts, so the inner loops compare with
+        a fixed operator instead of testing the sort direction on every
+        comparison.
+
+    Parameters:
+        fnAscendingPasses (callable): Kernel taking (arrKeys, fnSwap) that sorts ascending
+        fnDescendingPasses (callable): Kernel taking (arrKeys, fnSwap) that sorts descending
+
+    Returns:
+        callable: Sort core taking (arrKeys, boolAscending, fnSwap)
+    """
+    def fnPasses(arrKeys: list, boolAscending: bool, fnSwap):
+        fnKernel = fnAscendingPasses if boolAscending else fnDescendingPasses
+        return fnKernel(arrKeys, fnSwap)
+    return fnPasses
+
+
+def fnBuildSortKeys(arrValues: list, fnKey=None, boolCaseFold: bool = False, boolLocale: bool = False) -> list:
+    """
+    Description:
+        Computes the sort key of every element once, into a list parallel to
+        arrValues, so the sort loops compare precomputed keys instead of
+        calling key functions or allocating lowered strings per comparison.
+        String keys are case-folded and/or transformed with locale.strxfrm
+        (using the current LC_COLLATE locale) when requested.
+
+    Parameters:
+        arrValues (list): The values to be sorted
+        fnKey (callable, optional): Function mapping a value to its sort key. Defaults to the value itself.
+        boolCaseFold (bool): Compare string keys case-insensitively
+        boolLocale (bool): Compare string keys using the current locale's collation rules
+
+    Returns:
+        list: The keys parallel to arrValues, or None when the values can be compared directly
+    """
+    if fnKey is None:
+        if not (boolCaseFold or boolLocale):
+            return None
+        # Case and locale options only affect strings, skip the copy otherwise
+        if not any(isinstance(varValue, str) for varValue in arrValues):
+            return None
+        arrKeys: list = list(arrValues)
+    else:
+        arrKeys: list = [fnKey(varValue) for varValue in arrValues]
+
+    if boolCaseFold:
+        arrKeys = [varKey.casefold() if isinstance(varKey, str) else varKey for varKey in arrKeys]
+    if boolLocale:
+        arrKeys = [locale.strxfrm(varKey) if isinstance(varKey, str) else varKey for varKey in arrKeys]
+    return arrKeys
+
+
+def _fnParallelSwap(arrValues: list, fnSwap):
+    """
+    Description:
+        Wraps a swap callback so every swap made on the key list is mirrored
+        on the value list that travels alongside it.
+    """
+    def fnSwapBoth(i: int, j: int) -> None:
+        arrValues[i], arrValues[j] = arrValues[j], arrValues[i]
+        fnSwap(i, j)
+    return fnSwapBoth
+
+
+def fnTraceSort(fnPasses, arrResult: list, boolAscending: bool, fnKey=None,
+                boolCaseFold: bool = False, boolLocale: bool = False) -> tuple[list, SortTrace]:
+    """
+    Description:
+        Runs a generator-based sort core to completion and records its steps
+        in a SortTrace. The core sorts a list in place, reports every swap
+        through the callback it receives and yields once per step. When a key
+        option is given the core sorts the precomputed keys and each swap is
+        mirrored on arrResult (decorate-sort-undecorate).
+
+    Parameters:
+        fnPasses (callable): Sort core taking (arrKeys, boolAscending, fnSwap)
+        arrResult (list): The array to sort in place
+        boolAscending (bool): Sort in ascending order if True, descending if False
+        fnKey (callable, optional): Function mapping a value to its sort key
+        boolCaseFold (bool): Compare string keys case-insensitively
+        boolLocale (bool): Compare string keys using the current locale's collation rules
+
+    Returns:
+        tuple: A tuple containing:
+            - list: The sorted array (arrResult itself)
+            - SortTrace: Sequence of steps showing the array state after each step
+    """
+    objTrace: SortTrace = SortTrace(arrResult)
+    arrKeys: list = fnBuildSortKeys(arrResult, fnKey, boolCaseFold, boolLocale)
+
+    if arrKeys is None:
+        genPasses = fnPasses(arrResult, boolAscending, objTrace.swap)
+    else:
+        genPasses = fnPasses(arrKeys, boolAscending, _fnParallelSwap(arrResult, objTrace.swap))
+
+    for _ in genPasses:
+        objTrace.end_step()
+    return arrResult, objTrace
+
+
+def fnStreamSort(fnPasses, arrResult: list, boolAscending: bool, intMaxSteps: int = None, fnKey=None,
+                 boolCaseFold: bool = False, boolLocale: bool = False):
+    """
+    Description:
+        Runs a generator-based sort core and yields a snapshot of the array
+        after each step as soon as it happens, without keeping a trace. Once
+        intMaxSteps snapshots have been yielded the sort still runs to the end
+        but no further snapshots are produced.
+
+    Parameters:
+        fnPasses (callable): Sort core taking (arrKeys, boolAscending, fnSwap)
+        arrResult (list): The array to sort in place
+        boolAscending (bool): Sort in ascending order if True, descending if False
+        intMaxSteps (int, optional): Maximum number of snapshots to yield. Defaults to no limit.
+        fnKey (callable, optional): Function mapping a value to its sort key
+        boolCaseFold (bool): Compare string keys case-insensitively
+        boolLocale (bool): Compare string keys using the current locale's collation rules
+
+    Yields:
+        list: The array state after each step
+
+    Returns:
+        list: The sorted array, available as the StopIteration value
+    """
+    arrKeys: list = fnBuildSortKeys(arrResult, fnKey, boolCaseFold, boolLocale)
+
+    if arrKeys is None:
+        genPasses = fnPasses(arrResult, boolAscending, _fnIgnoreSwap)
+    else:
+        genPasses = fnPasses(arrKeys, boolAscending, _fnParallelSwap(arrResult, _fnIgnoreSwap))
+
+    intYielded: int = 0
+    for _ in genPasses:
+        if intMaxSteps is not None and intYielded >= intMaxSteps:
+            continue
+        intYielded += 1
+        yield arrResult.copy()
+    return arrResult
@@ -0,0 +1,67 @@
+import sys
+import time
+
+import numpy as np
+
+from algorithms.brute_force import bubble_sort
+from algorithms.optimized import fnBatchSort, comb_sort
+
+# name: sort called once per row
+DICT_PER_ROW_SORTS: dict = {
+    "Bubble Sort": bubble_sort,
+    "Comb Sort": comb_sort
+}
+TUP_DEFAULT_SHAPES: tuple = ((10000, 5), (10000, 16), (10000, 64))
+
+
+def fnRunBatchBenchmark(arrShapes: tuple = TUP_DEFAULT_SHAPES, intSeed: int = 0) -> list:
+    """
+    Description:
+        Times fnBatchSort on a whole 2-D array of random integers against
+        calling the project sorts once per row on the same data.
+
+    Parameters:
+        arrShapes (tuple): (rows, columns) pairs to benchmark
+        intSeed (int): Seed for the random inputs
+
+    Returns:
+        list: One dict per (algorithm, shape) with the keys "algorithm", "rows",
+              "columns", "seconds" and "rows_per_second"
+    """
+    objRandom = np.random.default_rng(intSeed)
+    arrRows: list = []
+
+    for intRows, intColumns in arrShapes:
+        arrData: np.ndarray = objRandom.integers(1, 100, size=(intRows, intColumns))
+        arrLists: list = arrData.tolist()
+
+        dictTimings: dict = {}
+        fltStart: float = time.perf_counter()
+        fnBatchSort(arrData)
+        dictTimings["Batch Sorting Network"] = time.perf_counter() - fltStart
+
+        for strName, fnSort in DICT_PER_ROW_SORTS.items():
+            fltStart = time.perf_counter()
+            for arrList in arrLists:
+                fnSort(arrList.copy(), True)
+            dictTimings[strName] = time.perf_counter() - fltStart
+
+        for strName, fltSeconds in dictTimings.items():
+            arrRows.append({
+                "algorithm": strName,
+                "rows": intRows,
+                "columns": intColumns,
+                "seconds": fltSeconds,
+                "rows_per_second": intRows / fltSeconds if fltSeconds else float("inf")
+            })
+    return arrRows
+
+
+if __name__ == "__main__":
+    # Usage (from src/): python -m comparison.batch_sort_benchmark [rows columns ...]
+    arrArgs = [int(strArg) for strArg in sys.argv[1:]]
+    arrShapes = tuple(zip(arrArgs[::2], arrArgs[1::2])) or TUP_DEFAULT_SHAPES
+    print(f"{'Algorithm':<25}{'Rows':>8}{'Columns':>9}{'Seconds':>10}{'Rows/s':>14}")
+    for dictRow in fnRunBatchBenchmark(arrShapes):
+        print(f"{dictRow['algorithm']:<25}{dictRow['rows']:>8}{dictRow['columns']:>9}"
+              f"{dictRow['seconds']:>10.4f}{dictRow['rows_per_second']:>14.0f}")
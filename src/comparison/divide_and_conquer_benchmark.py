@@ -0,0 +1,61 @@
+import random
+import sys
+import time
+
+from algorithms.divide_and_conquer import fnMergeSortStream, fnIntrosortStream
+from algorithms.optimized import comb_sort_stream, fnBubbleSortOptimizedStream
+
+# name: (streaming sort, whether it is O(n²))
+DICT_BENCHMARK_SORTS: dict = {
+    "Merge Sort": (fnMergeSortStream, False),
+    "Introsort": (fnIntrosortStream, False),
+    "Comb Sort": (comb_sort_stream, False),
+    "Cocktail Shaker Sort": (fnBubbleSortOptimizedStream, True)
+}
+TUP_DEFAULT_SIZES: tuple = (100000, 1000000, 10000000)
+# Cocktail shaker sort needs hours for 10^5 elements
+INT_DEFAULT_MAX_QUADRATIC_SIZE: int = 20000
+
+
+def fnRunDivideAndConquerBenchmark(arrSizes: tuple = TUP_DEFAULT_SIZES, intSeed: int = 0,
+                                   intMaxQuadraticSize: int = INT_DEFAULT_MAX_QUADRATIC_SIZE) -> list:
+    """
+    Description:
+        Times merge sort and introsort against comb sort and cocktail shaker
+        sort on the same random integer inputs. The streaming variants are run
+        with no step output, so only the sorting itself is measured. The O(n²)
+        sorts are skipped above intMaxQuadraticSize elements.
+
+    Parameters:
+        arrSizes (tuple): Input sizes to benchmark
+        intSeed (int): Seed for the random inputs
+        intMaxQuadraticSize (int): Largest input given to the O(n²) sorts
+
+    Returns:
+        list: One dict per (algorithm, size) with the keys "algorithm", "size"
+              and "seconds" (None when skipped)
+    """
+    objRandom = random.Random(intSeed)
+    arrRows: list = []
+
+    for intSize in arrSizes:
+        arrData: list = [objRandom.randint(0, intSize) for _ in range(intSize)]
+        for strName, (fnStream, boolQuadratic) in DICT_BENCHMARK_SORTS.items():
+            if boolQuadratic and intSize > intMaxQuadraticSize:
+                arrRows.append({"algorithm": strName, "size": intSize, "seconds": None})
+                continue
+
+            fltStart: float = time.perf_counter()
+            for _ in fnStream(arrData.copy(), True, 0):
+                pass
+            arrRows.append({"algorithm": strName, "size": intSize, "seconds": time.perf_counter() - fltStart})
+    return arrRows
+
+
+if __name__ == "__main__":
+    # Usage (from src/): python -m comparison.divide_and_conquer_benchmark [size ...]
+    arrSizes = tuple(int(strArg) for strArg in sys.argv[1:]) or TUP_DEFAULT_SIZES
+    print(f"{'Algorithm':<25}{'Size':>10}{'Seconds':>12}")
+    for dictRow in fnRunDivideAndConquerBenchmark(arrSizes):
+        strSeconds: str = "skipped" if dictRow["seconds"] is None else f"{dictRow['seconds']:.3f}"
+        print(f"{dictRow['algorithm']:<25}{dictRow['size']:>10}{strSeconds:>12}")
@@ -0,0 +1,61 @@
+import random
+import sys
+import time
+
+from algorithms.optimized import (bidirectional_enhanced_selection_sort, fnSelectionSortOptimized,
+                                  fnTournamentSelectionSort)
+
+# name: (sort, whether it rescans the unsorted portion for every selection)
+DICT_SELECTION_SORTS: dict = {
+    "Tournament Selection Sort": (fnTournamentSelectionSort, False),
+    "Optimized Selection Sort": (fnSelectionSortOptimized, True),
+    "Bidirectional Enhanced Selection Sort": (bidirectional_enhanced_selection_sort, True)
+}
+TUP_DEFAULT_SIZES: tuple = (1000, 10000, 100000, 1000000)
+# The O(n²) variants would take hours on the largest inputs
+INT_DEFAULT_MAX_QUADRATIC_SIZE: int = 10000
+
+
+def fnRunSelectionBenchmark(arrSizes: tuple = TUP_DEFAULT_SIZES, intSeed: int = 0,
+                            intMaxQuadraticSize: int = INT_DEFAULT_MAX_QUADRATIC_SIZE) -> list:
+    """
+    Description:
+        Times the tournament selection sort against the two rescanning
+        selection sorts on the same random integer inputs. The rescanning
+        variants are skipped above intMaxQuadraticSize elements.
+
+    Parameters:
+        arrSizes (tuple): Input sizes to benchmark
+        intSeed (int): Seed for the random inputs
+        intMaxQuadraticSize (int): Largest input given to the O(n²) variants
+
+    Returns:
+        list: One dict per (algorithm, size) with the keys "algorithm", "size",
+              "seconds" (None when skipped) and "steps"
+    """
+    objRandom = random.Random(intSeed)
+    arrRows: list = []
+
+    for intSize in arrSizes:
+        arrData: list = [objRandom.randint(0, intSize) for _ in range(intSize)]
+        for strName, (fnSort, boolQuadratic) in DICT_SELECTION_SORTS.items():
+            if boolQuadratic and intSize > intMaxQuadraticSize:
+                arrRows.append({"algorithm": strName, "size": intSize, "seconds": None, "steps": None})
+                continue
+
+            fltStart: float = time.perf_counter()
+            _, arrSteps = fnSort(arrData.copy(), True)
+            fltSeconds: float = time.perf_counter() - fltStart
+
+            arrRows.append({"algorithm": strName, "size": intSize, "seconds": fltSeconds, "steps": len(arrSteps)})
+    return arrRows
+
+
+if __name__ == "__main__":
+    # Usage (from src/): python -m comparison.selection_benchmark [size ...]
+    arrSizes = tuple(int(strArg) for strArg in sys.argv[1:]) or TUP_DEFAULT_SIZES
+    print(f"{'Algorithm':<40}{'Size':>10}{'Seconds':>12}{'Steps':>10}")
+    for dictRow in fnRunSelectionBenchmark(arrSizes):
+        strSeconds: str = "skipped" if dictRow["seconds"] is None else f"{dictRow['seconds']:.3f}"
+        strSteps: str = "-" if dictRow["steps"] is None else str(dictRow["steps"])
+        print(f"{dictRow['algorithm']:<40}{dictRow['size']:>10}{strSeconds:>12}{strSteps:>10}")
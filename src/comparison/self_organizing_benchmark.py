@@ -0,0 +1,134 @@
+import random
+import sys
+import time
+
+from algorithms.brute_force.linear_search import fnLinearSearch
+from algorithms.optimized import SelfOrganizingList, SentinelSearchBuffer
+from algorithms.optimized.self_organizing_list import TUP_STRATEGIES
+
+TUP_WORKLOADS: tuple = ("uniform", "zipf", "shifting")
+INT_DEFAULT_SIZE: int = 1000
+INT_DEFAULT_QUERIES: int = 20000
+FLT_DEFAULT_EXPONENT: float = 1.0
+# Number of times the hot set changes in the "shifting" workload
+INT_DEFAULT_PHASES: int = 4
+
+
+def fnGenerateQueries(arrValues: list, strWorkload: str, intQueries: int, fltExponent: float = FLT_DEFAULT_EXPONENT,
+                      intPhases: int = INT_DEFAULT_PHASES, intSeed: int = 0) -> list:
+    """
+    Description:
+        Generates a seeded stream of lookups over arrValues.
+
+        - "uniform" picks every value with the same probability
+        - "zipf" picks the value of popularity rank k with probability
+          proportional to 1 / k^fltExponent, with the ranks assigned to the
+          values in random order
+        - "shifting" is a Zipf stream whose ranks are shuffled again at the
+          start of each of intPhases equal phases, so the hot set moves
+
+    Parameters:
+        arrValues (list): The values that can be looked up
+        strWorkload (str): One of "uniform", "zipf" or "shifting"
+        intQueries (int): Number of lookups to generate
+        fltExponent (float): Skew of the Zipf distribution, 0 is uniform
+        intPhases (int): Number of hot sets of the "shifting" workload
+        intSeed (int): Seed for the random stream
+
+    Returns:
+        list: The values to look up, in order
+
+    Raises:
+        ValueError: If strWorkload is not one of the workloads
+    """
+    if strWorkload not in TUP_WORKLOADS:
+        raise ValueError(f"strWorkload must be one of {', '.join(TUP_WORKLOADS)}")
+
+    objRandom = random.Random(intSeed)
+    if strWorkload == "uniform":
+        return objRandom.choices(arrValues, k=intQueries)
+
+    arrWeights: list = [1 / intRank ** fltExponent for intRank in range(1, len(arrValues) + 1)]
+    intPhaseCount: int = intPhases if strWorkload == "shifting" else 1
+    arrQueries: list = []
+    for intPhase in range(intPhaseCount):
+        # Rank order of this phase; the most popular value is arrRanked[0]
+        arrRanked: list = objRandom.sample(arrValues, len(arrValues))
+        intCount: int = intQueries * (intPhase + 1) // intPhaseCount - len(arrQueries)
+        arrQueries.extend(objRandom.choices(arrRanked, weights=arrWeights, k=intCount))
+    return arrQueries
+
+
+def fnRunSelfOrganizingBenchmark(intSize: int = INT_DEFAULT_SIZE, intQueries: int = INT_DEFAULT_QUERIES,
+                                 fltExponent: float = FLT_DEFAULT_EXPONENT, arrWorkloads: tuple = TUP_WORKLOADS,
+                                 intSeed: int = 0) -> list:
+    """
+    Description:
+        Replays the same query streams against plain linear search, sentinel
+        search and every SelfOrganizingList strategy, all starting from the
+        same shuffled list of intSize distinct values. Comparisons are
+        counted as the elements looked at by each lookup (the sentinel search
+        also compares the sentinel on a miss), and the reorder cost as the
+        elements shifted by the self-organizing lists.
+
+    Parameters:
+        intSize (int): Number of distinct values in the list
+        intQueries (int): Number of lookups per workload
+        fltExponent (float): Skew of the Zipf workloads
+        arrWorkloads (tuple): Workloads to run, see fnGenerateQueries
+        intSeed (int): Seed for the list order and the query streams
+
+    Returns:
+        list: One dict per (workload, algorithm) with the keys "workload",
+              "algorithm", "mean_comparisons", "seconds" and "shifts"
+    """
+    arrValues: list = list(range(intSize))
+    random.Random(intSeed).shuffle(arrValues)
+    arrRows: list = []
+
+    for strWorkload in arrWorkloads:
+        arrQueries: list = fnGenerateQueries(arrValues, strWorkload, intQueries, fltExponent, intSeed=intSeed)
+
+        fltStart: float = time.perf_counter()
+        arrResults: list = [fnLinearSearch(arrValues, varQuery) for varQuery in arrQueries]
+        fltSeconds: float = time.perf_counter() - fltStart
+        intComparisons: int = sum(intSize if intResult == -1 else intResult + 1 for intResult in arrResults)
+        arrRows.append(_fnRow(strWorkload, "Linear Search", intComparisons / intQueries, fltSeconds, 0))
+
+        objSentinel = SentinelSearchBuffer(arrValues)
+        fltStart = time.perf_counter()
+        arrResults = [objSentinel.search(varQuery) for varQuery in arrQueries]
+        fltSeconds = time.perf_counter() - fltStart
+        intComparisons = sum(intSize + 1 if intResult == -1 else intResult + 1 for intResult in arrResults)
+        arrRows.append(_fnRow(strWorkload, "Sentinel Search", intComparisons / intQueries, fltSeconds, 0))
+
+        for strStrategy in TUP_STRATEGIES:
+            objList = SelfOrganizingList(arrValues, strStrategy)
+            fltStart = time.perf_counter()
+            for varQuery in arrQueries:
+                objList.search(varQuery)
+            fltSeconds = time.perf_counter() - fltStart
+            dictStats: dict = objList.stats()
+            strName: str = "Self-Organizing (" + strStrategy.replace("_", " ") + ")"
+            arrRows.append(_fnRow(strWorkload, strName, dictStats["mean_comparisons"], fltSeconds, dictStats["shifts"]))
+    return arrRows
+
+
+def _fnRow(strWorkload: str, strAlgorithm: str, fltComparisons: float, fltSeconds: float, intShifts: int) -> dict:
+    """
+    Description:
+        Builds one result row of fnRunSelfOrganizingBenchmark.
+    """
+    return {"workload": strWorkload, "algorithm": strAlgorithm, "mean_comparisons": fltComparisons,
+            "seconds": fltSeconds, "shifts": intShifts}
+
+
+if __name__ == "__main__":
+    # Usage (from src/): python -m comparison.self_organizing_benchmark [size [queries [exponent]]]
+    intSize = int(sys.argv[1]) if len(sys.argv) > 1 else INT_DEFAULT_SIZE
+    intQueries = int(sys.argv[2]) if len(sys.argv) > 2 else INT_DEFAULT_QUERIES
+    fltExponent = float(sys.argv[3]) if len(sys.argv) > 3 else FLT_DEFAULT_EXPONENT
+    print(f"{'Workload':<12}{'Algorithm':<35}{'Comparisons':>14}{'Seconds':>10}{'Shifts':>12}")
+    for dictRow in fnRunSelfOrganizingBenchmark(intSize, intQueries, fltExponent):
+        print(f"{dictRow['workload']:<12}{dictRow['algorithm']:<35}{dictRow['mean_comparisons']:>14.1f}"
+              f"{dictRow['seconds']:>10.3f}{dictRow['shifts']:>12}")
@@ -0,0 +1,238 @@
+import random
+import sys
+import time
+
+from algorithms.optimized import (comb_sort_stream, bidirectional_enhanced_selection_sort_stream,
+                                  fnBubbleSortOptimizedStream, fnSelectionSortOptimizedStream)
+
+
+def fnNoSwap(i: int, j: int) -> None:
+    """
+    Description:
+        Swap callback for the legacy loops, so both sides pay for one call per swap.
+    """
+
+
+def fnLegacyCombSort(intArr: list, ascending: bool, fnSwap) -> list:
+    """
+    Description:
+        Comb sort as it was before the direction-specialized kernels, testing
+        the sort direction inside every inner-loop iteration.
+    """
+    intLength = len(intArr)
+    intGap = int(intLength / 1.3)
+    while intGap > 0:
+        boolSwapped = False
+        for i in range(intLength - intGap):
+            if(ascending):
+                if(intArr[i] > intArr[i + intGap]):
+                    intArr[i], intArr[i + intGap] = intArr[i + intGap], intArr[i]
+                    fnSwap(i, i + intGap)
+                    boolSwapped = True
+            else:
+                if(intArr[i] < intArr[i + intGap]):
+                    intArr[i], intArr[i + intGap] = intArr[i + intGap], intArr[i]
+                    fnSwap(i, i + intGap)
+                    boolSwapped = True
+        if intGap > 1:
+            intGap = int(intGap / 1.3)
+        elif not boolSwapped:
+            break
+    return intArr
+
+
+def fnLegacyBidirectionalSelectionSort(intArray: list, ascending: bool, fnSwap) -> list:
+    """
+    Description:
+        Bidirectional enhanced selection sort as it was before the
+        direction-specialized kernels, testing the sort direction inside every
+        inner-loop iteration.
+    """
+    stackMaxLocation = []
+    stackMinLocation = []
+    intEnd = len(intArray)
+    intFront = 0
+    intCurrentMax = 0
+    intCurrentMin = intEnd - 2
+
+    while intFront < intEnd:
+        for i in range(intCurrentMax, intEnd):
+            if(ascending):
+                if(intArray[intCurrentMax] < intArray[i]):
+                    intArray[intCurrentMax], intArray[i - 1] = intArray[i - 1], intArray[intCurrentMax]
+                    fnSwap(intCurrentMax, i - 1)
+                    stackMaxLocation.append(i - 1)
+                    intCurrentMax = i
+            else:
+                if(intArray[intCurrentMax] > intArray[i]):
+                    intArray[intCurrentMax], intArray[i - 1] = intArray[i - 1], intArray[intCurrentMax]
+                    fnSwap(intCurrentMax, i - 1)
+                    stackMaxLocation.append(i - 1)
+                    intCurrentMax = i
+
+        intArray[intCurrentMax], intArray[intEnd - 1] = intArray[intEnd - 1], intArray[intCurrentMax]
+        fnSwap(intCurrentMax, intEnd - 1)
+        intEnd -= 1
+
+        for j in range(intCurrentMin, intFront - 1, -1):
+            if(ascending):
+                if(intArray[intCurrentMin] > intArray[j]):
+                    intArray[intCurrentMin], intArray[j + 1] = intArray[j + 1], intArray[intCurrentMin]
+                    fnSwap(intCurrentMin, j + 1)
+                    stackMinLocation.append(j + 1)
+                    intCurrentMin = j
+            else:
+                if(intArray[intCurrentMin] < intArray[j]):
+                    intArray[intCurrentMin], intArray[j + 1] = intArray[j + 1], intArray[intCurrentMin]
+                    fnSwap(intCurrentMin, j + 1)
+                    stackMinLocation.append(j + 1)
+                    intCurrentMin = j
+
+        intArray[intCurrentMin], intArray[intFront] = intArray[intFront], intArray[intCurrentMin]
+        fnSwap(intCurrentMin, intFront)
+        intFront += 1
+
+        try:
+            intCurrentMax = stackMaxLocation.pop()
+            intCurrentMin = stackMinLocation.pop()
+            if(intCurrentMax == intCurrentMin):
+                break
+        except IndexError:
+            intCurrentMax = intFront
+            intCurrentMin = intEnd
+    return intArray
+
+
+def fnLegacyCocktailShakerSort(arrResult: list, boolAscending: bool, fnSwap) -> list:
+    """
+    Description:
+        Cocktail shaker sort as it was before native descending support: it
+        always sorts ascending, then reverses and copies for descending order.
+    """
+    intStart = 0
+    intEnd = len(arrResult) - 1
+    boolSwapped = True
+    while boolSwapped:
+        boolSwapped = False
+        for i in range(intStart, intEnd):
+            if arrResult[i] > arrResult[i + 1]:
+                arrResult[i], arrResult[i + 1] = arrResult[i + 1], arrResult[i]
+                fnSwap(i, i + 1)
+                boolSwapped = True
+        if not boolSwapped:
+            break
+        boolSwapped = False
+        intEnd -= 1
+        for i in range(intEnd - 1, intStart - 1, -1):
+            if arrResult[i] > arrResult[i + 1]:
+                arrResult[i], arrResult[i + 1] = arrResult[i + 1], arrResult[i]
+                fnSwap(i, i + 1)
+                boolSwapped = True
+        intStart += 1
+    if not boolAscending:
+        arrResult.reverse()
+        arrResult = arrResult.copy()
+    return arrResult
+
+
+def fnLegacySelectionSort(arrResult: list, boolAscending: bool, fnSwap) -> list:
+    """
+    Description:
+        Optimized selection sort as it was before the direction-specialized
+        kernels, testing the sort direction inside every comparison.
+    """
+    intSize = len(arrResult)
+    for i in range(intSize):
+        intMinIndex = i
+        varCurrent = arrResult[i]
+        for j in range(i + 1, intSize):
+            varComp = arrResult[j]
+            if (varComp < varCurrent and boolAscending) or (varComp > varCurrent and not boolAscending):
+                intMinIndex = j
+                varCurrent = varComp
+        if intMinIndex != i:
+            arrResult[i], arrResult[intMinIndex] = arrResult[intMinIndex], arrResult[i]
+            fnSwap(i, intMinIndex)
+    return arrResult
+
+
+def fnDrain(genSort) -> None:
+    """
+    Description:
+        Runs a streaming sort to completion without keeping any step.
+    """
+    for _ in genSort:
+        pass
+
+
+DICT_KERNEL_PAIRS: dict = {
+    "Comb Sort": (fnLegacyCombSort, lambda arr, asc: fnDrain(comb_sort_stream(arr, asc, 0))),
+    "Bidirectional Enhanced Selection Sort": (fnLegacyBidirectionalSelectionSort,
+                                              lambda arr, asc: fnDrain(bidirectional_enhanced_selection_sort_stream(arr, asc, 0))),
+    "Cocktail Shaker Sort": (fnLegacyCocktailShakerSort, lambda arr, asc: fnDrain(fnBubbleSortOptimizedStream(arr, asc, 0))),
+    "Optimized Selection Sort": (fnLegacySelectionSort, lambda arr, asc: fnDrain(fnSelectionSortOptimizedStream(arr, asc, 0)))
+}
+
+
+def fnBestTime(fnSort, arrData: list, boolAscending: bool, intRepeats: int) -> float:
+    """
+    Description:
+        Returns the fastest of intRepeats runs of fnSort on copies of arrData.
+    """
+    fltBest: float = float("inf")
+    for _ in range(intRepeats):
+        arrCopy: list = arrData.copy()
+        fltStart: float = time.perf_counter()
+        fnSort(arrCopy, boolAscending)
+        fltBest = min(fltBest, time.perf_counter() - fltStart)
+    return fltBest
+
+
+def fnRunKernelBenchmark(arrSizes: tuple = (10000,), intSeed: int = 0, arrAlgorithms: list = None,
+                         intRepeats: int = 3) -> list:
+    """
+    Description:
+        Times the legacy per-comparison-branching loops against the
+        direction-specialized kernels on the same random integer inputs, in
+        both directions, without recording steps. Each timing is the best of
+        intRepeats runs to filter out scheduler noise.
+
+    Parameters:
+        arrSizes (tuple): Input sizes to benchmark
+        intSeed (int): Seed for the random inputs
+        arrAlgorithms (list, optional): Names from DICT_KERNEL_PAIRS to run. Defaults to all of them.
+        intRepeats (int): Number of runs per measurement
+
+    Returns:
+        list: One dict per (algorithm, size, direction) with the keys "algorithm", "size",
+              "ascending", "legacy_seconds", "specialized_seconds" and "speedup"
+    """
+    objRandom = random.Random(intSeed)
+    arrRows: list = []
+
+    for intSize in arrSizes:
+        arrData: list = [objRandom.randint(0, intSize) for _ in range(intSize)]
+        for strName in arrAlgorithms or DICT_KERNEL_PAIRS:
+            fnLegacy, fnSpecialized = DICT_KERNEL_PAIRS[strName]
+            for boolAscending in (True, False):
+                fltLegacy = fnBestTime(lambda arr, asc: fnLegacy(arr, asc, fnNoSwap), arrData, boolAscending, intRepeats)
+                fltSpecialized = fnBestTime(fnSpecialized, arrData, boolAscending, intRepeats)
+
+                arrRows.append({
+                    "algorithm": strName,
+                    "size": intSize,
+                    "ascending": boolAscending,
+                    "legacy_seconds": fltLegacy,
+                    "specialized_seconds": fltSpecialized,
+                    "speedup": fltLegacy / fltSpecialized if fltSpecialized else float("inf")
+                })
+    return arrRows
+
+
+if __name__ == "__main__":
+    # Usage (from src/): python -m comparison.sort_kernel_benchmark [size ...]
+    arrSizes = tuple(int(strArg) for strArg in sys.argv[1:]) or (10000,)
+    print(f"{'Algorithm':<40}{'Size':>8}{'Order':>6}{'Legacy (s)':>12}{'Kernel (s)':>12}{'Speedup':>9}")
+    for dictRow in fnRunKernelBenchmark(arrSizes):
+        print(f"{dictRow['algorithm']:<40}{dictRow['size']:>8}{'asc' if dictRow['ascending'] else 'desc':>6}"
+              f"{dictRow['legacy_seconds']:>12.3f}{dictRow['specialized_seconds']:>12.3f}{dictRow['speedup']:>8.2f}x")
@@ -1,10 +1,13 @@
+import pandas as pd
 import streamlit as st
+from comparison.self_organizing_benchmark import fnRunSelfOrganizingBenchmark, TUP_WORKLOADS
 
 def analysis():
     st.title("Algorithm Analysis")
 
-    selection, bubble, linear, tsp, kp  = st.tabs(["Selection Sort", "Bubble Sort", "Sequential Search", 
-                                                   "Traveling Salesman Problem", "Knapsack Problem"])
+    selection, bubble, linear, self_organizing, tsp, kp  = st.tabs(["Selection Sort", "Bubble Sort", "Sequential Search",
+                                                                    "Self-Organizing Search",
+                                                                    "Traveling Salesman Problem", "Knapsack Problem"])
     
     with selection:     
         st.subheader("Time Complexity Analysis")
@@ -136,6 +139,44 @@ def analysis():
                     = O(n) 
             """)
          
+    with self_organizing:
+        st.subheader("Self-Organizing Search under Skewed Access")
+        st.markdown("""
+            Replays the same seeded query streams against plain linear search, sentinel search and the
+            three self-organizing list strategies. **Uniform** looks up every value equally often, **Zipf**
+            makes the value of popularity rank k proportionally 1/k^s as likely, and **Shifting** is a Zipf
+            stream whose hot set changes four times. Fewer comparisons per lookup means the reordering pays
+            off; shifts are the elements moved by the reorders.
+        """)
+        size_col, queries_col, exponent_col = st.columns(3)
+        with size_col:
+            list_size = st.number_input("List size", min_value=10, max_value=5000, value=500, step=10,
+                                        key="sol_benchmark_size")
+        with queries_col:
+            query_count = st.number_input("Queries per workload", min_value=100, max_value=50000, value=5000,
+                                          step=100, key="sol_benchmark_queries")
+        with exponent_col:
+            zipf_exponent = st.slider("Zipf exponent", min_value=0.0, max_value=3.0, value=1.0, step=0.1,
+                                      key="sol_benchmark_exponent")
+
+        if st.button("Run benchmark", key="sol_benchmark_btn"):
+            with st.spinner("Replaying the query streams..."):
+                benchmark_rows = fnRunSelfOrganizingBenchmark(int(list_size), int(query_count), float(zipf_exponent))
+            results = pd.DataFrame(benchmark_rows).rename(columns={
+                "workload": "Workload",
+                "algorithm": "Algorithm",
+                "mean_comparisons": "Comparisons per lookup",
+                "seconds": "Wall time (s)",
+                "shifts": "Elements shifted"
+            })
+            st.dataframe(results, hide_index=True, use_container_width=True)
+            st.bar_chart(
+                results.pivot(index="Workload", columns="Algorithm", values="Comparisons per lookup").reindex(
+                    list(TUP_WORKLOADS)),
+                stack=False,
+                y_label="Comparisons per lookup"
+            )
+
     with tsp:
         st.subheader("Time Complexity Analysis")
         st.markdown("""
@@ -1,7 +1,8 @@
 import streamlit as st
 from utils.components import sorting_form, item_adder, knapsack_form, tsp_form, sequential_search_form
 
-from algorithms.brute_force import bubble_sort, selection_sort, linear_search, knapsack_problem, travelling_salesman
+from algorithms.brute_force import (bubble_sort, bubble_sort_stream, selection_sort, selection_sort_stream, linear_search,
+                                    knapsack_problem, travelling_salesman)
 
 
 def brute_force_page():
@@ -16,10 +17,10 @@ def brute_force_page():
     ])
 
     with bubble_tab:
-        sorting_form(key="bubble_sort", sorting_function=bubble_sort)
+        sorting_form(key="bubble_sort", sorting_function=bubble_sort, stream_function=bubble_sort_stream)
 
     with select_tab:
-        sorting_form(key="selection_sort", sorting_function=selection_sort)
+        sorting_form(key="selection_sort", sorting_function=selection_sort, stream_function=selection_sort_stream)
 
     with search_tab:
         sequential_search_form(key="sequential_search", search_function=linear_search)
@@ -1,16 +1,35 @@
+from functools import partial
+
 import streamlit as st
-from utils.components import sorting_form, item_adder, knapsack_form, tsp_form, sequential_search_form
-from algorithms.optimized import (optimized_bubble_sort, optimized_linear_search, optimized_selection_sort, knapsack_optimize, fnTSPOptimized,
-                                  branch_and_bound_tsp, dynamic_programming_knapsack, fnSelfOrganizingSearch, comb_sort, bidirectional_enhanced_selection_sort)
+from utils.components import sorting_form, item_adder, knapsack_form, tsp_form, sequential_search_form, mapped_search_form
+from algorithms.optimized import (optimized_bubble_sort, optimized_selection_sort, knapsack_optimize, fnTSPOptimized,
+                                  branch_and_bound_tsp, branch_and_bound_tsp_with_incumbent, dynamic_programming_knapsack, SelfOrganizingList, comb_sort, bidirectional_enhanced_selection_sort,
+                                  comb_sort_stream, bidirectional_enhanced_selection_sort_stream, fnAdaptiveSort,
+                                  fnAdaptiveSortStream, fnExplainAdaptiveSort, fnTournamentSelectionSort, fnTournamentSelectionSortStream,
+                                  fnPartialSelectionSort, fnPartialSelectionSortStream, fnAbsorbSorted,
+                                  IndexedSearch, fnBatchLinearSearch, fnCreateSearchEngine, BloomFilteredSearch,
+                                  MappedColumnSearch, fnWriteRandomColumn, StringIndex, SentinelSearchBuffer,
+                                  IndexedSelfOrganizingList)
+from algorithms.divide_and_conquer import fnMergeSort, fnMergeSortStream, fnIntrosort, fnIntrosortStream
+from algorithms.decrease_and_conquer import (fnBinarySearch, fnExponentialSearch, fnInterpolationSearch, fnQuickSelect,
+                                             fnMedianOfMedians)
+from algorithms.greedy import fnGreedyKnapsack, fnNearestNeighborTSP, fnCheapestInsertionTSP
+from algorithms.optimized.self_organizing_list import TUP_STRATEGIES
+
+# One factory per engine and strategy, created once so the search form keeps its engine between reruns
+self_organizing_engines = {(engine, strategy): partial(engine, strStrategy=strategy)
+                           for engine in (SelfOrganizingList, IndexedSelfOrganizingList) for strategy in TUP_STRATEGIES}
 
 
 def optimized_page():
     st.title("Optimized Algorithms")
 
-    bubble_tab, select_tab, search_tab, knap_tab, tsp_tab = st.tabs([
+    bubble_tab, select_tab, divide_tab, search_tab, decrease_tab, knap_tab, tsp_tab = st.tabs([
         "Bubble Sort",
-        "Selection Sort", 
+        "Selection Sort",
+        "Divide and Conquer",
         "Sequential Search",
+        "Decrease and Conquer",
         "Knapsack Problem",
         "Travelling Salesman"
     ])
@@ -18,59 +37,140 @@ def optimized_page():
     with bubble_tab:
         bb_options = {
             "Comb Sort": comb_sort,
-            "Cocktail Shaker Sort": optimized_bubble_sort.fnBubbleSortOptimized
+            "Cocktail Shaker Sort": optimized_bubble_sort.fnBubbleSortOptimized,
+            "Auto": fnAdaptiveSort
+        }
+        bb_stream_options = {
+            "Comb Sort": comb_sort_stream,
+            "Cocktail Shaker Sort": optimized_bubble_sort.fnBubbleSortOptimizedStream,
+            "Auto": fnAdaptiveSortStream
         }
 
         # Bubble Sort
-        bb_sorting_options = ["Comb Sort", "Cocktail Shaker Sort"]
+        bb_sorting_options = ["Comb Sort", "Cocktail Shaker Sort", "Auto"]
         selected_optimized_bb_algo = st.segmented_control(
             "Choose optimized algorithms", bb_sorting_options, selection_mode="single", key="bubble_sort"
         )
 
         if selected_optimized_bb_algo:
-            sorting_form(key="bubble_sort", sorting_function=bb_options[selected_optimized_bb_algo])
+            sorting_form(key="bubble_sort", sorting_function=bb_options[selected_optimized_bb_algo],
+                         stream_function=bb_stream_options[selected_optimized_bb_algo],
+                         explain_function=fnExplainAdaptiveSort if selected_optimized_bb_algo == "Auto" else None)
 
     # Selection Sort
     with select_tab:
         ss_options = {
             "Bidirectional Enhanced Selection Sort": bidirectional_enhanced_selection_sort,
-            "Optimized Selection Sort": optimized_selection_sort.fnSelectionSortOptimized
+            "Optimized Selection Sort": optimized_selection_sort.fnSelectionSortOptimized,
+            "Tournament Selection Sort": fnTournamentSelectionSort,
+            "Partial Selection Sort (Top k)": fnPartialSelectionSort
+        }
+        ss_stream_options = {
+            "Bidirectional Enhanced Selection Sort": bidirectional_enhanced_selection_sort_stream,
+            "Optimized Selection Sort": optimized_selection_sort.fnSelectionSortOptimizedStream,
+            "Tournament Selection Sort": fnTournamentSelectionSortStream,
+            "Partial Selection Sort (Top k)": fnPartialSelectionSortStream
         }
 
         # Selection Sort
-        ss_sorting_options = ["Bidirectional Enhanced Selection Sort", "Optimized Selection Sort"]
+        ss_sorting_options = ["Bidirectional Enhanced Selection Sort", "Optimized Selection Sort", "Tournament Selection Sort",
+                              "Partial Selection Sort (Top k)"]
         selected_optimized_ss_algo = st.segmented_control(
                 "Choose optimized algorithms", ss_sorting_options, selection_mode="single", key="selection_sort"
         )
 
         if selected_optimized_ss_algo:
-            sorting_form(key="selection_sort", sorting_function=ss_options[selected_optimized_ss_algo])
+            sorting_form(key="selection_sort", sorting_function=ss_options[selected_optimized_ss_algo],
+                         stream_function=ss_stream_options[selected_optimized_ss_algo],
+                         top_k=selected_optimized_ss_algo == "Partial Selection Sort (Top k)")
+
+    # Divide and Conquer
+    with divide_tab:
+        dc_options = {
+            "Merge Sort": fnMergeSort,
+            "Introsort": fnIntrosort
+        }
+        dc_stream_options = {
+            "Merge Sort": fnMergeSortStream,
+            "Introsort": fnIntrosortStream
+        }
+
+        dc_sorting_options = ["Merge Sort", "Introsort"]
+        selected_optimized_dc_algo = st.segmented_control(
+                "Choose optimized algorithms", dc_sorting_options, selection_mode="single", key="divide_and_conquer"
+        )
+
+        if selected_optimized_dc_algo:
+            sorting_form(key="divide_and_conquer", sorting_function=dc_options[selected_optimized_dc_algo],
+                         stream_function=dc_stream_options[selected_optimized_dc_algo], absorb_function=fnAbsorbSorted)
 
     # Search 
     with search_tab:
-        search_options = {
-            "Optimized Linear Search": optimized_linear_search.fnSentinelLinearSearch,
-            "Self Organizing List": fnSelfOrganizingSearch
+        # Engines build an index over the list once instead of scanning on every query
+        search_engines = {
+            "Optimized Linear Search": SentinelSearchBuffer,
+            "Self Organizing List": SelfOrganizingList,
+            "Indexed Search": IndexedSearch,
+            "Indexed Self Organizing List": IndexedSelfOrganizingList,
+            "Vectorized Search": fnCreateSearchEngine,
+            "Bloom-Filtered Search": BloomFilteredSearch,
+            "String Index": StringIndex
         }
 
         # Selection Sort
-        search_sorting_options = ["Optimized Linear Search", "Self Organizing List"]
+        search_sorting_options = ["Optimized Linear Search", "Self Organizing List", "Indexed Search",
+                                  "Indexed Self Organizing List", "Vectorized Search", "Bloom-Filtered Search", "String Index",
+                                  "Memory-Mapped File"]
         selected_optimized_search_algo = st.segmented_control(
                 "Choose optimized algorithms", search_sorting_options, selection_mode="single", key="search"
         )
 
-        if selected_optimized_search_algo:
-            sequential_search_form(key="search", search_function=search_options[selected_optimized_search_algo])
+        if selected_optimized_search_algo == "Memory-Mapped File":
+            # Searches a column file in windows instead of a list held in the session
+            mapped_search_form(key="mapped_search", search_engine=MappedColumnSearch, write_sample=fnWriteRandomColumn)
+        elif selected_optimized_search_algo:
+            search_engine = search_engines[selected_optimized_search_algo]
+            if search_engine in (SelfOrganizingList, IndexedSelfOrganizingList):
+                strategy = st.radio("Reordering strategy", TUP_STRATEGIES, index=TUP_STRATEGIES.index("count"),
+                                    format_func=lambda name: name.replace("_", " ").capitalize(), horizontal=True,
+                                    key="search_strategy")
+                search_engine = self_organizing_engines[(search_engine, strategy)]
+            sequential_search_form(key="search", search_engine=search_engine,
+                                   batch_function=fnBatchLinearSearch if selected_optimized_search_algo == "Optimized Linear Search" else None,
+                                   string_queries=selected_optimized_search_algo == "String Index")
+
+    # Decrease and Conquer
+    with decrease_tab:
+        dec_options = {
+            "Binary Search": fnBinarySearch,
+            "Exponential Search": fnExponentialSearch,
+            "Interpolation Search": fnInterpolationSearch,
+            "Quickselect": fnQuickSelect,
+            "Median of Medians": fnMedianOfMedians
+        }
+        # k-th smallest queries work on the list as generated, the searches on a sorted copy
+        dec_rank_queries = ["Quickselect", "Median of Medians"]
+
+        dec_search_options = ["Binary Search", "Exponential Search", "Interpolation Search", "Quickselect", "Median of Medians"]
+        selected_optimized_dec_algo = st.segmented_control(
+                "Choose optimized algorithms", dec_search_options, selection_mode="single", key="decrease_and_conquer"
+        )
+
+        if selected_optimized_dec_algo:
+            is_rank_query = selected_optimized_dec_algo in dec_rank_queries
+            sequential_search_form(key="decrease_and_conquer", search_function=dec_options[selected_optimized_dec_algo],
+                                   sorted_input=not is_rank_query, rank_query=is_rank_query)
 
     # Knapsack Problem
     with knap_tab:
         knapsack_options = {
             "Dynamic Programming for Knapsack": dynamic_programming_knapsack,
-            "Knapsack Optimized": knapsack_optimize
+            "Knapsack Optimized": knapsack_optimize,
+            "Greedy 0/1 Knapsack": fnGreedyKnapsack
         }
 
         # Knapsack Problem
-        knap_sorting_options = ["Dynamic Programming for Knapsack", "Knapsack Optimized"]
+        knap_sorting_options = ["Dynamic Programming for Knapsack", "Knapsack Optimized", "Greedy 0/1 Knapsack"]
         selected_optimized_knap_algo = st.segmented_control(
                 "Choose optimized algorithms", knap_sorting_options, selection_mode="single", key="knapsack"
         )
@@ -82,11 +182,16 @@ def optimized_page():
     with tsp_tab:
         tsp_options = {
             "Dynamic Programming for TSP": fnTSPOptimized,
-            "Branch and Bound": branch_and_bound_tsp
+            "Branch and Bound": branch_and_bound_tsp,
+            # The greedy tour prunes the search, so fewer complete paths are listed
+            "Branch and Bound with Greedy Incumbent": branch_and_bound_tsp_with_incumbent,
+            "Nearest Neighbor": fnNearestNeighborTSP,
+            "Cheapest Insertion": fnCheapestInsertionTSP
         }
 
         # Travelling Salesman Problem
-        tsp_sorting_options = ["Dynamic Programming for TSP", "Branch and Bound"]
+        tsp_sorting_options = ["Dynamic Programming for TSP", "Branch and Bound", "Branch and Bound with Greedy Incumbent",
+                               "Nearest Neighbor", "Cheapest Insertion"]
         selected_optimized_tsp_algo = st.segmented_control(
                 "Choose optimized algorithms", tsp_sorting_options, selection_mode="single", key="tsp"
         )
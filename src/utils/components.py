@@ -1,8 +1,32 @@
 import streamlit as st
+import os
 import random
+import tempfile
+import time
+
+def _consume_sort_stream(sort_stream, max_steps):
+    """
+    Writes each step yielded by a streaming sort as soon as it is produced,
+    up to max_steps, and returns the sorted list, the number of steps shown
+    and whether the stream had more steps than were shown. The stream should
+    be allowed one step more than max_steps, so a sort that needs exactly
+    max_steps steps is not reported as cut off.
+    """
+    shown_steps = 0
+    truncated = False
+    while True:
+        try:
+            step = next(sort_stream)
+        except StopIteration as stop:
+            return stop.value, shown_steps, truncated
+        if shown_steps == max_steps:
+            truncated = True
+            continue
+        shown_steps += 1
+        st.write(f"Step {shown_steps}: {step}")
 
 @st.fragment
-def sorting_form(key, sorting_function):
+def sorting_form(key, sorting_function, stream_function=None, explain_function=None, top_k=False, absorb_function=None):
     col1, col2 = st.columns([1, 3])
     with col1:
         list_generator = st.radio(
@@ -18,6 +42,26 @@ def sorting_form(key, sorting_function):
             "Sort Ascending",
             key=f"{key}_toggle_ascending"
         )
+        if stream_function:
+            max_steps = st.number_input(
+                "Maximum steps to display",
+                min_value=1,
+                value=100,
+                step=1,
+                format="%d",
+                key=f"{key}_max_steps"
+            )
+        # Partial sorts only place the first k elements
+        sort_kwargs = {}
+        if top_k:
+            sort_kwargs["intK"] = int(st.number_input(
+                "k",
+                min_value=1,
+                value=10,
+                step=1,
+                format="%d",
+                key=f"{key}_top_k"
+            ))
 
         input_values = ""
         list_length = 5
@@ -77,17 +121,73 @@ def sorting_form(key, sorting_function):
                     st.write("Unsorted list:")
                     st.write(list_values)
 
-                with sorted_col:
-                    sorted_list, sorting_steps = sorting_function(list_values, is_ascending)
+                if explain_function:
+                    # Tell the user which algorithm the dispatcher picked and why
+                    chosen_algorithm, reason = explain_function(list_values, is_ascending)
+                    st.info(f"Ran **{chosen_algorithm}**. {reason}")
+                    # The sort runs what was just explained instead of measuring the list again
+                    sort_kwargs["strChoice"] = chosen_algorithm
+
+                if stream_function:
+                    # Stream the steps so they show up while the sort is still running
+                    with sorted_col:
+                        st.write(f"Top {sort_kwargs['intK']}:" if top_k else "Sorted list:")
+                        sorted_placeholder = st.empty()
+
+                    with st.expander("Click this to view the sorting steps", expanded=False):
+                        sorted_list, shown_steps, truncated = _consume_sort_stream(
+                            stream_function(list_values, is_ascending, int(max_steps) + 1, **sort_kwargs),
+                            int(max_steps)
+                        )
+                        if not shown_steps:
+                            st.write("The list was already sorted.")
+                        elif truncated:
+                            st.caption(f"Showing the first {shown_steps} steps.")
+
+                    sorted_placeholder.write(sorted_list)
+                else:
+                    with sorted_col:
+                        sorted_list, sorting_steps = sorting_function(list_values, is_ascending, **sort_kwargs)
+                        st.write(f"Top {sort_kwargs['intK']}:" if top_k else "Sorted list:")
+                        st.write(sorted_list)
+
+                    with st.expander("Click this to view the sorting steps", expanded=False):
+                        if sorting_steps:
+                            for i, step in enumerate(sorting_steps):
+                                st.write(f"Step {i+1}: {step}")
+                        else:
+                            st.write("The list was already sorted.")
+
+                st.session_state[f"{key}_last_sorted"] = (sorted_list, is_ascending)
+
+        # Insert new values into the last sorted list instead of sorting everything again
+        if absorb_function and st.session_state.get(f"{key}_last_sorted"):
+            absorb_values = st.text_input(
+                "Add values to the sorted list (separated by commas)",
+                key=f"{key}_absorb_input"
+            )
+            if st.button("Insert", key=f"{key}_absorb_btn"):
+                last_sorted, was_ascending = st.session_state[f"{key}_last_sorted"]
+                new_values = [item.strip() for item in absorb_values.split(",") if item.strip()]
+                # Parse by the type of the stored list, the toggle may have changed since it was sorted
+                if isinstance(last_sorted[0], int) if last_sorted else is_number_range:
+                    try:
+                        new_values = [int(item) for item in new_values]
+                    except ValueError:
+                        st.error("Please enter valid numbers separated by commas")
+                        return
+                if not new_values:
+                    st.error("Please enter at least one value")
+                    return
+
+                sorted_list, insert_steps = absorb_function(last_sorted, new_values, was_ascending)
+                st.session_state[f"{key}_last_sorted"] = (sorted_list, was_ascending)
+                with col2.container(border=True):
                     st.write("Sorted list:")
                     st.write(sorted_list)
-
-                with st.expander("Click this to view the sorting steps", expanded=False):
-                    if sorting_steps:
-                        for i, step in enumerate(sorting_steps):
+                    with st.expander("Click this to view the insertion steps", expanded=False):
+                        for i, step in enumerate(insert_steps):
                             st.write(f"Step {i+1}: {step}")
-                    else:
-                        st.write("The list was already sorted.")
 
 @st.fragment
 def item_adder(item_key, on_delete):
@@ -329,10 +429,8 @@ def tsp_form(key, tsp_function):
                                         unsafe_allow_html=True
                                     )
 
-def sequential_search_form(key, search_function):
-    # Check if this is the self-organizing list function
-    is_self_organizing = search_function.__name__ == "fnSelfOrganizingSearch"
-    
+def sequential_search_form(key, search_function=None, sorted_input=False, rank_query=False, search_engine=None,
+                           batch_function=None, string_queries=False):
     col1, col2 = st.columns([1, 3])
     with col1:
         list_generator = st.radio(
@@ -396,25 +494,27 @@ def sequential_search_form(key, search_function):
                 else:
                     st.error("Please enter some values or choose 'Generate Random Values'")
                     return
-            
+
+            # Searches over sorted data sort the list once, then answer every query from it
+            if sorted_input:
+                list_values.sort()
+
             # Reset the search history when generating a new list
             st.session_state[f"{key}_list_values"] = list_values
-            if is_self_organizing:
-                # Clear any previous access counts when a new list is generated
-                list_id = id(list_values)
-                session_key = f"sol_counts_{list_id}"
-                if session_key in st.session_state:
-                    del st.session_state[session_key]
-                st.session_state[f"{key}_search_history"] = []
+            st.session_state[f"{key}_search_history"] = []
+            if search_engine:
+                # Engines index the list once and answer every later query from the index
+                st.session_state[f"{key}_engine"] = search_engine(list_values)
+                st.session_state[f"{key}_engine_type"] = search_engine
 
         # Show the generated list if present
         list_values = st.session_state.get(f"{key}_list_values", [])
         if list_values:
-            st.write("List:")
+            st.write("Sorted list:" if sorted_input else "List:")
             st.write(list_values)
             
             # For self-organizing list, show search history
-            if is_self_organizing and f"{key}_search_history" in st.session_state:
+            if f"{key}_search_history" in st.session_state:
                 search_history = st.session_state[f"{key}_search_history"]
                 if search_history:
                     with st.expander("Search History", expanded=False):
@@ -426,17 +526,53 @@ def sequential_search_form(key, search_function):
 
         # Target input and search button (only if list is present)
         if list_values:
-            search_target = st.text_input(
-                "Enter the value to search for",
-                key=f"{key}_search_target"
-            )
+            if rank_query:
+                target_label = "Enter k (1 = smallest)"
+            elif batch_function:
+                target_label = "Enter the value to search for (separate several values with commas)"
+            else:
+                target_label = "Enter the value to search for"
+            search_target = st.text_input(target_label, key=f"{key}_search_target")
+            match = "Exact"
+            if string_queries and not is_number_range:
+                match = st.radio("Match", ["Exact", "Case-insensitive", "Prefix", "Substring"], horizontal=True,
+                                 key=f"{key}_match")
             if st.button("Search", key=f"{key}_search_btn"):
                 with col2.container(border=True):
                     if not search_target:
                         st.error("Please enter a value to search for.")
                         return
+                    if batch_function and "," in search_target:
+                        # Several targets are searched together in one pass over the list
+                        targets = [item.strip() for item in search_target.split(",") if item.strip()]
+                        if is_number_range:
+                            try:
+                                targets = [int(item) for item in targets]
+                            except ValueError:
+                                st.error("Please enter valid numbers separated by commas.")
+                                return
+
+                        start_time = time.perf_counter()
+                        found = batch_function(list_values, targets, True)
+                        elapsed_time = time.perf_counter() - start_time
+
+                        for target in dict.fromkeys(targets):
+                            positions = found[target]
+                            if positions:
+                                st.success(f"Value '{target}' found at index {positions[0]}"
+                                           + (f" (all occurrences: {positions})." if len(positions) > 1 else "."))
+                            else:
+                                st.warning(f"Value '{target}' not found in the list.")
+                        st.caption(f"Searched for {len(found)} values in a single pass in {elapsed_time * 1000:.3f} ms.")
+                        return
                     # Convert search_target to correct type
-                    if is_number_range:
+                    if rank_query:
+                        try:
+                            target = int(search_target)
+                        except ValueError:
+                            st.error("Please enter a whole number for k.")
+                            return
+                    elif is_number_range:
                         try:
                             target = int(search_target)
                         except ValueError:
@@ -449,7 +585,27 @@ def sequential_search_form(key, search_function):
                     list_copy = list_values.copy()
                     
                     # Perform the search
-                    result = search_function(list_values, target)
+                    occurrences = None
+                    if search_engine:
+                        engine = st.session_state.get(f"{key}_engine")
+                        if (engine is None or len(engine) != len(list_values)
+                                or st.session_state.get(f"{key}_engine_type") is not search_engine):
+                            engine = search_engine(list_values)
+                            st.session_state[f"{key}_engine"] = engine
+                            st.session_state[f"{key}_engine_type"] = search_engine
+                        if match == "Exact":
+                            occurrences = engine.search_all(target)
+                            result = engine.search(target)
+                        else:
+                            # String indexes answer the other matches from their trigram index
+                            match_queries = {"Case-insensitive": engine.search_casefold,
+                                             "Prefix": engine.search_prefix, "Substring": engine.search_substring}
+                            occurrences = match_queries[match](target)
+                            result = occurrences[0] if occurrences else -1
+                        # Engines that reorder on access (self-organizing lists) own the current order
+                        list_values = list(getattr(engine, "arrValues", list_values))
+                    else:
+                        result = search_function(list_values, target)
                     
                     # Check if the list was reorganized (self-organizing list)
                     if list_copy != list_values:
@@ -457,31 +613,110 @@ def sequential_search_form(key, search_function):
                         st.session_state[f"{key}_list_values"] = list_values
                         
                         # Update search history for self-organizing list
-                        if is_self_organizing:
-                            if f"{key}_search_history" not in st.session_state:
-                                st.session_state[f"{key}_search_history"] = []
-                            st.session_state[f"{key}_search_history"].append((target, result, list_copy, list_values))
+                        if f"{key}_search_history" not in st.session_state:
+                            st.session_state[f"{key}_search_history"] = []
+                        st.session_state[f"{key}_search_history"].append((target, result, list_copy, list_values))
                         
                         # Show the updated list
                         st.write("Updated list:")
                         st.write(list_values)
                         
                         # After reorganizing, show where the target element is now
-                        if result is not None:
+                        if result is not None and result != -1:
                             st.success(f"Value '{target}' found. After reorganizing, it's now at index {result}.")
                             # Display the before and after position
                             orig_pos = list_copy.index(target) if target in list_copy else -1
                             if orig_pos != -1 and orig_pos != result:
-                                st.info(f"Element was moved from index {orig_pos} to index {result} based on access frequency.")
+                                st.info(f"Element was moved from index {orig_pos} to index {result} by the self-organizing list.")
                         else:
                             st.warning(f"Value '{target}' not found in the list.")
                     else:
                         # Regular search result for non-self-organizing search
-                        if result is not None:
+                        if rank_query:
+                            if result != -1:
+                                st.success(f"The value of rank {target} is {list_values[result]}, found at index {result}.")
+                            else:
+                                st.warning(f"k must be between 1 and {len(list_values)}.")
+                        elif result is not None and result != -1:
                             st.success(f"Value '{target}' found at index {result}.")
+                            if occurrences and len(occurrences) > 1:
+                                st.info(f"All occurrences: {occurrences}")
                         else:
                             st.warning(f"Value '{target}' not found in the list.")
+
+                    if search_engine:
+                        # Every engine summarizes its own statistics
+                        st.caption(engine.describe())
         else:
             st.info("Generate a list first before searching.")
 
 
+
+
+def mapped_search_form(key, search_engine, write_sample=None):
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        if write_sample:
+            with st.expander("Create a sample column"):
+                st.number_input("Number of values", min_value=1, value=1_000_000, step=1,
+                                format="%d", key=f"{key}_sample_count")
+
+                def _write_sample():
+                    sample_path = os.path.join(tempfile.gettempdir(), f"{key}_sample.bin")
+                    write_sample(sample_path, int(st.session_state[f"{key}_sample_count"]), 1, 100,
+                                 st.session_state[f"{key}_dtype"])
+                    # Set before the path input is drawn on the rerun
+                    st.session_state[f"{key}_path"] = sample_path
+
+                st.button("Write sample file", key=f"{key}_sample_btn", on_click=_write_sample)
+
+        file_path = st.text_input("Path of a raw binary or .npy integer column", key=f"{key}_path")
+        dtype = st.selectbox("Element type of a raw file",
+                             ["int8", "int16", "int32", "int64", "uint8", "uint16", "uint32", "uint64"],
+                             index=3, key=f"{key}_dtype")
+        scan = st.radio("Scan", ["vectorized", "sentinel", "linear"], key=f"{key}_scan")
+        budget_mb = st.number_input("Memory budget (MB)", min_value=1, value=16, step=1, format="%d",
+                                    key=f"{key}_budget")
+
+    with col2:
+        search_target = st.text_input("Enter a number to search for", key=f"{key}_search_target")
+        query = st.radio("Query", ["First hit", "All hits", "Count"], horizontal=True, key=f"{key}_query")
+
+        if st.button("Search file", key=f"{key}_search_btn"):
+            if not file_path:
+                st.error("Please enter the path of a column file or write a sample file.")
+                return
+            try:
+                target = int(search_target.strip())
+            except ValueError:
+                st.error("Please enter a valid integer to search for.")
+                return
+            try:
+                engine = search_engine(file_path, dtype, int(budget_mb) * 1024 * 1024, scan)
+            except (OSError, ValueError) as error:
+                st.error(f"Could not open the column: {error}")
+                return
+
+            with engine:
+                if query == "All hits":
+                    # One hit more than is shown tells whether there are more, without scanning the whole file
+                    occurrences = engine.search_all(target, 101)
+                    if len(occurrences) > 100:
+                        st.success(f"Value {target} found more than 100 times.")
+                        st.write("First 100 occurrences:", occurrences[:100])
+                        st.caption("Choose Count for the total number of occurrences.")
+                    elif occurrences:
+                        st.success(f"Value {target} found {len(occurrences)} times.")
+                        st.write("Occurrences:", occurrences)
+                    else:
+                        st.warning(f"Value {target} not found in the column.")
+                elif query == "Count":
+                    st.success(f"Value {target} occurs {engine.count(target)} times.")
+                else:
+                    result = engine.search(target)
+                    if result != -1:
+                        st.success(f"Value {target} found at index {result}.")
+                    else:
+                        st.warning(f"Value {target} not found in the column.")
+
+                st.caption(engine.describe())